@@ -1,4 +1,7 @@
 import sys
+import time
+
+_started = time.perf_counter()  # для отчета о времени запуска (--timing)
 
 import numpy as np
 import json
@@ -13,37 +16,211 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
     QComboBox,
     QMessageBox,
     QSpinBox,
     QTabWidget,
     QFileDialog,
     QScrollArea,
-    QDialog 
+    QDialog,
+    QLineEdit,
+    QDialogButtonBox,
+    QProgressBar,
 )
 from PyQt6.QtGui import QPixmap, QFont, QPalette, QColor
-from PyQt6.QtCore import Qt
-from matplotlib.backends.backend_qt5agg import (
-    FigureCanvasQTAgg as FigureCanvas,
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QThread,
+    QTimer,
+    pyqtSignal,
 )
-from matplotlib.figure import Figure
-from shapely.geometry import LineString, Polygon
-import matplotlib.pyplot as plt
-from Table import BasicTable
-from random import randint
-
-# виджет для отображения графика
-class GraphicalMethodCanvas(FigureCanvas):
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
-        self.axes = self.fig.add_subplot(111)
-        super().__init__(self.fig)
-        self.setParent(parent)
+from float_table import FloatBasicTable
+from bareiss_table import BareissBasicTable
+from revised_table import RevisedBasicTable
+from graphical import feasible_region_steps
+from problem import CONSTRAINT_TYPES, parse_basis, parse_text, task_basis
+from history import TableHistory
+from dual_simplex import ResolveSession
+from sensitivity import sensitivity
+from pricing import RULES, get_rule
+
+_imported = time.perf_counter()
+
+# ключ кэша допустимой области: ограничения и границы вместе с типом
+# чисел (Fraction(1) == 1.0, но область по ним считается по-разному)
+def _region_key(constraints, bounds):
+    values = [
+        (type(x), x)
+        for constr in constraints
+        for x in (*constr["coeff"], constr["value"])
+    ]
+    types = [constr["type"] for constr in constraints]
+    return tuple(values), tuple(types), tuple(bounds.items())
+
+
+# виджет для отображения графика. matplotlib загружается здесь, при первом
+# графическом решении или открытии вкладки "Результаты", а не при запуске
+def create_graph_canvas(parent=None, width=5, height=4, dpi=100):
+    from matplotlib import style
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+    from matplotlib.figure import Figure
+
+    style.use("dark_background")
+    fig = Figure(figsize=(width, height), dpi=dpi)
+    canvas = FigureCanvasQTAgg(fig)
+    canvas.setParent(parent)
+    canvas.fig, canvas.axes = fig, fig.add_subplot(111)
+    fig.set_facecolor("#2D2D2D")
+    canvas.axes.set_facecolor("#2D2D2D")
+    return canvas
+
+
+# отчет о времени запуска (ключ --timing) в stderr одной строкой JSON:
+# секунды от начала Main.py до конца импорта, создания окна и первого
+# показа (первая итерация цикла событий)
+def report_startup(window_time):
+    report = {
+        "imports": _imported - _started,
+        "window": window_time - _started,
+        "first_show": time.perf_counter() - _started,
+    }
+    print(json.dumps(report), file=sys.stderr)
+
+
+# симплекс-таблица для QTableView. строки чисел кэшируются по ячейкам:
+# после шага сравниваются значения с прошлыми, и переформатируются и
+# перерисовываются (dataChanged) только изменившиеся ячейки
+class SimplexTableModel(QAbstractTableModel):
+    _colors = {
+        "candidate": QColor(255, 215, 0),  # жёлтый - можно выбрать
+        "chosen": QColor(0, 200, 0),  # зелёный - выбран правилом
+    }
+
+    def __init__(self, format_value, parent=None):
+        super().__init__(parent)
+        self._format = format_value
+        self._values = None
+        self._texts = []
+        self._line, self._column = [], []
+        self._marks = {}  # (i, j) -> "candidate" / "chosen"
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self._values is None else len(self._values)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self._values is None:
+            return 0
+        return self._values.shape[1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        cell = (index.row(), index.column())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[cell[0]][cell[1]]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.BackgroundRole and cell in self._marks:
+            return self._colors[self._marks[cell]]
+        return None
+
+    # выбирать (активна/выделять) можно только опорные элементы
+    def flags(self, index):
+        if (index.row(), index.column()) in self._marks:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        return Qt.ItemFlag.NoItemFlags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            labels, last = self._line, "b"
+        else:
+            labels, last = self._column, "f"
+        return f"x{labels[section]}" if section < len(labels) else last
+
+    # новая таблица (после шага, отмены, пересчета) и опорные элементы
+    def set_table(self, table, chosen=None):
+        # float-таблица меняется шагом на месте, поэтому храним копию
+        values = np.array(table.table, copy=True)
+        line, column = list(table._line), list(table._column)
+        marks = {tuple(index): "candidate" for index in table.verios}
+        if chosen is not None:
+            marks[tuple(chosen)] = "chosen"
+
+        if self._values is None or values.shape != self._values.shape:
+            self.beginResetModel()
+            self._values, self._marks = values, marks
+            self._line, self._column = line, column
+            self._texts = [[self._format(x) for x in row] for row in values]
+            self.endResetModel()
+            return
+
+        changed = np.asarray(values != self._values, dtype=bool)
+        for (i, j), _ in set(marks.items()) ^ set(self._marks.items()):
+            changed[i, j] = True
+        self._values, self._marks = values, marks
+        # по строке один сигнал на отрезок от первой до последней измененной
+        for i in np.flatnonzero(changed.any(axis=1)):
+            cols = np.flatnonzero(changed[i])
+            for j in cols:
+                self._texts[i][j] = self._format(values[i, j])
+            self.dataChanged.emit(
+                self.index(int(i), int(cols[0])), self.index(int(i), int(cols[-1]))
+            )
+
+        # шаг меняет местами по одной метке строки и столбца
+        for orientation, old, new in (
+            (Qt.Orientation.Horizontal, self._line, line),
+            (Qt.Orientation.Vertical, self._column, column),
+        ):
+            for k in [k for k, (a, b) in enumerate(zip(old, new)) if a != b]:
+                old[k] = new[k]
+                self.headerDataChanged.emit(orientation, k, k)
+
+
+# фоновый поток для счета: job - генератор, который работает по частям и
+# между частями отдает ход (шаг, фаза, значение ц.ф.); после каждой части
+# проверяется запрос отмены. возвращенное генератором значение уходит в done
+class SolverWorker(QThread):
+    progress = pyqtSignal(int, str, str)
+    done = pyqtSignal(object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, job, parent=None):
+        super().__init__(parent)
+        self._job = job
+
+    def run(self):
+        try:
+            while True:
+                self.progress.emit(*next(self._job))
+                if self.isInterruptionRequested():
+                    self._job.close()
+                    self.cancelled.emit()
+                    return
+        except StopIteration as stop:
+            self.done.emit(stop.value)
+        except Exception as e:
+            self.failed.emit(str(e))
+
 
 # для отображения процесса решения симплекса
 class SimplexWindow(QDialog):
     def __init__(
-        self, parent, basic_func, constraints, minimize, use_fractions
+        self,
+        parent,
+        basic_func,
+        constraints,
+        minimize,
+        use_fractions,
+        revised=False,
+        pricing="dantzig",
+        basis=None,
     ):
         super().__init__(parent)
         self.setWindowTitle("Симплекс-метод")
@@ -54,36 +231,87 @@ class SimplexWindow(QDialog):
         self.constraints = constraints
         self.minimize = minimize
         self.use_fractions = use_fractions
+        self.revised = revised
+        self.pricing = get_rule(pricing)  # для кнопки "Следующий шаг"
+        self.basis = basis  # начальный базис (номера или "crash"), None - искусственный
 
         self.phase = "basic"
         self.auto_step_index = None
+        self.history = TableHistory()
+        self.table_model = None
+        self.worker = None  # фоновый счет (SolverWorker), пока идет
 
         self.layout = QVBoxLayout(self)
 
         self.info_label = QLabel("Базисная таблица")
         self.layout.addWidget(self.info_label)
 
-        self.table_widget = QTableWidget()
-        self.layout.addWidget(self.table_widget)
+        self.view_model = SimplexTableModel(self._format, self)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.view_model)
+        # ячейки выбираются кликом, сигнал подключается один раз
+        self.table_view.clicked.connect(
+            lambda index: self.manual_step(index.row(), index.column())
+        )
+        self.layout.addWidget(self.table_view)
+
+        # анализ чувствительности, показывается после оптимума
+        self.sensitivity_panel = QWidget()
+        panel_layout = QHBoxLayout(self.sensitivity_panel)
+        panel_layout.setContentsMargins(0, 0, 0, 0)
+        self.vars_sensitivity = QTableWidget()
+        self.constraints_sensitivity = QTableWidget()
+        for widget in (self.vars_sensitivity, self.constraints_sensitivity):
+            widget.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+            panel_layout.addWidget(widget)
+        self.sensitivity_panel.hide()
+        self.layout.addWidget(self.sensitivity_panel)
 
         btn_layout = QHBoxLayout()
         self.next_btn = QPushButton("Следующий шаг")
         self.next_btn.clicked.connect(self.auto_step)
         btn_layout.addWidget(self.next_btn)
 
+        # шаги по правилу подряд, таблица рисуется только в конце
+        self.to_end_btn = QPushButton("Решить до конца")
+        self.to_end_btn.clicked.connect(self.solve_to_end)
+        btn_layout.addWidget(self.to_end_btn)
+
         close_btn = QPushButton("Закрыть")
         close_btn.clicked.connect(self.close)
         btn_layout.addWidget(close_btn)
 
         self.layout.addLayout(btn_layout)
 
-        self._init_basic_table()
+        # ход фонового счета: шаг, фаза, значение ц.ф. и отмена
+        self.progress_panel = QWidget()
+        progress_layout = QHBoxLayout(self.progress_panel)
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+        self.progress_label = QLabel()
+        progress_layout.addWidget(self.progress_label)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # конец заранее неизвестен
+        progress_layout.addWidget(self.progress_bar)
+        self.cancel_btn = QPushButton("Отмена")
+        self.cancel_btn.clicked.connect(self.cancel_job)
+        progress_layout.addWidget(self.cancel_btn)
+        self.progress_panel.hide()
+        self.layout.addWidget(self.progress_panel)
 
         self.back_btn = QPushButton("Назад")
         self.back_btn.clicked.connect(self.undo_step)
         self.back_btn.setEnabled(False)
         btn_layout.insertWidget(0, self.back_btn)
-        self._update_view()
+
+        # после оптимума: другая правая часть или новое ограничение
+        self.resolve_btn = QPushButton("Изменить и пересчитать")
+        self.resolve_btn.clicked.connect(self.resolve_dialog)
+        self.resolve_btn.setEnabled(False)
+        btn_layout.insertWidget(2, self.resolve_btn)
+        # начальная таблица считается в фоне, окно сразу отзывчиво
+        self._run_job(
+            self._setup_job(), self._finish_step, self.reject, self._setup_failed
+        )
 
     # создаем базовую таблицу из ограничений
     def _init_basic_table(self):
@@ -91,81 +319,50 @@ class SimplexWindow(QDialog):
         # преобразуем список ограничений в матричный формат
         for c in self.constraints:
             matrix.append(c["coeff"] + [c["value"]])
-
-        self.table_model = BasicTable(
+        self._matrix = matrix
+        self._types = [c.get("type", "=") for c in self.constraints]
+        self.session = None
+
+        # десятичные дроби считаем в float64, обыкновенные - точно в целых,
+        # модифицированный метод всегда в float64
+        if self.revised:
+            engine = RevisedBasicTable
+        elif self.use_fractions:
+            engine = BareissBasicTable
+        else:
+            engine = FloatBasicTable
+        self.table_model = engine(
             minmax="min" if self.minimize else "max",
             matrix=matrix,
             basic_func=self.basic_func,
+            types=self._types,
+            basis=self.basis,
         )
+        self.table_model.pricing = self.pricing
     
-    # прорисовка таблицы
+    # прорисовка таблицы: модель перерисовывает только изменившиеся ячейки
     def _update_view(self):
-        table = self.table_model.table
-        rows, cols = table.shape
-        self.back_btn.setEnabled(not self.table_model.is_empty_history())
-
-        self.table_widget.clear()
-        self.table_widget.setRowCount(rows)
-        self.table_widget.setColumnCount(cols)
-
-        self.table_widget.setEditTriggers(
-            QTableWidget.EditTrigger.NoEditTriggers
-        )
-
-        # заголовки столбцов
-        for j in range(cols - 1):
-            self.table_widget.setHorizontalHeaderItem(
-                j, QTableWidgetItem(f"x{self.table_model._line[j]}")
-            )
-        self.table_widget.setHorizontalHeaderItem(
-            cols - 1, QTableWidgetItem("b")
-        )
-
-        # заголовки строк
-        for i in range(rows - 1):
-            self.table_widget.setVerticalHeaderItem(
-                i, QTableWidgetItem(f"x{self.table_model._column[i]}")
-            )
-        self.table_widget.setVerticalHeaderItem(
-            rows - 1, QTableWidgetItem("f")
-        )
-
-        for i in range(rows):
-            for j in range(cols):
-                item = QTableWidgetItem(
-                    str(table[i, j])
-                    if self.use_fractions
-                    else str(round(float(table[i, j]), 2))
-                )
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                item.setFlags(Qt.ItemFlag.NoItemFlags)
-                self.table_widget.setItem(i, j, item)
-
-        self._highlight_cells()
-
-    # отрисовка цветами опорных элементов
-    def _highlight_cells(self):
+        self.back_btn.setEnabled(not self.history.is_empty())
         self.table_model.serch()
-
-        for i, j in self.table_model.verios:
-            item = self.table_widget.item(i, j)
-            item.setBackground(QColor(255, 215, 0))  # жёлтый
-            item.setFlags(
-                Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable # активна/выделять
-            )
-
+        # выбранный правилом - зелёный, остальные можно выбрать вручную
+        index = None
         if self.table_model.verios:
-            index = self.table_model.verios[
-                randint(0, len(self.table_model.verios) - 1)
-            ]
-            item = self.table_widget.item(index[0], index[1])
-            item.setBackground(QColor(0, 200, 0))  # зелёный
+            index = self.table_model.choose_pivot()
             self.auto_step_index = index
+        self.view_model.set_table(self.table_model, index)
 
-        self.table_widget.cellClicked.connect(self.manual_step)
+    # число в выбранном формате
+    def _format(self, value):
+        if self.use_fractions:
+            if isinstance(value, float):
+                return str(Fraction(value).limit_denominator())
+            return str(value)
+        return str(round(float(value), 2))
 
     # обработчик клика по ячейке таблицы
     def manual_step(self, row, col):
+        if self.worker is not None:
+            return
         if self.table_model.verios:
             if [row, col] not in self.table_model.verios:
                 return
@@ -174,49 +371,185 @@ class SimplexWindow(QDialog):
 
     # обработчик кнопки "Следующий шаг" автоматически
     def auto_step(self):
-        if not self.table_model.verios:
+        if self.worker is not None or not self.table_model.verios:
             return
         self._do_step(self.auto_step_index[0], self.auto_step_index[1])
 
-    # основной метод выполнения симплекс-шага
+    # основной метод выполнения симплекс-шага (в фоне)
     def _do_step(self, i, j):
         if self.there_is_no_wrong:
-            self.table_model.record_history()
             self.auto_step_index = None
+            self._run_job(self._step_job(i, j), self._finish_step, self.undo_step)
+        else:
+            self._update_view()
 
-            self.table_model.step(i, j)
-
-            if self.phase == "basic" and not self.table_model.has_next_step():
-                if self.table_model.check_table():
-                    self.there_is_no_wrong = False
-                    QMessageBox.critical(
-                        self, "Ошибка", "Задача не имеет решения"
-                    )
-                    return
-                self.table_model = self.table_model.convert_to_simplex()
-                self.phase = "simplex"
-                self.info_label.setText("Симплекс-таблица")
-
-            if self.phase == "simplex":
-                if not self.table_model.has_next_step():
-                    self._show_answer()
-                    return
-                if self.table_model.check_table():
-                    self.there_is_no_wrong = False
-                    QMessageBox.critical(
-                        self, "Ошибка", "Задача не имеет решения"
-                    )
-                    return
-
-        self._update_view()
+    # обработчик кнопки "Решить до конца": шаги идут в фоне без перерисовки
+    # таблицы, все они остаются в истории (можно вернуться кнопкой "Назад").
+    # отмена останавливает счет, сделанные шаги сохраняются
+    def solve_to_end(self):
+        if self.worker is not None or not self.table_model.verios:
+            return
+        if not self.there_is_no_wrong:
+            return
+        self.auto_step_index = None
+        self._run_job(self._to_end_job(), self._finish_step, self._stop_to_end)
+
+    def _stop_to_end(self):
+        self._finish_step((self._advance(), None))
+
+    # счет в фоновом потоке: кнопки на это время выключены, ход виден в
+    # панели с отменой. on_done получает результат job, on_cancel
+    # вызывается после отмены, on_failed - с текстом ошибки
+    def _run_job(self, job, on_done, on_cancel, on_failed=None):
+        self.worker = SolverWorker(job, self)
+        self._on_done, self._on_cancel = on_done, on_cancel
+        self._on_failed = on_failed or self._show_error
+        self.worker.progress.connect(self._show_progress)
+        self.worker.done.connect(self._job_done)
+        self.worker.cancelled.connect(self._job_cancelled)
+        self.worker.failed.connect(self._job_failed)
+        self._set_busy(True)
+        self.worker.start()
+
+    def _set_busy(self, busy):
+        self.progress_label.setText("Вычисление...")
+        self.progress_panel.setVisible(busy)
+        self.cancel_btn.setEnabled(busy)
+        self.next_btn.setEnabled(not busy)
+        self.to_end_btn.setEnabled(not busy)
+        self.back_btn.setEnabled(not busy and not self.history.is_empty())
+        if busy:
+            self.resolve_btn.setEnabled(False)
+
+    def _show_progress(self, iteration, phase, objective):
+        self.progress_label.setText(f"Шаг {iteration}, {phase}, F = {objective}")
+
+    def cancel_job(self):
+        if self.worker is not None:
+            self.cancel_btn.setEnabled(False)
+            self.worker.requestInterruption()
+
+    def _release_worker(self):
+        self.worker.wait()
+        self.worker = None
+        self._set_busy(False)
+
+    def _job_done(self, result):
+        self._release_worker()
+        self._on_done(result)
+
+    def _job_cancelled(self):
+        self._release_worker()
+        self._on_cancel()
+
+    def _job_failed(self, message):
+        self._release_worker()
+        self._on_failed(message)
+
+    def _show_error(self, message):
+        self.there_is_no_wrong = False
+        QMessageBox.critical(self, "Ошибка", message)
+
+    def _setup_failed(self, message):
+        QMessageBox.critical(
+            self, "Ошибка", f"Ошибка при запуске симплекс-метода:\n{message}"
+        )
+        self.reject()
+
+    # при закрытии окна фоновый счет прерывается, его результат не нужен
+    def done(self, result):
+        if self.worker is not None:
+            self.worker.blockSignals(True)
+            self.worker.requestInterruption()
+            self.worker.wait()
+            self.worker = None
+        super().done(result)
+
+    # ход счета для панели: шаг, фаза и текущее значение ц.ф.
+    def _progress(self):
+        phase = "базисная таблица" if self.phase == "basic" else "симплекс-таблица"
+        objective = self.table_model.get_answer()[1]
+        return len(self.history), phase, self._format(objective)
+
+    # части фонового счета: начальная таблица или шаг, затем проверка конца
+    def _setup_job(self):
+        self._init_basic_table()
+        return (yield from self._advance_job())
+
+    def _step_job(self, i, j):
+        change = self.table_model.step(i, j)
+        self.history.record_step(i, j, change)
+        return (yield from self._advance_job())
+
+    # шаги по правилу выбора до оптимума или ошибки
+    def _to_end_job(self):
+        outcome, result = "step", None
+        while outcome == "step":
+            self.table_model.serch()
+            if not self.table_model.verios:
+                break
+            i, j = self.table_model.choose_pivot()
+            outcome, result = yield from self._step_job(i, j)
+        return outcome, result
+
+    # при оптимуме сразу и анализ чувствительности (если ограничения - те,
+    # что в исходной задаче). возвращает исход _advance и анализ
+    def _advance_job(self):
+        yield self._progress()
+        outcome = self._advance()
+        result = None
+        if outcome == "answer" and (
+            self.session is None or self.session.table is not self.table_model
+        ):
+            yield self._progress()
+            result = self._sensitivity()
+        return outcome, result
+
+    # итог шага в окне: следующая таблица, ответ или ошибка
+    def _finish_step(self, result):
+        outcome, sensitivity_result = result
+        self.info_label.setText(
+            "Базисная таблица" if self.phase == "basic" else "Симплекс-таблица"
+        )
+        if outcome == "error":
+            self.there_is_no_wrong = False
+            QMessageBox.critical(self, "Ошибка", "Задача не имеет решения")
+        elif outcome == "answer":
+            self._show_answer(sensitivity_result)
+        else:
+            self._update_view()
+
+    # переход к симплекс-таблице, когда шагов вспомогательной задачи нет
+    # (в том числе сразу: заданный базис или дополнительные переменные
+    # уже допустимы), и проверка конца. без окон - идет в фоновом потоке.
+    # "step" - есть следующий шаг, "answer" - оптимум, "error" - решения нет
+    def _advance(self):
+        if self.phase == "basic" and not self.table_model.has_next_step():
+            if self.table_model.check_table():
+                return "error"
+            if not self.history.is_empty():
+                self.history.record_phase(self.table_model.copy())
+            self.table_model = self.table_model.convert_to_simplex()
+            self.table_model.pricing = self.pricing
+            self.phase = "simplex"
+
+        if self.phase == "simplex":
+            if not self.table_model.has_next_step():
+                return "answer"
+            if self.table_model.check_table():
+                return "error"
+        return "step"
 
     # метод для отмены последнего шага
     def undo_step(self):
         self.there_is_no_wrong = True
-        self.table_model = self.table_model.load_history()
+        self.resolve_btn.setEnabled(False)
+        self.sensitivity_panel.hide()
+        self.table_model = self.history.undo(self.table_model)
+        self.table_model.pricing = self.pricing
         self.phase = self.table_model.get_class_type()
 
-        if self.table_model.is_empty_history():
+        if self.history.is_empty():
             self.back_btn.setEnabled(False)
 
         self.info_label.setText(
@@ -225,26 +558,163 @@ class SimplexWindow(QDialog):
 
         self._update_view()
 
-    # метод для отображения оптимального решения
-    def _show_answer(self):
-        answer_vars = [0] * len(self.basic_func)
-        for i in range(len(self.table_model._column)): # по базисным
-            answer_vars[self.table_model._column[i] - 1] = (
-                self.table_model.table[i, -1]
-            )
+    # метод для отображения оптимального решения (sensitivity_result -
+    # анализ чувствительности, None - панель не показывается)
+    def _show_answer(self, sensitivity_result=None):
+        answer_vars, objective = self.table_model.get_answer()
         text = "Оптимальное решение:\nx* = ("
         for var in answer_vars[:-1]:
-            text += f"{var}, "
-        text += f"{answer_vars[-1]})\n"
-        if self.minimize:
-            text += (
-                f"\nЗначение целевой функции: F={-self.table_model.table[-1, -1]}"
-            )
-        else:
-            text += f"\nЗначение целевой функции: F={self.table_model.table[-1, -1]}"
+            text += f"{self._format(var)}, "
+        text += f"{self._format(answer_vars[-1])})\n"
+        text += f"\nЗначение целевой функции: F={self._format(objective)}"
         QMessageBox.information(self, "Решение", text)
+        self.resolve_btn.setEnabled(True)
+        if sensitivity_result is not None:
+            self._show_sensitivity(sensitivity_result)
         self._update_view()
 
+    # интервал (нижняя, верхняя), None - без границы
+    def _format_range(self, low, high):
+        low = "-∞" if low is None else self._format(low)
+        high = "+∞" if high is None else self._format(high)
+        return f"[{low}; {high}]"
+
+    def _fill_sensitivity(self, widget, headers, labels, rows):
+        widget.clear()
+        widget.setRowCount(len(rows))
+        widget.setColumnCount(len(headers))
+        widget.setHorizontalHeaderLabels(headers)
+        widget.setVerticalHeaderLabels(labels)
+        for i, row in enumerate(rows):
+            for j, text in enumerate(row):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                widget.setItem(i, j, item)
+        widget.resizeColumnsToContents()
+
+    # анализ чувствительности текущей (оптимальной) таблицы, None - нет
+    def _sensitivity(self):
+        try:
+            return sensitivity(self.table_model, self._matrix, self._types)
+        except ValueError:
+            return None
+
+    def _show_sensitivity(self, result):
+        self._fill_sensitivity(
+            self.vars_sensitivity,
+            ["x*", "Оценка", "Интервал c"],
+            [f"x{j + 1}" for j in range(len(result.answer))],
+            [
+                [
+                    self._format(x),
+                    self._format(d),
+                    self._format_range(*interval),
+                ]
+                for x, d, interval in zip(
+                    result.answer, result.reduced_costs, result.cost_ranges
+                )
+            ],
+        )
+        self._fill_sensitivity(
+            self.constraints_sensitivity,
+            ["Двойственная оценка", "Интервал b"],
+            [f"{i + 1}" for i in range(len(result.shadow_prices))],
+            [
+                [self._format(y), self._format_range(*interval)]
+                for y, interval in zip(result.shadow_prices, result.rhs_ranges)
+            ],
+        )
+        self.sensitivity_panel.show()
+
+    # изменение задачи после оптимума и пересчет двойственным симплекс-методом
+    # от текущей таблицы
+    def resolve_dialog(self):
+        try:
+            if self.session is None or self.session.table is not self.table_model:
+                self.session = ResolveSession(
+                    self.table_model, self._matrix, self._types
+                )
+        except ValueError as e:
+            QMessageBox.critical(self, "Ошибка", str(e))
+            return
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Изменить и пересчитать")
+        layout = QVBoxLayout(dialog)
+
+        mode_combo = QComboBox()
+        mode_combo.addItems(["Изменить правую часть", "Добавить ограничение"])
+        layout.addWidget(mode_combo)
+
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(QLabel("Номер ограничения:"))
+        row_spin = QSpinBox()
+        row_spin.setRange(1, len(self.session.rows))
+        row_layout.addWidget(row_spin)
+        layout.addLayout(row_layout)
+
+        coeffs_layout = QHBoxLayout()
+        coeffs_layout.addWidget(QLabel("Коэффициенты:"))
+        coeffs_edit = QLineEdit()
+        coeffs_edit.setPlaceholderText(" ".join(["0"] * self.session.size))
+        coeffs_layout.addWidget(coeffs_edit)
+        type_combo = QComboBox()
+        type_combo.addItems(["≤", "≥", "="])
+        coeffs_layout.addWidget(type_combo)
+        layout.addLayout(coeffs_layout)
+
+        rhs_layout = QHBoxLayout()
+        rhs_layout.addWidget(QLabel("Правая часть:"))
+        rhs_edit = QLineEdit("0")
+        rhs_layout.addWidget(rhs_edit)
+        layout.addLayout(rhs_layout)
+
+        def update_mode():
+            add = mode_combo.currentIndex() == 1
+            row_spin.setEnabled(not add)
+            coeffs_edit.setEnabled(add)
+            type_combo.setEnabled(add)
+
+        mode_combo.currentIndexChanged.connect(update_mode)
+        update_mode()
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok
+            | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        try:
+            rhs = Fraction(rhs_edit.text())
+            if mode_combo.currentIndex() == 0:
+                status = self.session.set_rhs(row_spin.value() - 1, rhs)
+            else:
+                coeffs = [Fraction(x) for x in coeffs_edit.text().split()]
+                status = self.session.add_constraint(
+                    coeffs, type_combo.currentText(), rhs
+                )
+        except (ValueError, ZeroDivisionError) as e:
+            QMessageBox.critical(self, "Ошибка", str(e))
+            return
+
+        self.table_model = self.session.table
+        self.history.clear()
+        self.sensitivity_panel.hide()
+        self.info_label.setText(
+            f"Симплекс-таблица (пересчет, шагов: {self.session.pivots})"
+        )
+        if status == "optimal":
+            self.there_is_no_wrong = True
+            self._show_answer()
+        else:
+            self.there_is_no_wrong = False
+            self._update_view()
+            QMessageBox.critical(self, "Ошибка", "Задача не имеет решения")
+
 
 class LinearProgrammingApp(QMainWindow):
     def set_dark_theme(self):
@@ -284,11 +754,11 @@ class LinearProgrammingApp(QMainWindow):
         # Применяем палитру
         self.setPalette(dark_palette)
 
-        # Стиль для QTableWidget
+        # Стиль для QTableWidget и QTableView
         self.setStyleSheet(
             """
-             /* Стиль для таблиц QTableWidget (симплекс-таблицы) */
-            QTableWidget {
+             /* Стиль для таблиц QTableWidget и QTableView (симплекс-таблицы) */
+            QTableWidget, QTableView {
                 background-color: rgb(45, 45, 45);
                 color: white;
                 gridline-color: rgb(80, 80, 80);
@@ -318,10 +788,6 @@ class LinearProgrammingApp(QMainWindow):
         """
         )
 
-        # Стиль для matplotlib (графика)
-        plt.style.use("dark_background")
-        self.canvas.fig.set_facecolor("#2D2D2D")
-        self.canvas.axes.set_facecolor("#2D2D2D")
         self.setStyleSheet(
             """
         QTabWidget {
@@ -405,7 +871,7 @@ class LinearProgrammingApp(QMainWindow):
                 }
 
                 /* Стили таблиц */
-                QTableWidget {
+                QTableWidget, QTableView {
                     background-color: rgb(45, 45, 45);
                     color: white;
                     gridline-color: rgb(80, 80, 80);
@@ -413,11 +879,6 @@ class LinearProgrammingApp(QMainWindow):
             """
         )
 
-        # Стиль для matplotlib
-        plt.style.use("dark_background")
-        self.canvas.fig.set_facecolor("#2D2D2D")
-        self.canvas.axes.set_facecolor("#2D2D2D")
-
     # конструктор класса
     def __init__(self):
         super().__init__()
@@ -455,11 +916,39 @@ class LinearProgrammingApp(QMainWindow):
         self.format_combo = QComboBox()
         self.format_combo.addItems(["Десятичные", "Обыкновенные дроби"])
 
+        self.method_label = QLabel("Метод:")
+        self.method_combo = QComboBox()
+        self.method_combo.addItems(["Табличный", "Модифицированный"])
+
+        self.pricing_label = QLabel("Выбор элемента:")
+        self.pricing_combo = QComboBox()
+        for rule in RULES.values():
+            self.pricing_combo.addItem(rule.title, rule.name)
+
+        # начальный базис: пусто - искусственный, номера переменных или crash
+        self.basis_label = QLabel("Базис:")
+        self.basis_edit = QLineEdit()
+        self.basis_edit.setPlaceholderText("искусственный")
+        self.basis_edit.setToolTip(
+            "Номера начальных базисных переменных через запятую "
+            "(дополнительные - после исходных) или crash - подобрать автоматически"
+        )
+        self.basis_edit.setFixedWidth(140)
+
         self.problem_type_layout.addWidget(self.problem_type_label)
         self.problem_type_layout.addWidget(self.problem_type_combo)
         self.problem_type_layout.addSpacing(20)
         self.problem_type_layout.addWidget(self.format_label)
         self.problem_type_layout.addWidget(self.format_combo)
+        self.problem_type_layout.addSpacing(20)
+        self.problem_type_layout.addWidget(self.method_label)
+        self.problem_type_layout.addWidget(self.method_combo)
+        self.problem_type_layout.addSpacing(20)
+        self.problem_type_layout.addWidget(self.pricing_label)
+        self.problem_type_layout.addWidget(self.pricing_combo)
+        self.problem_type_layout.addSpacing(20)
+        self.problem_type_layout.addWidget(self.basis_label)
+        self.problem_type_layout.addWidget(self.basis_edit)
         self.problem_type_layout.addStretch()  # выравнивание по левому краю
 
         self.input_layout.addLayout(self.problem_type_layout)
@@ -530,6 +1019,18 @@ class LinearProgrammingApp(QMainWindow):
         self.solve_buttons_layout.addWidget(self.simplex_btn)
         self.input_layout.addLayout(self.solve_buttons_layout)
 
+        # ход построения допустимой области (полуплоскостей добавлено) и отмена
+        self.region_panel = QWidget()
+        region_layout = QHBoxLayout(self.region_panel)
+        region_layout.setContentsMargins(0, 0, 0, 0)
+        self.region_bar = QProgressBar()
+        region_layout.addWidget(self.region_bar)
+        self.region_cancel_btn = QPushButton("Отмена")
+        self.region_cancel_btn.clicked.connect(self.cancel_region)
+        region_layout.addWidget(self.region_cancel_btn)
+        self.region_panel.hide()
+        self.input_layout.addWidget(self.region_panel)
+
         self.load_btn = QPushButton("Загрузить из файла")
         self.load_btn.clicked.connect(self.load_from_file)
         self.main_layout.addWidget(self.load_btn)
@@ -539,9 +1040,13 @@ class LinearProgrammingApp(QMainWindow):
         self.result_layout = QVBoxLayout()
         self.result_tab.setLayout(self.result_layout)
 
-        # график
-        self.canvas = GraphicalMethodCanvas(self, width=8, height=6)
-        self.result_layout.addWidget(self.canvas)
+        # график создается при первом обращении (_ensure_canvas)
+        self.canvas = None
+        # нарисованная допустимая область и ключ ограничений, по которым
+        # она построена; оптимум и линия уровня рисуются поверх нее
+        self._region_key, self._region = None, None
+        self._objective_artists = []
+        self._region_worker = None  # построение новой области в фоне
 
         # текстовые результаты
         self.result_output = QLabel("")
@@ -566,7 +1071,28 @@ class LinearProgrammingApp(QMainWindow):
         # создаем вкладку со справкой
         self.reference_tab = QWidget()
         self.tabs.addTab(self.reference_tab, "Справка")
-
+        self._reference_built = False
+
+        # "Результаты" и "Справка" наполняются при первом открытии
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _on_tab_changed(self, index):
+        widget = self.tabs.widget(index)
+        if widget is self.result_tab:
+            self._ensure_canvas()
+        elif widget is self.reference_tab and not self._reference_built:
+            self._reference_built = True
+            self.init_reference_tab()
+
+    # график (и matplotlib) - при первом обращении
+    def _ensure_canvas(self):
+        if self.canvas is None:
+            self.canvas = create_graph_canvas(self, width=8, height=6)
+            self.result_layout.insertWidget(0, self.canvas)
+        return self.canvas
+
+    # вкладка со справкой: текст и картинки из photo/
+    def init_reference_tab(self):
         main_layout = QVBoxLayout(self.reference_tab)
         main_layout.setContentsMargins(0, 0, 0, 0)
 
@@ -850,13 +1376,16 @@ class LinearProgrammingApp(QMainWindow):
                     item = self.constraints_table.item(row, col)
                     constraint_coeffs.append(Fraction(item.text()))
                 
+                # тип ограничения: ≤ и ≥ решаются с дополнительными переменными
+                combo = self.constraints_table.cellWidget(row, num_vars)
+
                 # получаем правую часть ограничения
                 rhs_item = self.constraints_table.item(row, num_vars + 1)
                 rhs = Fraction(rhs_item.text())
 
                 constraints.append(
                     {
-                        "type": "=",
+                        "type": combo.currentText(),
                         "coeff": constraint_coeffs,
                         "value": rhs,  
                     }
@@ -866,6 +1395,7 @@ class LinearProgrammingApp(QMainWindow):
             use_fractions = (
                 self.format_combo.currentText() == "Обыкновенные дроби"
             )
+            revised = self.method_combo.currentText() == "Модифицированный"
 
             simplex_win = SimplexWindow(
                 parent=self,
@@ -873,6 +1403,9 @@ class LinearProgrammingApp(QMainWindow):
                 constraints=constraints,
                 minimize=minimize,
                 use_fractions=use_fractions,
+                revised=revised,
+                pricing=self.pricing_combo.currentData(),
+                basis=parse_basis(self.basis_edit.text()),
             )
             simplex_win.exec() # блокируем родительское окно 
 
@@ -1003,33 +1536,17 @@ class LinearProgrammingApp(QMainWindow):
             # тип задачи
             minimize = self.problem_type_combo.currentText() == "Минимизация"
 
-            # вызываем графический метод
-            solution, z = self.graphical_method(
-                c, constraints, bounds, minimize
+            # вызываем графический метод, результат - по готовности
+            self.graphical_method(
+                c,
+                constraints,
+                bounds,
+                minimize,
+                lambda *result: self._show_graphical_result(
+                    c, constraints, minimize, *result
+                ),
             )
 
-            # выводим результаты
-            if solution:
-                result_text = f"Оптимальное решение: x₁ = {solution[0]:.2f}, x₂ = {solution[1]:.2f}\n"
-                result_text += f"Значение целевой функции: {'min' if minimize else 'max'} = {z:.2f}\n\n"
-
-                result_text += "Целевая функция:\n"
-                result_text += (
-                    f"{c[0]}x₁ + {c[1]}x₂ → {'min' if minimize else 'max'}\n\n"
-                )
-
-                result_text += "Ограничения:\n"
-                for i, constr in enumerate(constraints):
-                    result_text += f"{constr['coeff'][0]}x₁ + {constr['coeff'][1]}x₂ {constr['type']} {constr['value']}\n"
-
-                self.result_output.setText(result_text)
-                self.tabs.setCurrentIndex(
-                    1
-                )  # переключаемся на вкладку с результатами
-            else:
-                self.result_output.setText("Допустимая область пуста!")
-                self.tabs.setCurrentIndex(1)
-
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -1038,150 +1555,212 @@ class LinearProgrammingApp(QMainWindow):
             )
 
 
-    # метод для графического решения задачи
-    def graphical_method(self, c, constraints, bounds, minimize=True):
-        global feasible_side # для хранения допустимой стороны
-        self.canvas.axes.xaxis.label.set_color("white")
-        self.canvas.axes.yaxis.label.set_color("white")
-        self.canvas.axes.title.set_color("white")
-        self.canvas.axes.tick_params(colors="white", which="both")
-        self.canvas.axes.spines["bottom"].set_color("white")
-        self.canvas.axes.spines["top"].set_color("white")
-        self.canvas.axes.spines["right"].set_color("white")
-        self.canvas.axes.spines["left"].set_color("white")
-        self.canvas.fig.set_facecolor("#2D2D2D")
-        self.canvas.axes.set_facecolor("#2D2D2D")
-        self.canvas.axes.clear() # очищаем предыдущий график
-
-        # обработка ограничений и построение линий
-        x1_vals = np.linspace(0, 10, 400) # диапазон значений x₁ от 0 до 10 (400 точек)
-        feasible_polygons = []
-
-        for constraint in constraints:
-            a, b = constraint["coeff"]
-            c_val = constraint["value"]
-
-            if b != 0:
-                x2_vals = (c_val - a * x1_vals) / b
-            else:
-                x2_vals = np.full_like(
-                    x1_vals, c_val / a
-                )  # вертикальная линия x = c/a
-
-            line = LineString(np.column_stack((x1_vals, x2_vals)))
-
-            # определение допустимой полуплоскости
-            if constraint["type"] == "<=":
-                if b > 0: # # для a·x₁ + b·x₂ ≤ c, если b > 0, то ниже линии
-                    feasible_side = np.column_stack((x1_vals, x2_vals - 1e5))
-                else: #  # если b < 0, то выше линии
-                    feasible_side = np.column_stack((x1_vals, x2_vals + 1e5))
-            elif constraint["type"] == ">=":
-                if b > 0:
-                    feasible_side = np.column_stack((x1_vals, x2_vals + 1e5))
-                else:
-                    feasible_side = np.column_stack((x1_vals, x2_vals - 1e5))
+    # вывод результата графического метода
+    def _show_graphical_result(self, c, constraints, minimize, status, solution, z):
+        # выводим результаты
+        if status == "optimal":
+            result_text = f"Оптимальное решение: x₁ = {float(solution[0]):.2f}, x₂ = {float(solution[1]):.2f}\n"
+            result_text += f"Значение целевой функции: {'min' if minimize else 'max'} = {float(z):.2f}\n\n"
 
-             # создаем полигон допустимой полуплоскости
-            feasible_poly = (
-                Polygon(line).union(Polygon(feasible_side)).convex_hull # объединяем, ищем выпукл.обл.
+            result_text += "Целевая функция:\n"
+            result_text += (
+                f"{c[0]}x₁ + {c[1]}x₂ → {'min' if minimize else 'max'}\n\n"
             )
-            feasible_polygons.append(feasible_poly)
 
-            # построение линии ограничения
-            self.canvas.axes.plot(
-                x1_vals,
-                x2_vals,
-                label=f"{a}x₁ + {b}x₂ {constraint['type']} {c_val}",
+            result_text += "Ограничения:\n"
+            for i, constr in enumerate(constraints):
+                result_text += f"{constr['coeff'][0]}x₁ + {constr['coeff'][1]}x₂ {constr['type']} {constr['value']}\n"
+
+            self.result_output.setText(result_text)
+            self.tabs.setCurrentIndex(
+                1
+            )  # переключаемся на вкладку с результатами
+        elif status == "unbounded":
+            self.result_output.setText(
+                "Целевая функция не ограничена на допустимой области!"
             )
+            self.tabs.setCurrentIndex(1)
+        else:
+            self.result_output.setText("Допустимая область пуста!")
+            self.tabs.setCurrentIndex(1)
+
+    # графический метод: допустимая область и оптимум считаются точно
+    # (graphical.py), рисование - отдельный шаг. область зависит только от
+    # ограничений и границ, поэтому при смене ц.ф. или min/max берется
+    # готовая и перерисовываются только оптимум и линия уровня; новая
+    # область строится в фоновом потоке. on_result получает статус
+    # ("optimal", "unbounded", "infeasible"), точку и значение ц.ф.
+    def graphical_method(self, c, constraints, bounds, minimize, on_result):
+        self._ensure_canvas()
+        key = _region_key(constraints, bounds)
+        if key == self._region_key:
+            self._optimize_region(c, minimize, on_result)
+            return
 
-        # нахождение допустимой области
-        feasible_region = feasible_polygons[0]
-        for poly in feasible_polygons[1:]:
-            feasible_region = feasible_region.intersection(poly) # поиск общего
-
-        if feasible_region.is_empty:
-            self.canvas.axes.set_title("Допустимая область пуста!")
-            self.canvas.draw()
-            return None, None
-
-        # визуализация допустимой области
-        if isinstance(feasible_region, Polygon):
-            x, y = feasible_region.exterior.xy # для определения положения точки в пространстве
-            self.canvas.axes.fill(
-                x, y, alpha=0.2, color="gray", label="Допустимая область"
+        # ход - после каждой полуплоскости, между ними проверяется отмена
+        def region_job():
+            steps = feasible_region_steps(constraints, list(bounds.values()))
+            while True:
+                try:
+                    done, total = next(steps)
+                except StopIteration as stop:
+                    return stop.value
+                yield done, "допустимая область", str(total)
+
+        def region_done(region):
+            self._release_region_worker()
+            self._region, self._region_key = region, key
+            self.plot_region(region, constraints)
+            self._optimize_region(c, minimize, on_result)
+
+        def region_cancelled():
+            self._release_region_worker()
+            self.result_output.setText("Построение допустимой области отменено")
+
+        def region_failed(message):
+            self._release_region_worker()
+            QMessageBox.critical(
+                self,
+                "Ошибка",
+                f"Произошла ошибка при решении задачи:\n{message}",
             )
-        else:
-            # если область состоит из нескольких полигонов
-            for geom in feasible_region.geoms:
-                x, y = geom.exterior.xy
-                self.canvas.axes.fill(x, y, alpha=0.2, color="gray")
-
-        # поиск угловых точек
-        if isinstance(feasible_region, Polygon):
-            vertices = list(feasible_region.exterior.coords)
-        else:
-            vertices = []
-            for geom in feasible_region.geoms:
-                vertices.extend(list(geom.exterior.coords))
 
-        # удаление дубликатов
-        vertices = list(set(vertices))
+        self.solve_btn.setEnabled(False)
+        self.result_output.setText("Построение допустимой области...")
+        self.region_bar.setRange(0, 0)
+        self.region_cancel_btn.setEnabled(True)
+        self.region_panel.show()
+        self._region_worker = SolverWorker(region_job(), self)
+        self._region_worker.progress.connect(self._show_region_progress)
+        self._region_worker.done.connect(region_done)
+        self._region_worker.cancelled.connect(region_cancelled)
+        self._region_worker.failed.connect(region_failed)
+        self._region_worker.start()
+
+    def _show_region_progress(self, done, phase, total):
+        self.region_bar.setRange(0, int(total))
+        self.region_bar.setValue(done)
+
+    def cancel_region(self):
+        if self._region_worker is not None:
+            self.region_cancel_btn.setEnabled(False)
+            self._region_worker.requestInterruption()
+
+    def _release_region_worker(self):
+        self._region_worker.wait()
+        self._region_worker = None
+        self.region_panel.hide()
+        self.solve_btn.setEnabled(True)
+
+    # при закрытии окна фоновое построение области прерывается
+    def closeEvent(self, event):
+        if self._region_worker is not None:
+            self._region_worker.blockSignals(True)
+            self._region_worker.requestInterruption()
+            self._region_worker.wait()
+            self._region_worker = None
+        super().closeEvent(event)
+
+    def _optimize_region(self, c, minimize, on_result):
+        status, point, z = self._region.optimize(c, minimize)
+        self.plot_objective(c, status, point, z, minimize)
+        on_result(status, point, z)
+
+    # рисование области и прямых ограничений
+    def plot_region(self, region, constraints):
+        axes = self.canvas.axes
+        axes.clear() # очищаем предыдущий график
+        self._objective_artists = []
+        axes.xaxis.label.set_color("white")
+        axes.yaxis.label.set_color("white")
+        axes.title.set_color("white")
+        axes.tick_params(colors="white", which="both")
+        for side in ("bottom", "top", "right", "left"):
+            axes.spines[side].set_color("white")
+        self.canvas.fig.set_facecolor("#2D2D2D")
+        axes.set_facecolor("#2D2D2D")
 
-        # вычисление значений целевой функции в угловых точках
-        z_values = [c[0] * x + c[1] * y for x, y in vertices]
+        # окно по вершинам области (не меньше [0, 10] x [0, 10])
+        points = [(float(x), float(y)) for x, y in region.vertices]
+        xs = [0.0] + [x for x, _ in points]
+        ys = [0.0] + [y for _, y in points]
+        x_low, x_high = min(xs) * 1.2, max(10.0, max(xs) * 1.2)
+        y_low, y_high = min(ys) * 1.2, max(10.0, max(ys) * 1.2)
+        x_vals = np.array([x_low, x_high])
 
-        if minimize:
-            opt_idx = np.argmin(z_values)
-            opt_type = "минимум"
-        else:
-            opt_idx = np.argmax(z_values)
-            opt_type = "максимум"
-
-        opt_x, opt_y = vertices[opt_idx]
-        opt_z = z_values[opt_idx]
-
-        # отметка оптимальной точки
-        self.canvas.axes.scatter(
-            opt_x,
-            opt_y,
-            color="red",
-            s=100,
-            label=f"Оптимум ({opt_type}): ({opt_x:.2f}, {opt_y:.2f})",
-        )
+        for constraint in constraints:
+            a, b = (float(x) for x in constraint["coeff"])
+            c_val = float(constraint["value"])
+            label = f"{constraint['coeff'][0]}x₁ + {constraint['coeff'][1]}x₂ {constraint['type']} {constraint['value']}"
+            if b != 0:
+                axes.plot(x_vals, (c_val - a * x_vals) / b, label=label)
+            elif a != 0:
+                axes.axvline(x=c_val / a, label=label) # вертикальная линия x = c/a
+
+        if region.status != "empty":
+            # бесконечные части области уводим за пределы окна
+            size = 2 * max(x_high - x_low, y_high - y_low)
+            polygon = [(float(x), float(y)) for x, y in region.polygon(size)]
+            x, y = zip(*polygon)
+            if len(polygon) > 2:
+                axes.fill(x, y, alpha=0.2, color="gray", label="Допустимая область")
+            else:  # отрезок, луч или точка
+                axes.plot(x, y, color="gray", linewidth=4, alpha=0.5, label="Допустимая область")
 
-        # построение линий уровня целевой функции
-        if c[1] != 0:
-            level_y = (opt_z - c[0] * x1_vals) / c[1]
-            self.canvas.axes.plot(
-                x1_vals,
-                level_y,
-                "--",
-                color="green",
-                label=f"Целевая: {c[0]}x₁ + {c[1]}x₂ = {opt_z:.2f}",
+        # настройка графика
+        axes.set_xlabel("x₁")
+        axes.set_ylabel("x₂")
+        axes.set_xlim(x_low, x_high)
+        axes.set_ylim(y_low, y_high)
+        axes.grid(True)
+
+    # рисование оптимума и линии уровня (прошлые убираются, область остается)
+    def plot_objective(self, c, status, point, z, minimize):
+        axes = self.canvas.axes
+        for artist in self._objective_artists:
+            artist.remove()
+        self._objective_artists = []
+        if status == "optimal":
+            opt_x, opt_y, opt_z = float(point[0]), float(point[1]), float(z)
+            opt_type = "минимум" if minimize else "максимум"
+            # отметка оптимальной точки
+            self._objective_artists.append(
+                axes.scatter(
+                    opt_x,
+                    opt_y,
+                    color="red",
+                    s=100,
+                    label=f"Оптимум ({opt_type}): ({opt_x:.2f}, {opt_y:.2f})",
+                )
             )
+            # линия уровня целевой функции через оптимум
+            x_vals = np.array(axes.get_xlim())
+            c1, c2 = float(c[0]), float(c[1])
+            if c2 != 0:
+                self._objective_artists += axes.plot(
+                    x_vals,
+                    (opt_z - c1 * x_vals) / c2,
+                    "--",
+                    color="green",
+                    label=f"Целевая: {c[0]}x₁ + {c[1]}x₂ = {opt_z:.2f}",
+                )
+            elif c1 != 0:
+                self._objective_artists.append(
+                    axes.axvline(
+                        x=opt_z / c1,
+                        linestyle="--",
+                        color="green",
+                        label=f"Целевая: {c[0]}x₁ = {opt_z:.2f}",
+                    )
+                )
+            axes.set_title("Графический метод линейного программирования")
+        elif status == "unbounded":
+            axes.set_title("Целевая функция не ограничена на области")
         else:
-            self.canvas.axes.axvline(
-                x=opt_z / c[0],
-                linestyle="--",
-                color="green",
-                label=f"Целевая: {c[0]}x₁ = {opt_z:.2f}",
-            )
-
-        # настройка графика
-        self.canvas.axes.set_xlabel("x₁")
-        self.canvas.axes.set_ylabel("x₂")
-        self.canvas.axes.set_xlim(0, max(10, opt_x * 1.2))
-        self.canvas.axes.set_ylim(0, max(10, opt_y * 1.2))
-        self.canvas.axes.legend()
-        self.canvas.axes.grid(True)
-        self.canvas.axes.set_title(
-            "Графический метод линейного программирования"
-        )
+            axes.set_title("Допустимая область пуста!")
+        axes.legend()
         self.canvas.draw()
 
-        return (opt_x, opt_y), opt_z
-
     def load_from_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -1228,6 +1807,10 @@ class LinearProgrammingApp(QMainWindow):
         self.problem_type_combo.setCurrentText(
             "Минимизация" if minmax == "min" else "Максимизация"
         )
+        basis = task_basis(data)
+        self.basis_edit.setText(
+            ", ".join(map(str, basis)) if isinstance(basis, list) else basis or ""
+        )
 
         # устанавливаем размерности и создаём таблицы
         self.vars_spin.setValue(num_vars)
@@ -1241,7 +1824,7 @@ class LinearProgrammingApp(QMainWindow):
         # заполняем ограничения
         for row, constr in enumerate(constraints_data):
             coeffs = constr.get("coeffs", [])
-            constr_type = constr.get("type", "<=")
+            constr_type = CONSTRAINT_TYPES.get(constr.get("type", "="), "=")
             rhs = constr.get("rhs", "0")
 
             if len(coeffs) != num_vars:
@@ -1275,82 +1858,7 @@ class LinearProgrammingApp(QMainWindow):
 
     def load_from_text(self, lines):
         try:
-            # Первая строка: количество переменных и ограничений
-            first_line = lines[0].split()
-            if len(first_line) < 2:
-                raise ValueError("Первая строка должна содержать количество переменных и ограничений")
-            
-            num_vars = int(first_line[0])
-            num_constraints = int(first_line[1])
-            
-            # Вторая строка: целевая функция
-            if len(lines) < 2:
-                raise ValueError("Отсутствует строка с целевой функцией")
-            
-            objective_coeffs = lines[1].split()
-            if len(objective_coeffs) != num_vars:
-                raise ValueError(f"Ожидалось {num_vars} коэффициентов в целевой функции, получено {len(objective_coeffs)}")
-            
-            # Ограничения
-            constraints = []
-            constraint_lines = lines[2:2 + num_constraints]
-            
-            for i, line in enumerate(constraint_lines):
-                parts = line.split()
-                if len(parts) != num_vars + 2:
-                    raise ValueError(f"Некорректный формат ограничения {i+1}: ожидалось {num_vars+2} элементов")
-                
-                coeffs = parts[:num_vars]
-                constr_type = parts[num_vars]  # =, ≤, ≥
-                rhs = parts[num_vars + 1]
-                
-                constraints.append({
-                    "coeffs": coeffs,
-                    "type": constr_type,
-                    "rhs": rhs
-                })
-            
-            # Определяем тип задачи (последняя строка, если есть)
-            minmax = "max"  # по умолчанию максимизация
-            if len(lines) > 2 + num_constraints:
-                last_line = lines[2 + num_constraints].strip().lower()
-                if last_line in ["min", "max"]:
-                    minmax = last_line
-            
-            # Устанавливаем значения в интерфейсе
-            self.problem_type_combo.setCurrentText(
-                "Минимизация" if minmax == "min" else "Максимизация"
-            )
-            
-            self.vars_spin.setValue(num_vars)
-            self.constraints_spin.setValue(num_constraints)
-            self.create_tables()
-            
-            # Заполняем целевую функцию
-            for i, coeff in enumerate(objective_coeffs):
-                self.objective_table.setItem(0, i, QTableWidgetItem(coeff))
-            
-            # Заполняем ограничения
-            for row, constr in enumerate(constraints):
-                coeffs = constr["coeffs"]
-                constr_type = constr["type"]
-                rhs = constr["rhs"]
-                
-                for col in range(num_vars):
-                    self.constraints_table.setItem(row, col, QTableWidgetItem(coeffs[col]))
-                
-                combo = self.constraints_table.cellWidget(row, num_vars)
-                if constr_type == "≤":
-                    combo.setCurrentIndex(1)
-                elif constr_type == "≥":
-                    combo.setCurrentIndex(2)
-                elif constr_type == "=":
-                    combo.setCurrentIndex(0)
-                else:
-                    combo.setCurrentIndex(0)
-                
-                self.constraints_table.setItem(row, num_vars + 1, QTableWidgetItem(rhs))
-                
+            self.load_from_json(parse_text(lines))
         except Exception as e:
             raise ValueError(f"Ошибка при чтении текстового файла: {str(e)}")
 
@@ -1413,6 +1921,9 @@ class LinearProgrammingApp(QMainWindow):
                 "constraints": constraints,
                 "minmax": minmax,
             }
+            basis = parse_basis(self.basis_edit.text())
+            if basis is not None:
+                data["basis"] = basis
 
             file_path, _ = QFileDialog.getSaveFileName(
                 self,
@@ -1437,5 +1948,8 @@ class LinearProgrammingApp(QMainWindow):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = LinearProgrammingApp()
+    window_time = time.perf_counter()
     window.show()
+    if "--timing" in sys.argv:
+        QTimer.singleShot(0, lambda: report_startup(window_time))
     sys.exit(app.exec())
@@ -3,19 +3,34 @@ from typing import Union
 import numpy as np
 from fractions import Fraction
 import copy
+import sys
+from basis import crash_basis, to_basis
+from problem import CONSTRAINT_TYPES, add_slacks
 
 
 class Table(ABC):
-    _history = []
     _class_type = "basic"
+    pricing = None  # правило выбора опорного элемента (pricing.py)
+    # границы переменных по номеру: нижние переносятся в своб.члены,
+    # верхние хранятся уже за вычетом нижних
+    lower, upper = None, None
+    _flipped = frozenset()  # переменные, замененные на u - x
+    size = None  # число исходных переменных (без дополнительных)
+    _slacks = {}  # строка -> (номер дополнительной переменной, коэф.)
+    _basis = {}  # строка -> заданная начальная базисная переменная
+    _repair_basis = False  # недопустимые базисные убирать, а не ошибка
 
     def __init__(
         self,
         minmax: str,
         matrix: Union[list[list[str]], None] = None,
         basic_func: Union[list[str], None] = None,
+        bounds: Union[list[tuple], None] = None,
+        types: Union[list[str], None] = None,
+        basis: Union[list[int], str, None] = None,
     ) -> None:
         self.matrix, self.basic_func, self.minmax = matrix, basic_func, minmax
+        self.size = None if basic_func is None else len(basic_func)
         self.table: np.ndarray = None
         self.width, self.length = 0, 0
         self._line = []
@@ -23,13 +38,118 @@ class Table(ABC):
         self.verios = [] # опорные элементы
         self.check_step = False # флаг завершения (нет допустимых шагов)
 
+        if types and any(CONSTRAINT_TYPES[t] != "=" for t in types):
+            self._add_slacks(types)
+        if bounds:
+            self.set_bounds(bounds)
+        if basis is not None:
+            self._set_basis(basis)
         self.set_full_task()
 
-    def load_history(self):
-        return self._history.pop()
+    # ≤ и ≥ - через дополнительные переменные с нулевым коэф. в ц.ф.
+    def _add_slacks(self, types):
+        self.matrix, self._slacks = add_slacks(self.matrix, types)
+        self.basic_func = list(self.basic_func) + [0] * len(self._slacks)
 
-    def record_history(self):
-        self._history.append(self.copy())
+    # заданный начальный базис: номера переменных (с дополнительными), не
+    # больше числа строк, или "crash" - подобрать треугольный базис. система
+    # приводится к нему методом Гаусса-Жордана; строки без заданной базисной
+    # получают дополнительную или искусственную переменную, как обычно.
+    # недопустимый базис (x_B < 0 или выше верхней границы) - ошибка, у
+    # crash и при _repair_basis такие переменные просто убираются из базиса
+    # (их строки решает вспомогательная задача)
+    def _set_basis(self, basis):
+        eps = getattr(self, "_eps", 0)
+        exact = not eps
+        # разреженная (CSR) матрица приводится без перевода в плотную
+        sparse = hasattr(self.matrix, "tocsr")
+        matrix = self.matrix.tocsr() if sparse else np.array(self.matrix)
+        crash = isinstance(basis, str)
+        if crash:
+            if basis != "crash":
+                raise ValueError(f"Неизвестный начальный базис: {basis}")
+            sign = -1 if self.minmax == "max" else 1
+            rhs = matrix[:, -1].toarray().ravel() if sparse else matrix[:, -1]
+            basis = crash_basis(
+                matrix,
+                [sign * c for c in self.basic_func],
+                [
+                    i
+                    for i, (_, coef) in self._slacks.items()
+                    if coef * (1 if rhs[i] >= 0 else -1) > 0
+                ],
+                eps,
+            )
+        labels = [int(label) for label in basis]
+        if len(set(labels)) != len(labels):
+            raise ValueError("Переменная повторяется в заданном базисе")
+        if len(labels) > matrix.shape[0]:
+            raise ValueError("Базисных переменных больше, чем ограничений")
+        for label in labels:
+            if not 1 <= label <= len(self.basic_func):
+                raise ValueError(f"Нет переменной x{label}")
+        upper = self.upper or {}
+        while True:
+            reduced, rows = to_basis(matrix, labels, exact, eps or None)
+            bad = [
+                label
+                for i, label in rows.items()
+                if reduced[i, -1] < -eps
+                or (label in upper and reduced[i, -1] > upper[label] + eps)
+            ]
+            if not bad:
+                break
+            if not crash and not self._repair_basis:
+                raise ValueError(f"Базис недопустим: x{bad[0]} вне границ")
+            labels = [label for label in labels if label not in bad]
+        for i in rows:
+            if reduced[i, -1] != 0 and abs(reduced[i, -1]) <= eps:
+                reduced[i, -1] = 0
+        if sparse:
+            reduced.eliminate_zeros()
+        self.matrix, self._basis = reduced if sparse else reduced.tolist(), rows
+
+    # начальный базис: заданные базисные, затем дополнительная переменная
+    # строки, если после смены знака строки (b < 0) ее коэф. +1, иначе
+    # искусственная. rhs - своб.члены до смены знака. возвращает небазисные,
+    # базисные и строки с искусственными (только они входят в строку F
+    # вспомогательной задачи)
+    def _start_basis(self, rhs):
+        basic = dict(self._basis)
+        for i, (label, coef) in self._slacks.items():
+            if i in basic or label in basic.values():
+                continue
+            if coef * (1 if rhs[i] >= 0 else -1) > 0:
+                basic[i] = label
+        size = len(self.basic_func)
+        column = [basic.get(i, size + 1 + i) for i in range(len(rhs))]
+        line = [
+            label for label in range(1, size + 1) if label not in basic.values()
+        ]
+        return line, column, [i not in basic for i in range(len(rhs))]
+
+    # bounds - пары (нижняя, верхняя) для каждой переменной, None - нет
+    # границы (нижняя по умолчанию 0)
+    def set_bounds(self, bounds):
+        self.lower, self.upper = {}, {}
+        for label, (low, up) in enumerate(bounds, 1):
+            low = 0 if low is None else low
+            if up is not None:
+                if up < low:
+                    raise ValueError(f"Верхняя граница x{label} меньше нижней")
+                self.upper[label] = up - low
+            if low != 0:
+                self.lower[label] = low
+        if self.lower:
+            self.matrix = self._shift_rhs(self.lower)
+
+    # x = l + x': из своб.членов вычитаем коэф. * нижнюю границу
+    def _shift_rhs(self, lower):
+        return [
+            list(row[:-1])
+            + [row[-1] - sum(row[label - 1] * low for label, low in lower.items())]
+            for row in self.matrix
+        ]
 
     def copy(self):
         return copy.deepcopy(self)
@@ -55,11 +175,10 @@ class Table(ABC):
                 print("{:>{}}".format(str(self.table[i, j]), 5), end=" ")
             print()
 
-    def is_empty_history(self):
-        return len(self._history) == 0
-
     # ищем все опорные элементы
     def serch(self):
+        if self.upper:
+            return self._bounded_serch()
         self.verios = []  # список допустимых опорных элементы
         for i in range(self.width - 1): # перебираем до b
             sum_num = -1
@@ -77,8 +196,196 @@ class Table(ABC):
                     self.verios.append(indexes)
         self.check_step = len(self.verios) == 0 # хотя бы 1 оп.эл
 
-    # сам симплекс-шаг
+    # опорный элемент для автоматического шага: по правилу, если оно
+    # задано, иначе первый найденный
+    def choose_pivot(self):
+        if not self.verios:
+            return None
+        if self.pricing is None:
+            return self.verios[0]
+        return self.pricing.choose(self)
+
+    # значения таблицы для правил выбора
+    def get_cost(self, index_j): # оценка в строке F
+        return self.table[-1, index_j]
+
+    def get_costs(self): # строка F без своб.чл
+        return self.table[-1, :-1]
+
+    def get_column(self, index_j): # столбец без строки F
+        return self.table[:-1, index_j]
+
+    def get_row(self, index_i): # строка без своб.чл
+        return self.table[index_i, :-1]
+
+    def get_rhs(self): # своб.члены
+        return self.table[:-1, -1]
+
+    def get_objective(self): # своб.член строки F
+        return self.table[-1, -1]
+
+    # для трассировки (solver_trace.py): наибольшая длина в битах числителя
+    # или знаменателя и память под таблицу вместе с самими дробями
+    def max_bits(self):
+        return max(
+            max(abs(x.numerator).bit_length(), x.denominator.bit_length())
+            for x in self.table.ravel()
+        )
+
+    def table_bytes(self):
+        return self.table.nbytes + sum(
+            sys.getsizeof(x) + sys.getsizeof(x.numerator) + sys.getsizeof(x.denominator)
+            for x in self.table.ravel()
+        )
+
+    # симплекс-шаг: замена базиса и удаление колонки искусственной переменной.
+    # возвращает, что нужно для отмены шага: удаленную колонку (или None)
+    # и была ли выводимая переменная заменена на u - x
     def step(self, index_i, index_j):
+        # строка F вместо опорного элемента - вводимая переменная доходит до
+        # своей верхней границы раньше базисных, базис не меняется
+        if index_i == self.length - 1:
+            self._complement_column(index_j)
+            return None
+        if self.pricing is not None:
+            self.pricing.update(self, index_i, index_j)
+        # базисная переменная выходит на верхнюю границу
+        to_upper = bool(self.upper) and self.get_column(index_j)[index_i] < 0
+        if to_upper:
+            self._complement_row(index_i)
+        self.pivot(index_i, index_j)
+        return self.delete_column(index_j), to_upper
+
+    # отмена шага: возвращаем колонку и повторяем замену на том же месте
+    def unstep(self, index_i, index_j, change):
+        if index_i == self.length - 1:
+            self._complement_column(index_j)
+            return
+        removed, to_upper = change
+        if removed is not None:
+            self.insert_column(index_j, removed)
+        self.pivot(index_i, index_j)
+        if to_upper:
+            self._complement_row(index_i)
+
+    # небазисная x_j = u - x': своб.члены b - a*u, колонка меняет знак
+    def _complement_column(self, index_j):
+        label = self._line[index_j]
+        self.table[:, -1] -= self.table[:, index_j] * self.upper[label]
+        self.table[:, index_j] *= -1
+        self._flipped = self._flipped ^ {label}
+
+    # базисная x_i = u - x': своб.член u - b, строка меняет знак
+    def _complement_row(self, index_i):
+        label = self._column[index_i]
+        self.table[index_i, -1] = self.upper[label] - self.table[index_i, -1]
+        self.table[index_i, :-1] *= -1
+        self._flipped = self._flipped ^ {label}
+
+    # верхние границы базисных переменных по строкам (inf - нет границы)
+    def _row_upper(self):
+        return np.array(
+            [self.upper.get(label, np.inf) for label in self._column],
+            dtype=object,
+        )
+
+    # отношения по строкам для столбца с учетом верхних границ (inf - строка
+    # не ограничивает) и граница самой вводимой переменной
+    def _bounded_ratios(self, index_j, row_upper):
+        eps = getattr(self, "_eps", 0)
+        column = np.asarray(self.get_column(index_j), dtype=object)
+        rhs = np.asarray(self.get_rhs(), dtype=object)
+        ratios = np.full(len(column), np.inf, dtype=object)
+        down = column > eps  # базисная убывает до нуля
+        rise = (column < -eps) & (row_upper < np.inf)  # растет до границы
+        ratios[down] = rhs[down] / column[down]
+        ratios[rise] = (row_upper[rise] - rhs[rise]) / -column[rise]
+        return ratios, self.upper.get(self._line[index_j], np.inf)
+
+    # отношение для столбца с учетом верхних границ: номер строки или None.
+    # строка length - 1 означает, что первой упрется сама вводимая переменная
+    def _bounded_ratio(self, index_j, row_upper):
+        ratios, limit = self._bounded_ratios(index_j, row_upper)
+        if len(ratios) and ratios.min() < limit:
+            return int(ratios.argmin())  # при равенстве берется первая строка
+        return self.length - 1 if limit < np.inf else None
+
+    def _negative_costs(self):
+        eps = getattr(self, "_eps", 0)
+        return np.flatnonzero(np.asarray(self.get_costs()) < -eps)
+
+    # поиск опорных элементов, когда есть верхние границы
+    def _bounded_serch(self):
+        self.verios = []
+        row_upper = self._row_upper()
+        for index_j in self._negative_costs():
+            index_i = self._bounded_ratio(index_j, row_upper)
+            if index_i is not None:
+                self.verios.append([index_i, int(index_j)])
+        self.check_step = len(self.verios) == 0
+
+    # неограниченность при верхних границах: ничто не ограничивает рост
+    def _bounded_check(self):
+        row_upper = self._row_upper()
+        return any(
+            self._bounded_ratio(index_j, row_upper) is None
+            for index_j in self._negative_costs()
+        )
+
+    # коэф. ц.ф. для строки F: у замененных на u - x меняется знак, у
+    # искусственных (могут остаться в базисе на нулевой строке) - 0
+    def _phase_costs(self):
+        return [
+            -c if label in self._flipped else c
+            for label, c in enumerate(self.get_basic_func(), 1)
+        ] + [0] * (self.length - 1)
+
+    # после вспомогательной задачи искусственная, оставшаяся в базисе со
+    # значением 0, выводится вырожденным шагом по любому ненулевому элементу
+    # строки (своб.члены не меняются). если строка нулевая - ограничение
+    # следует из остальных, переменная так и остается 0 в базисе
+    def _drive_out_artificials(self):
+        eps = getattr(self, "_eps", 0)
+        size = len(self.basic_func)
+        for index_i, label in enumerate(self._column):
+            if label <= size:
+                continue
+            row = np.asarray(self.get_row(index_i))
+            columns = [
+                j
+                for j in np.flatnonzero(np.abs(row) > eps)
+                if self._line[j] <= size
+            ]
+            if columns:
+                index_j = int(max(columns, key=lambda j: abs(row[j])))
+                self.pivot(index_i, index_j)
+                self.delete_column(index_j)
+
+    # границы и тип задачи переходят в таблицу следующей фазы
+    def _carry_state(self, table):
+        table.minmax = self.minmax
+        table.size = self.size
+        table.lower, table.upper = self.lower, self.upper
+        table._flipped = self._flipped
+        return table
+
+    # ответ: значения переменных и ц.ф. в исходных переменных
+    def get_answer(self):
+        basic_func = self.get_basic_func()
+        answer = [0] * len(basic_func)
+        for i, value in enumerate(self.get_rhs()):
+            if self._column[i] <= len(basic_func):
+                answer[self._column[i] - 1] = value
+        for label in self._flipped:
+            answer[label - 1] = self.upper[label] - answer[label - 1]
+        for label, low in (self.lower or {}).items():
+            answer[label - 1] += low
+        objective = sum(c * x for c, x in zip(basic_func, answer))
+        answer = answer[: self.size]  # без дополнительных переменных
+        return answer, -objective if self.minmax == "max" else objective
+
+    # замена базисной переменной на небазисную (жорданово исключение)
+    def pivot(self, index_i, index_j):
         self._line[index_j], self._column[index_i] = (
             self._column[index_i],
             self._line[index_j],
@@ -105,7 +412,6 @@ class Table(ABC):
                             / pivot
                         )
         self.table = help_tab
-        self.delete_column(index_j)
 
     # удаление колонки
     def delete_column(self, index):
@@ -114,6 +420,7 @@ class Table(ABC):
         # когда обе переменные небазисные удалить не можем
         if self._line[index] <= len(self.basic_func):
             return
+        removed = (self._line[index], self.table[:, index].copy())
         help_table = np.zeros(
             shape=(self.length, self.width - 1), dtype=Fraction
         )
@@ -125,6 +432,14 @@ class Table(ABC):
         self._line.pop(index)
         self.width -= 1
         self.table = help_table
+        return removed
+
+    # вставка ранее удаленной колонки
+    def insert_column(self, index, removed):
+        label, column = removed
+        self.table = np.insert(self.table, index, column, axis=1)
+        self._line.insert(index, label)
+        self.width += 1
 
     # отриц.коэфф. в F ???
     def has_next_step(self):
@@ -132,9 +447,14 @@ class Table(ABC):
  
     # проверка, что нет случая, когда задача неограничена снизу
     def check_table(self):
-        for i in range(self.width):
+        if self.upper:
+            return self._bounded_check()
+        # столбец с отрицательной оценкой без положительных элементов
+        for i in range(self.width - 1):
+            if self.table[-1, i] >= 0:
+                continue
             flag = True
-            for j in self.table[:, i]:
+            for j in self.table[:-1, i]:
                 if j > 0:
                     flag = False
                     break
@@ -147,35 +467,46 @@ class Table(ABC):
 
 
 class BasicTable(Table):
-    def __init__(self, minmax, matrix=None, basic_func=None):
-        super().__init__(minmax, matrix, basic_func)
+    def __init__(
+        self,
+        minmax,
+        matrix=None,
+        basic_func=None,
+        bounds=None,
+        types=None,
+        basis=None,
+    ):
+        super().__init__(minmax, matrix, basic_func, bounds, types, basis)
     # строим таблицу
     def set_full_task(self):
         if self.minmax == "max":
             self.basic_func = [Fraction(-x) for x in self.basic_func]
-        self.width = len(self.matrix[0])
-        self.length = len(self.matrix)
-        self._line = [(i + 1) for i in range(self.width - 1)]
-        self._column = [(i + self.width) for i in range(self.length)]
-        self.length += 1
+        self._line, self._column, artificial = self._start_basis(
+            [row[-1] for row in self.matrix]
+        )
+        # столбцы базисных дополнительных переменных в таблицу не входят
+        keep = [label - 1 for label in self._line] + [len(self.matrix[0]) - 1]
+        self.width = len(keep)
+        self.length = len(self.matrix) + 1
         self.table = np.zeros(shape=(self.length, self.width), dtype=Fraction)
         for i in range(self.length - 1):
-            row = self.matrix[i]
+            row = [self.matrix[i][k] for k in keep]
             # если своб.член > 0 оставляем, иначе *(-1)
             self.table[i] = row if row[-1] >= 0 else [-x for x in row]
         for i in range(self.width):
-            self.table[-1, i] = -sum(self.table[: self.length - 1, i]) # -(сумма по столбцу)
+            # -(сумма по столбцу) по строкам с искусственными переменными
+            self.table[-1, i] = -sum(
+                self.table[k, i] for k in range(self.length - 1) if artificial[k]
+            )
 
-    # проверка, что все последние элементы = 0
+    # сумма искусственных (-своб.член строки F) не 0 - решения нет
     def check_table(self):
-        for i in self.table[-1, :-1]:
-            if i != 0:
-                return True
-        return False
+        return self.table[-1, -1] != 0
  
     # пересчет целевой функции
     def convert_to_simplex(self):
-        basic_func = self.get_basic_func()
+        self._drive_out_artificials()
+        basic_func = self._phase_costs()
         for i in range(self.width):
             total = 0
             for j in range(self.length - 1):
@@ -187,13 +518,15 @@ class BasicTable(Table):
         for i in range(len(self._line)): # добавляем коэф. при иксах
             self.table[-1, i] += basic_func[self._line[i] - 1]
         self.table[-1, -1] *= -1 # своб.чл
-        return SimplexTable(
-            self.table.copy(),
-            basic_func,
-            self._line,
-            self._column,
-            self.width,
-            self.length,
+        return self._carry_state(
+            SimplexTable(
+                self.table.copy(),
+                self.get_basic_func(),
+                self._line,
+                self._column,
+                self.width,
+                self.length,
+            )
         )
 
 
@@ -0,0 +1,286 @@
+from fractions import Fraction
+from math import lcm
+import sys
+import numpy as np
+from Table import Table, BasicTable, SimplexTable
+
+
+# общий знаменатель строки дробей
+def _row_lcm(values):
+    return lcm(*(Fraction(x).denominator for x in values)) if values else 1
+
+
+# точная таблица в целых числах: table = numer / denom (метод Барейса).
+# строки искусственных переменных и строка F дополнительно домножены
+# на свой множитель, чтобы исходная таблица была целой
+class BareissTable(Table):
+    def __init__(
+        self,
+        minmax,
+        matrix=None,
+        basic_func=None,
+        bounds=None,
+        types=None,
+        basis=None,
+    ):
+        self.numer: np.ndarray = None
+        self.denom = 1
+        self._mult = {}  # множители строк по номеру переменной
+        self._f_mult = 1  # множитель строки F
+        self._rhs_div = 1  # делитель столбца своб.членов (дробные границы)
+        self._values = None
+        super().__init__(minmax, matrix, basic_func, bounds, types, basis)
+
+    # таблица в обыкновенных дробях (для вывода), считается по запросу
+    @property
+    def table(self):
+        if self._values is None and self.numer is not None:
+            rows, cols = self.numer.shape
+            col_mult = [self._mult.get(x, 1) for x in self._line]
+            col_mult.append(Fraction(1, self._rhs_div))
+            row_mult = [self._mult.get(x, 1) for x in self._column]
+            row_mult.append(self._f_mult)
+            values = np.zeros(shape=(rows, cols), dtype=Fraction)
+            for i in range(rows):
+                for j in range(cols):
+                    values[i, j] = (
+                        Fraction(self.numer[i, j], self.denom * row_mult[i])
+                        * col_mult[j]
+                    )
+            self._values = values
+        return self._values
+
+    @table.setter
+    def table(self, value):
+        if value is not None:
+            raise AttributeError("таблица задаётся через numer и denom")
+        self.numer, self._values = None, None
+
+    # одно значение таблицы без построения всей таблицы дробей
+    def _value(self, index_i, index_j):
+        row_mult, col_mult = self._f_mult, Fraction(1, self._rhs_div)
+        if index_i < self.length - 1:
+            row_mult = self._mult.get(self._column[index_i], 1)
+        if index_j < self.width - 1:
+            col_mult = self._mult.get(self._line[index_j], 1)
+        return (
+            Fraction(self.numer[index_i, index_j], self.denom * row_mult)
+            * col_mult
+        )
+
+    def get_cost(self, index_j):
+        return self._value(self.length - 1, index_j)
+
+    def get_costs(self):
+        return [self._value(self.length - 1, j) for j in range(self.width - 1)]
+
+    def get_column(self, index_j):
+        return [self._value(i, index_j) for i in range(self.length - 1)]
+
+    def get_row(self, index_i):
+        return [self._value(index_i, j) for j in range(self.width - 1)]
+
+    def get_rhs(self):
+        return [self._value(i, self.width - 1) for i in range(self.length - 1)]
+
+    def get_objective(self):
+        return self._value(self.length - 1, self.width - 1)
+
+    def max_bits(self):
+        return max(
+            max(int(abs(x)).bit_length() for x in self.numer.ravel()),
+            int(self.denom).bit_length(),
+        )
+
+    def table_bytes(self):
+        return self.numer.nbytes + sum(sys.getsizeof(x) for x in self.numer.ravel())
+
+    def serch(self):
+        if self.upper:
+            return self._bounded_serch()
+        self.verios = []
+        numer = self.numer
+        for j in range(self.width - 1):
+            if numer[-1, j] < 0:
+                best = -1
+                for i in range(self.length - 1):
+                    a = numer[i, j]
+                    if a > 0:
+                        # сравниваем b_i / a < b_best / a_best без деления
+                        if best == -1 or numer[i, -1] * numer[best, j] < (
+                            numer[best, -1] * a
+                        ):
+                            best = i
+                if best != -1:
+                    self.verios.append([best, j])
+        self.check_step = len(self.verios) == 0
+
+    # целочисленная замена: деление на прошлый опорный элемент всегда нацело
+    def pivot(self, index_i, index_j):
+        self._line[index_j], self._column[index_i] = (
+            self._column[index_i],
+            self._line[index_j],
+        )
+        numer = self.numer
+        pivot = numer[index_i, index_j]
+        row = numer[index_i].copy()
+        col = numer[:, index_j].copy()
+        numer = (numer * pivot - np.outer(col, row)) // self.denom
+        numer[index_i] = row
+        numer[:, index_j] = -col
+        numer[index_i, index_j] = self.denom
+        if pivot < 0:  # знаменатель держим положительным
+            numer, pivot = -numer, -pivot
+        self.numer, self.denom = numer, pivot
+        self._values = None
+
+    def delete_column(self, index):
+        if index < 0 or index >= self.width:
+            return
+        if self._line[index] <= len(self.basic_func):
+            return
+        removed = (self._line[index], self.numer[:, index].copy())
+        self.numer[:, index:-1] = self.numer[:, index + 1:]
+        self.numer = self.numer[:, :-1]
+        self._line.pop(index)
+        self.width -= 1
+        self._values = None
+        return removed
+
+    def insert_column(self, index, removed):
+        label, column = removed
+        self.numer = np.insert(self.numer, index, column, axis=1)
+        self._line.insert(index, label)
+        self.width += 1
+        self._values = None
+
+    # столбец своб.членов домножаем так, чтобы граница u делилась нацело.
+    # это умножение столбца исходной матрицы, деление в шаге остается точным
+    def _scale_rhs(self, bound):
+        bound = Fraction(bound)
+        scale = lcm(self._rhs_div, bound.denominator) // self._rhs_div
+        self.numer[:, -1] *= scale
+        self._rhs_div *= scale
+        return bound * self._rhs_div  # граница в единицах столбца своб.членов
+
+    def _complement_column(self, index_j):
+        label = self._line[index_j]
+        bound = self._scale_rhs(self.upper[label])
+        col_mult = self._mult.get(label, 1)
+        self.numer[:, -1] -= self.numer[:, index_j] * int(bound * col_mult)
+        self.numer[:, index_j] *= -1
+        self._flipped = self._flipped ^ {label}
+        self._values = None
+
+    def _complement_row(self, index_i):
+        label = self._column[index_i]
+        bound = self._scale_rhs(self.upper[label])
+        row_mult = self._mult.get(label, 1)
+        self.numer[index_i, -1] = (
+            int(bound * self.denom * row_mult) - self.numer[index_i, -1]
+        )
+        self.numer[index_i, :-1] *= -1
+        self._flipped = self._flipped ^ {label}
+        self._values = None
+
+    # знаки числителей совпадают со знаками значений (множители > 0)
+    def has_next_step(self):
+        return any(val < 0 for val in self.numer[-1, :-1])
+
+    def check_table(self):
+        if self.upper:
+            return self._bounded_check()
+        for i in range(self.width - 1):
+            if self.numer[-1, i] < 0 and all(
+                val <= 0 for val in self.numer[:-1, i]
+            ):
+                return True
+        return False
+
+
+class BareissBasicTable(BareissTable, BasicTable):
+    def set_full_task(self):
+        if self.minmax == "max":
+            self.basic_func = [Fraction(-x) for x in self.basic_func]
+        else:
+            self.basic_func = [Fraction(x) for x in self.basic_func]
+        self._line, self._column, artificial = self._start_basis(
+            [row[-1] for row in self.matrix]
+        )
+        # столбцы базисных дополнительных переменных в таблицу не входят
+        keep = [label - 1 for label in self._line] + [len(self.matrix[0]) - 1]
+        self.width = len(keep)
+        self.length = len(self.matrix) + 1
+        rows = []
+        for row in self.matrix:
+            row = [Fraction(row[k]) for k in keep]
+            rows.append(row if row[-1] >= 0 else [-x for x in row])
+        # -(сумма по столбцу) по строкам с искусственными переменными
+        rows.append(
+            [-sum(col) for col in zip(*(r for r, a in zip(rows, artificial) if a))]
+            or [0] * self.width
+        )
+        self.numer = np.zeros(shape=(self.length, self.width), dtype=object)
+        for i, row in enumerate(rows[:-1]):
+            self._mult[self._column[i]] = _row_lcm(row)
+        # строка F - сумма искусственных строк: целая комбинация при
+        # множителе, кратном их множителям
+        self._f_mult = lcm(
+            *(self._mult[x] for x, a in zip(self._column, artificial) if a)
+        )
+        for i, row in enumerate(rows):
+            mult = self._mult[self._column[i]] if i < self.length - 1 else self._f_mult
+            self.numer[i] = [int(x * mult) for x in row]
+        self.denom = 1
+
+    def check_table(self):
+        return self.numer[-1, -1] != 0
+
+    def convert_to_simplex(self):
+        self._drive_out_artificials()
+        basic_func = self._phase_costs()
+        values = self.table
+        f_row = []
+        for i in range(self.width):
+            total = sum(
+                basic_func[self._column[j] - 1] * values[j, i]
+                for j in range(self.length - 1)
+            )
+            f_row.append(-total)
+        for i in range(len(self._line)):
+            f_row[i] += basic_func[self._line[i] - 1]
+        # переменная с множителем строки m в таблице - это m * x, ее коэф.
+        # ц.ф. c / m; при общем знаменателе таких коэф. новая строка F -
+        # целая комбинация строк, и деление при шагах остается точным
+        f_mult = _row_lcm(
+            [c / self._mult.get(x, 1) for x, c in enumerate(basic_func, 1)]
+        )
+        col_mult = [self._mult.get(x, 1) for x in self._line]
+        numer = self.numer.copy()
+        numer[-1, :-1] = [
+            int(x * self.denom * f_mult / mult) for x, mult in zip(f_row, col_mult)
+        ]
+        numer[-1, -1] = int(f_row[-1] * self.denom * f_mult * self._rhs_div)
+        table = BareissSimplexTable(
+            None,
+            self.get_basic_func(),
+            self._line,
+            self._column,
+            self.width,
+            self.length,
+        )
+        table.numer, table.denom = numer, self.denom
+        table._mult, table._f_mult = dict(self._mult), f_mult
+        table._rhs_div = self._rhs_div
+        return self._carry_state(table)
+
+
+class BareissSimplexTable(BareissTable, SimplexTable):
+    def __init__(self, table, basic_func, line, column, width, length):
+        self.numer, self.denom = None, 1
+        self._mult, self._f_mult = {}, 1
+        self._rhs_div = 1
+        self._values = None
+        SimplexTable.__init__(
+            self, table, basic_func, line, column, width, length
+        )
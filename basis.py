@@ -0,0 +1,126 @@
+import numpy as np
+from gauss_method import gauss_jordan
+
+
+# система [A | b] приводится к базису labels (номера переменных с 1):
+# столбец каждой базисной переменной становится единичным в ее строке,
+# строки остаются на своих местах (строка без базисной - исходная за
+# вычетом ведущих). возвращает приведенную матрицу и словарь
+# строка -> базисная переменная. линейно зависимые столбцы - ошибка.
+# разреженная матрица (float) приводится без перевода в плотную
+def to_basis(matrix, labels, exact=False, eps=None):
+    if hasattr(matrix, "tocsr"):
+        return _sparse_to_basis(matrix, labels, eps)
+    matrix = np.asarray(matrix)
+    labels = list(labels)
+    count = len(labels)
+    system = np.hstack([matrix[:, [label - 1 for label in labels]], matrix])
+    reduced, rank, pivots, rows = gauss_jordan(system, count, eps, exact)
+    if rank < count:
+        raise ValueError("Столбцы заданного базиса линейно зависимы")
+    result = np.empty_like(reduced[:, count:])
+    result[rows] = reduced[:, count:]
+    basis = {int(rows[k]): labels[pivots[k]] for k in range(rank)}
+    # без остатков округления в столбцах базисных
+    for row, label in basis.items():
+        result[:, label - 1] = 0
+        result[row, label - 1] = 1
+    return result, basis
+
+
+# то же для CSR: на каждую базисную - одно ранг-1 обновление T - u v^T
+# только по ненулевым ее столбца и ведущей строки (как шаг SparseTable),
+# ведущая строка - наибольший по модулю элемент среди еще не ведущих
+def _sparse_to_basis(matrix, labels, eps=None):
+    import scipy.sparse as sp
+
+    matrix = sp.csr_matrix(matrix, dtype=float)
+    if eps is None:
+        eps = 1e-10 * max(1.0, abs(matrix).max() if matrix.nnz else 0.0)
+    free = np.ones(matrix.shape[0], dtype=bool)
+    basis = {}
+    for label in labels:
+        column = matrix[:, label - 1].toarray().ravel()
+        values = np.where(free, np.abs(column), -1)
+        row = int(values.argmax()) if len(values) else 0
+        if not len(values) or values[row] <= eps:
+            raise ValueError("Столбцы заданного базиса линейно зависимы")
+        u = column.copy()
+        u[row] -= 1
+        u_rows = np.flatnonzero(u)
+        pivot = matrix[row].tocoo()
+        v_cols, v = pivot.col, pivot.data / column[row]
+        update = sp.csr_matrix(
+            (
+                np.outer(u[u_rows], v).ravel(),
+                (np.repeat(u_rows, len(v_cols)), np.tile(v_cols, len(u_rows))),
+            ),
+            shape=matrix.shape,
+        )
+        matrix = matrix - update
+        # без остатков округления в столбце базисной и в малых элементах
+        matrix.data[np.abs(matrix.data) < 1e-12] = 0
+        matrix.data[matrix.indices == label - 1] = 0
+        matrix.eliminate_zeros()
+        matrix = matrix + sp.csr_matrix(
+            ([1.0], ([row], [label - 1])), shape=matrix.shape
+        )
+        free[row] = False
+        basis[row] = label
+    return matrix, basis
+
+
+# треугольный начальный базис (crash): строки, где подходит дополнительная
+# переменная (free_rows), уже покрыты; остальные покрываются столбцами по
+# очереди - сначала выгодные по ц.ф. (costs в виде для min), затем с
+# меньшим числом ненулевых. столбец берется, если он нулевой во всех уже
+# выбранных ведущих строках (базис остается треугольным, значит
+# невырожденным), ведущая строка - наибольший по модулю элемент того же
+# знака, что и своб.член. возвращает номера выбранных переменных
+def crash_basis(matrix, costs, free_rows=(), eps=0):
+    columns, b = _columns(matrix, eps)
+    covered = set(free_rows)
+    pivot_rows, labels = set(), []
+    order = sorted(
+        range(len(columns)), key=lambda j: (costs[j] >= 0, len(columns[j][0]))
+    )
+    for j in order:
+        rows, values = columns[j]
+        if any(i in pivot_rows for i in rows):
+            continue
+        rows = [
+            (i, a)
+            for i, a in zip(rows, values)
+            if i not in covered and a * b[i] >= 0
+        ]
+        if not rows:
+            continue
+        i = max(rows, key=lambda item: abs(item[1]))[0]
+        pivot_rows.add(i)
+        covered.add(i)
+        labels.append(j + 1)
+    return labels
+
+
+# ненулевые (|x| > eps) по столбцам без b: [(строки, значения)], и b.
+# у CSR - прямо из CSC-представления, без плотной матрицы
+def _columns(matrix, eps):
+    if hasattr(matrix, "tocsc"):
+        a = matrix[:, :-1].tocsc()
+        b = matrix[:, -1].toarray().ravel()
+        columns = []
+        for j in range(a.shape[1]):
+            part = slice(a.indptr[j], a.indptr[j + 1])
+            rows, values = a.indices[part], a.data[part]
+            keep = np.abs(values) > eps
+            order = np.argsort(rows[keep], kind="stable")
+            columns.append((rows[keep][order], values[keep][order]))
+        return columns, b
+    matrix = np.asarray(matrix)
+    a, b = matrix[:, :-1], matrix[:, -1]
+    nonzero = (np.abs(a) > eps).astype(bool)
+    columns = []
+    for j in range(a.shape[1]):
+        rows = np.flatnonzero(nonzero[:, j])
+        columns.append((rows, a[rows, j]))
+    return columns, b
@@ -0,0 +1,194 @@
+import argparse
+import glob
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from multiprocessing.connection import wait
+from pricing import RULES
+from problem import parse_basis
+from solver import ENGINES, get_engine, solve_file
+
+
+# список файлов задач: каталог (все .json и .txt в нём) или шаблон
+def collect_files(sources):
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            for ext in ("*.json", "*.txt"):
+                files.extend(glob.glob(os.path.join(source, ext)))
+        else:
+            files.extend(glob.glob(source))
+    return sorted(dict.fromkeys(files))
+
+
+def default_jobs():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# решение одной задачи в отдельном процессе, результат уходит в канал
+def _worker(file_path, engine, pricing, presolve, basis, conn):
+    try:
+        result = solve_file(file_path, engine, pricing, presolve, basis)
+    except Exception as e:
+        result = {"file": file_path, "status": "error", "error": str(e)}
+    conn.send(result)
+    conn.close()
+
+
+def _record(result, wall):
+    record = {
+        "file": result["file"],
+        "status": result["status"],
+        "objective": result.get("objective"),
+        "x": result.get("x"),
+        "pivots": result.get("pivots"),
+        "wall": wall,
+    }
+    if "error" in result:
+        record["error"] = result["error"]
+    return record
+
+
+# каждая задача - свой процесс: зависшую можно снять по таймауту,
+# а падение процесса не ломает остальные. результаты пишутся по мере готовности
+def run_batch(
+    files,
+    output,
+    engine="fraction",
+    jobs=None,
+    timeout=None,
+    pricing="dantzig",
+    presolve=False,
+    basis=None,
+):
+    jobs = jobs or default_jobs()
+    get_engine(engine)  # модуль движка грузим заранее, дочерние процессы его унаследуют
+    methods = mp.get_all_start_methods()
+    context = mp.get_context("fork" if "fork" in methods else None)
+    pending = list(reversed(files))
+    running = {}  # канал -> (процесс, файл, время запуска)
+    counts = {}
+
+    def finish(record):
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            file_path = pending.pop()
+            recv_conn, send_conn = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_worker,
+                args=(file_path, engine, pricing, presolve, basis, send_conn),
+                daemon=True,
+            )
+            process.start()
+            send_conn.close()
+            running[recv_conn] = (process, file_path, time.perf_counter())
+
+        for conn in wait(list(running), timeout=0.05):
+            process, file_path, start = running.pop(conn)
+            wall = time.perf_counter() - start
+            try:
+                result = conn.recv()
+            except EOFError:
+                process.join()
+                result = {
+                    "file": file_path,
+                    "status": "crashed",
+                    "error": f"код завершения {process.exitcode}",
+                }
+            conn.close()
+            process.join()
+            finish(_record(result, wall))
+
+        if timeout is not None:
+            now = time.perf_counter()
+            for conn, (process, file_path, start) in list(running.items()):
+                if now - start > timeout:
+                    process.terminate()
+                    process.join()
+                    conn.close()
+                    del running[conn]
+                    finish(
+                        {
+                            "file": file_path,
+                            "status": "timeout",
+                            "objective": None,
+                            "x": None,
+                            "pivots": None,
+                            "wall": now - start,
+                        }
+                    )
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m batch",
+        description="Пакетное решение задач ЛП в несколько процессов",
+    )
+    parser.add_argument("sources", nargs="+", help="каталоги или шаблоны файлов")
+    parser.add_argument("-o", "--output", help="файл JSONL (по умолчанию stdout)")
+    parser.add_argument(
+        "-e", "--engine", choices=sorted(ENGINES), default="fraction"
+    )
+    parser.add_argument(
+        "-p", "--pricing", choices=sorted(RULES), default="dantzig"
+    )
+    parser.add_argument(
+        "--presolve", action="store_true", help="упростить задачи перед решением"
+    )
+    parser.add_argument(
+        "-b",
+        "--basis",
+        type=parse_basis,
+        default=None,
+        help="начальный базис для всех задач (обычно crash)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="число процессов"
+    )
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=None, help="секунд на задачу"
+    )
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.sources)
+    if not files:
+        print("Файлы задач не найдены", file=sys.stderr)
+        return 1
+    output = (
+        open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    )
+    try:
+        start = time.perf_counter()
+        counts = run_batch(
+            files,
+            output,
+            args.engine,
+            args.jobs,
+            args.timeout,
+            args.pricing,
+            args.presolve,
+            args.basis,
+        )
+    finally:
+        if args.output:
+            output.close()
+    summary = ", ".join(f"{k}: {v}" for k, v in sorted(counts.items()))
+    print(
+        f"Задач: {len(files)} ({summary}), "
+        f"время: {time.perf_counter() - start:.2f} с",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
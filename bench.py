@@ -0,0 +1,390 @@
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from fractions import Fraction
+import numpy as np
+from gauss_method import gauss_pivot_func
+from generate import generate_task
+from pricing import RULES
+from problem import add_slacks, read_task, task_bounds, task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, get_engine, solve
+
+# замеры ядер симплекс-таблицы и целых решений на постоянном наборе задач:
+# задачи task*.json из репозитория и сгенерированные по seed плотные,
+# разреженные, вырожденные, Кли-Минти и со смешанными ограничениями
+# (generate.py). результат - JSON, два прогона сравниваются ключом --compare
+
+
+# плотная: все коэф. > 0, ограничения ≤ - задача ограничена
+def dense_task(rows, cols, seed=0):
+    rng = random.Random(seed)
+    matrix = [
+        [rng.randint(1, 9) for _ in range(cols)] + [rng.randint(10, 99)]
+        for _ in range(rows)
+    ]
+    basic_func = [rng.randint(1, 9) for _ in range(cols)]
+    return basic_func, matrix, "max", ["≤"] * rows, None
+
+
+# разреженная: в строке примерно density * cols ненулевых, у каждого
+# столбца есть положительный коэф. (иначе ц.ф. не ограничена)
+def sparse_task(rows, cols, density=0.1, seed=0):
+    rng = random.Random(seed)
+    matrix = [[0] * cols + [rng.randint(10, 99)] for _ in range(rows)]
+    for j in range(cols):
+        matrix[rng.randrange(rows)][j] = rng.randint(1, 9)
+    for row in matrix:
+        for j in range(cols):
+            if rng.random() < density:
+                row[j] = rng.randint(1, 9)
+    basic_func = [rng.randint(1, 9) for _ in range(cols)]
+    return basic_func, matrix, "max", ["≤"] * rows, None
+
+
+# вырожденная: у половины строк нулевая правая часть и коэф. разных
+# знаков - много шагов без изменения ц.ф.; последняя строка ограничивает
+def degenerate_task(rows, cols, seed=0):
+    rng = random.Random(seed)
+    matrix = []
+    for i in range(rows - 1):
+        if i % 2:
+            matrix.append([rng.randint(1, 9) for _ in range(cols)] + [rng.randint(10, 99)])
+        else:
+            matrix.append([rng.randint(-3, 3) for _ in range(cols)] + [0])
+    matrix.append([1] * cols + [100])
+    basic_func = [rng.randint(1, 9) for _ in range(cols)]
+    return basic_func, matrix, "max", ["≤"] * rows, None
+
+
+# задача Кли-Минти: правило Данцига проходит все 2^d - 1 вершин
+def klee_minty_task(dim):
+    matrix = []
+    for i in range(dim):
+        row = [2 ** (i - j + 1) for j in range(i)] + [1] + [0] * (dim - i - 1)
+        matrix.append(row + [5 ** (i + 1)])
+    basic_func = [2 ** (dim - j - 1) for j in range(dim)]
+    return basic_func, matrix, "max", ["≤"] * dim, None
+
+
+def bundled_tasks(directory=None):
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    tasks = {}
+    for path in sorted(glob.glob(os.path.join(directory, "task*.json"))):
+        data = read_task(path)
+        basic_func, matrix, minmax, types = task_to_matrix(data, Fraction)
+        bounds = task_bounds(data, Fraction)
+        tasks[os.path.basename(path)] = (basic_func, matrix, minmax, types, bounds)
+    return tasks
+
+
+# задача - (коэф. ц.ф., матрица, min/max, типы ограничений, границы)
+# в обыкновенных дробях. постоянный набор задач; scale - множитель размеров сгенерированных
+def corpus(scale=1.0):
+    def size(n):
+        return max(2, int(n * scale))
+
+    tasks = bundled_tasks()
+    tasks[f"dense-{size(30)}x{size(30)}"] = dense_task(size(30), size(30))
+    tasks[f"sparse-{size(60)}x{size(60)}"] = sparse_task(size(60), size(60))
+    tasks[f"degenerate-{size(30)}x{size(30)}"] = degenerate_task(size(30), size(30))
+    tasks[f"klee-minty-{size(6)}"] = klee_minty_task(size(6))
+    data = generate_task(size(30), size(30), density=0.3, degeneracy=0.3)
+    tasks[f"planted-{size(30)}x{size(30)}"] = task_to_matrix(data, Fraction) + (None,)
+    return tasks
+
+
+def _convert(task, engine):
+    number = Fraction if engine in EXACT_ENGINES else to_float
+    basic_func, matrix, minmax, types, bounds = task
+    if bounds is not None:
+        bounds = [
+            tuple(None if x is None else number(x) for x in pair) for pair in bounds
+        ]
+    return (
+        [number(x) for x in basic_func],
+        [[number(x) for x in row] for row in matrix],
+        minmax,
+        types,
+        bounds,
+    )
+
+
+# лучшее время (с) одного вызова func(state) из repeat прогонов.
+# state = prepare() и restore(state, результат) - вне замера
+def _best(func, repeat, prepare=None, restore=None):
+    best = None
+    for _ in range(repeat):
+        state = prepare() if prepare else None
+        start = time.perf_counter()
+        result = func(state) if prepare else func()
+        elapsed = time.perf_counter() - start
+        if restore:
+            restore(state, result)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+# пиковая память (байт) одного вызова, отдельно от замеров времени:
+# tracemalloc заметно замедляет счет
+def _peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# целое решение: шаги, время по фазам лучшего прогона, шагов в секунду,
+# пиковая память
+def bench_solve(name, task, engine, pricing="dantzig", repeat=3):
+    basic_func, matrix, minmax, types, bounds = _convert(task, engine)
+
+    def run():
+        return solve(basic_func, matrix, minmax, engine, pricing, bounds, types=types)
+
+    best = None
+    for _ in range(repeat):
+        result = run()
+        if best is None or result["time"]["total"] < best["time"]["total"]:
+            best = result
+    # у hybrid шаги в float идут при построении таблицы
+    pivot_time = best["time"]["basic"] + best["time"]["simplex"]
+    pivot_time += best.get("hybrid", {}).get("float_time", 0.0)
+    return {
+        "instance": name,
+        "engine": engine,
+        "status": best["status"],
+        "pivots": best["pivots"],
+        "time": best["time"],
+        "pivots_per_sec": best["pivots"] / pivot_time if pivot_time > 0 else None,
+        "peak_bytes": _peak_memory(run),
+    }
+
+
+# для замера ядер ≤ и ≥ сводятся к равенствам явными столбцами
+# дополнительных переменных: начальный базис тогда весь искусственный, и
+# вспомогательная задача (шаги, удаление колонок, переход) не пустая
+def _basic_table(task, engine):
+    basic_func, matrix, minmax, types, bounds = _convert(task, engine)
+    if types is not None:
+        matrix, slacks = add_slacks(matrix, types)
+        basic_func = basic_func + [0] * len(slacks)
+        if bounds is not None:
+            bounds = bounds + [(None, None)] * len(slacks)
+    return get_engine(engine)(minmax, matrix, basic_func, bounds, None)
+
+
+# ядра таблицы по отдельности, время одного вызова: serch, step (с отменой
+# вне замера), delete_column (колонка искусственной переменной после ее
+# замены), convert_to_simplex (после вспомогательной задачи)
+def bench_kernels(name, task, engine, repeat=5):
+    records = []
+
+    def record(kernel, seconds):
+        records.append(
+            {"kernel": kernel, "instance": name, "engine": engine, "seconds": seconds}
+        )
+
+    table = _basic_table(task, engine)
+    record("serch", _best(table.serch, repeat))
+    if table.verios:
+        i, j = table.choose_pivot()
+        record(
+            "step",
+            _best(
+                lambda _: table.step(i, j),
+                repeat,
+                prepare=lambda: None,
+                restore=lambda _, change: table.unstep(i, j, change),
+            ),
+        )
+
+    artificial = len(table.basic_func)
+    pivots = [
+        (i, j)
+        for i, label in enumerate(table._column)
+        if label > artificial
+        for j in range(table.width - 1)
+        if table.get_column(j)[i] != 0
+    ]
+    if pivots:
+        i, j = pivots[0]
+        record(
+            "delete_column",
+            _best(
+                lambda _: table.delete_column(j),
+                repeat,
+                prepare=lambda: table.pivot(i, j),
+                restore=lambda _, removed: (
+                    table.insert_column(j, removed),
+                    table.pivot(i, j),
+                ),
+            ),
+        )
+
+    while table.has_next_step():
+        table.serch()
+        if table.check_step:
+            break
+        table.step(*table.choose_pivot())
+    if not table.check_table():
+        record(
+            "convert_to_simplex",
+            _best(lambda copy: copy.convert_to_simplex(), repeat, prepare=table.copy),
+        )
+    return records
+
+
+# метод Гаусса-Жордана на квадратной системе [A | b] в float и в дробях
+def bench_gauss(size, repeat=5, seed=0):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(-9, 10, size=(size, size + 1))
+    values[:, :size] += np.eye(size, dtype=values.dtype) * 10 * size  # невырожденная
+    records = []
+    for mode, matrix in (
+        ("float", values.astype(float)),
+        ("fraction", np.vectorize(Fraction, otypes=[object])(values)),
+    ):
+        records.append(
+            {
+                "kernel": "gauss_pivot_func",
+                "instance": f"{size}x{size + 1}",
+                "engine": mode,
+                "seconds": _best(lambda: gauss_pivot_func(matrix.copy()), repeat),
+            }
+        )
+    return records
+
+
+def run_bench(engines, scale=1.0, repeat=3, pricing="dantzig", log=None):
+    tasks = corpus(scale)
+    solves, kernels = [], []
+    for name, task in tasks.items():
+        for engine in engines:
+            record = bench_solve(name, task, engine, pricing, repeat)
+            solves.append(record)
+            if log:
+                print(_format_solve(record), file=log, flush=True)
+            for record in bench_kernels(name, task, engine, repeat):
+                kernels.append(record)
+                if log:
+                    print(_format_kernel(record), file=log, flush=True)
+    for record in bench_gauss(max(2, int(40 * scale)), repeat):
+        kernels.append(record)
+        if log:
+            print(_format_kernel(record), file=log, flush=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "scale": scale,
+            "repeat": repeat,
+            "pricing": pricing,
+        },
+        "solves": solves,
+        "kernels": kernels,
+    }
+
+
+def _format_solve(record):
+    rate = record["pivots_per_sec"]
+    return (
+        f"{record['instance']:<22} {record['engine']:<9} {record['status']:<10} "
+        f"шагов: {record['pivots']:>4}, "
+        f"всего {record['time']['total'] * 1000:9.2f} мс "
+        f"(фаза 1 {record['time']['basic'] * 1000:.2f}, "
+        f"фаза 2 {record['time']['simplex'] * 1000:.2f}), "
+        f"{rate or 0:10.0f} шагов/с, память {record['peak_bytes'] / 1024:.0f} КБ"
+    )
+
+
+def _format_kernel(record):
+    return (
+        f"{record['instance']:<22} {record['engine']:<9} "
+        f"{record['kernel']:<18} {record['seconds'] * 1e6:10.1f} мкс"
+    )
+
+
+# сравнение с прошлым прогоном: отношения времени (новое / старое) по
+# совпадающим записям. возвращает строки отчета и число замедлений
+# больше threshold раз
+def compare(old, new, threshold=1.2):
+    def index(report):
+        result = {}
+        for r in report["solves"]:
+            result[("solve", r["instance"], r["engine"])] = r["time"]["total"]
+        for r in report["kernels"]:
+            result[(r["kernel"], r["instance"], r["engine"])] = r["seconds"]
+        return result
+
+    before, after = index(old), index(new)
+    lines, regressions = [], 0
+    for key in sorted(before.keys() & after.keys()):
+        if not before[key] or after[key] is None:
+            continue
+        ratio = after[key] / before[key]
+        mark = ""
+        if ratio > threshold:
+            mark, regressions = " медленнее", regressions + 1
+        elif ratio < 1 / threshold:
+            mark = " быстрее"
+        lines.append(f"{' '.join(key):<50} {ratio:6.2f}x{mark}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bench",
+        description="Замеры ядер симплекс-таблицы и решений на постоянном наборе задач",
+    )
+    parser.add_argument(
+        "-e",
+        "--engine",
+        nargs="+",
+        choices=sorted(ENGINES),
+        default=sorted(ENGINES),
+        help="движки (режимы чисел)",
+    )
+    parser.add_argument("-o", "--output", help="файл JSON с результатами")
+    parser.add_argument(
+        "--compare", help="JSON прошлого прогона: отношения времени и замедления"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="во сколько раз медленнее считать замедлением",
+    )
+    parser.add_argument(
+        "-s", "--scale", type=float, default=1.0, help="множитель размеров задач"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="повторов замера")
+    parser.add_argument(
+        "-p", "--pricing", choices=sorted(RULES), default="dantzig"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_bench(args.engine, args.scale, args.repeat, args.pricing, sys.stderr)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            lines, regressions = compare(json.load(f), report, args.threshold)
+        print("\n".join(lines))
+        print(f"Замедлений: {regressions}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+import numpy as np
+from fractions import Fraction
+from Table import SimplexTable
+from float_table import FloatSimplexTable
+from gauss_method import gauss_pivot_func
+from pricing import get_rule
+from problem import CONSTRAINT_TYPES, add_slacks
+from solver import STATUS_TEXT, get_engine, run_simplex
+
+
+# повторное решение после небольших изменений задачи (правая часть,
+# новое ограничение): оптимальная таблица сохраняется, строка F остается
+# допустимой, и допустимость по b восстанавливается двойственным
+# симплекс-методом за несколько шагов вместо решения с нуля.
+# types - типы ограничений matrix, как при решении
+class ResolveSession:
+    def __init__(self, table, matrix, types=None):
+        if table.get_class_type() != "simplex" or table.has_next_step():
+            raise ValueError("Нужна оптимальная симплекс-таблица")
+        if table.upper:
+            raise ValueError(
+                "Повторное решение с верхними границами переменных не поддерживается"
+            )
+        # любой движок переводим в плотную таблицу: точную или float
+        values = np.array(table.table)
+        self._exact = values.dtype == object
+        self._number = Fraction if self._exact else float
+        engine = SimplexTable if self._exact else FloatSimplexTable
+        self.table = table._carry_state(
+            engine(
+                values,
+                list(table.get_basic_func()),
+                list(table._line),
+                list(table._column),
+                table.width,
+                table.length,
+            )
+        )
+        # число исходных переменных; за ними дополнительные, затем искусственные
+        self.size = self.table.size or len(self.table.basic_func)
+        width = len(self.table.basic_func)
+        if types and any(CONSTRAINT_TYPES[t] != "=" for t in types):
+            matrix, _ = add_slacks(matrix, types)
+        # ограничения-равенства по номерам переменных: {номер: коэф.}, b
+        self.rows = [
+            {j + 1: self._number(a) for j, a in enumerate(row[:-1]) if a != 0}
+            for row in matrix
+        ]
+        self.rhs = [self._number(row[-1]) for row in matrix]
+        # добавленные ≥ хранятся умноженными на -1: знак для set_rhs
+        self._signs = [1] * len(matrix)
+        # искусственные переменные строк (строки с b < 0 таблица умножала на -1)
+        for i, rhs in enumerate(self._shifted_rhs()):
+            self.rows[i][width + i + 1] = 1 if rhs >= 0 else -1
+        self._artificial = set()  # оставшиеся в базисе искусственные
+        self.status = "optimal"
+        self.pivots = 0  # шагов при последнем пересчете
+        for label in list(self.table._column):
+            if label > width:
+                self._remove_artificial(self.table._column.index(label))
+
+    # решаем задачу и открываем сессию по оптимальной таблице
+    @classmethod
+    def from_problem(
+        cls,
+        basic_func,
+        matrix,
+        minmax,
+        engine="fraction",
+        pricing="dantzig",
+        types=None,
+    ):
+        table = get_engine(engine)(minmax, matrix, basic_func, None, types)
+        status, table, _, _ = run_simplex(table, get_rule(pricing))
+        if status != "optimal":
+            raise ValueError(STATUS_TEXT[status])
+        return cls(table, matrix, types)
+
+    def get_answer(self):
+        answer, objective = self.table.get_answer()
+        return answer[: self.size], objective
+
+    # новая правая часть ограничения row (с 0): базисные значения B^-1 b
+    def set_rhs(self, row, value):
+        self.rhs[row] = self._signs[row] * self._number(value)
+        self.pivots = 0
+        table = self.table
+        dtype = object if self._exact else float
+        system = np.array(
+            [
+                [coeffs.get(label, 0) for label in table._column] + [rhs]
+                for coeffs, rhs in zip(self.rows, self._shifted_rhs())
+            ],
+            dtype=dtype,
+        )
+        basic = gauss_pivot_func(system)[:, -1]
+        table.table[:-1, -1] = basic
+        table.table[-1, -1] = -sum(
+            self._cost(label) * x for label, x in zip(table._column, basic)
+        )
+        return self._dual_simplex()
+
+    # новое ограничение coeffs (тип) rhs: строка с новой базисной
+    # переменной выражается через текущие небазисные
+    def add_constraint(self, coeffs, constr_type, rhs):
+        if constr_type not in CONSTRAINT_TYPES:
+            raise ValueError(f"Неизвестный тип ограничения: {constr_type}")
+        constr_type = CONSTRAINT_TYPES[constr_type]
+        if len(coeffs) != self.size:
+            raise ValueError("Несоответствие числа переменных в ограничении")
+        table = self.table
+        sign = -1 if constr_type == "≥" else 1
+        row = {
+            j + 1: sign * self._number(a)
+            for j, a in enumerate(coeffs)
+            if a != 0
+        }
+        # дополнительная переменная: у неравенства остается в задаче (коэф.
+        # ц.ф. 0), у равенства - искусственная, удаляется при выходе из базиса.
+        # номера выше len(basic_func) - только искусственные, поэтому перед
+        # новой дополнительной они сдвигаются на 1
+        if constr_type == "=":
+            label = max([x for row in self.rows for x in row] + table._line) + 1
+        else:
+            label = len(table.basic_func) + 1
+            self._shift_artificials(label)
+            table.basic_func.append(self._number(0))
+        row[label] = 1
+        self.rows.append(row)
+        self.rhs.append(sign * self._number(rhs))
+        self._signs.append(sign)
+
+        values = table.table
+        basic = np.array([row.get(x, 0) for x in table._column], dtype=values.dtype)
+        line = np.array([row.get(x, 0) for x in table._line], dtype=values.dtype)
+        new_row = np.empty(table.width, dtype=values.dtype)
+        new_row[:-1] = line - basic @ values[:-1, :-1]
+        new_row[-1] = self._shifted_rhs()[-1] - basic @ values[:-1, -1]
+        table.table = np.insert(values, table.length - 1, new_row, axis=0)
+        table._column.append(label)
+        table.length += 1
+        self.pivots = 0
+        if constr_type == "=":
+            self._remove_artificial(table.length - 2)
+        return self._dual_simplex()
+
+    def _cost(self, label):
+        basic_func = self.table.basic_func
+        return basic_func[label - 1] if label <= len(basic_func) else 0
+
+    # искусственные с номерами от label и выше получают номер на 1 больше
+    def _shift_artificials(self, label):
+        def shift(x):
+            return x + 1 if x >= label else x
+
+        table = self.table
+        self.rows = [{shift(x): a for x, a in row.items()} for row in self.rows]
+        table._line = [shift(x) for x in table._line]
+        table._column = [shift(x) for x in table._column]
+        self._artificial = {shift(x) for x in self._artificial}
+
+    # шаг с выводом index_i; вышедшая искусственная удаляется вместе со
+    # своей колонкой (это делает step), поэтому и из _artificial
+    def _step(self, index_i, index_j):
+        self._artificial.discard(self.table._column[index_i])
+        self.table.step(index_i, index_j)
+        self.pivots += 1
+
+    # b с учетом переноса нижних границ
+    def _shifted_rhs(self):
+        lower = self.table.lower or {}
+        return [
+            rhs - sum(coeffs.get(label, 0) * low for label, low in lower.items())
+            for coeffs, rhs in zip(self.rows, self.rhs)
+        ]
+
+    # искусственная переменная x_a = 0 с другим знаком остается той же,
+    # строку и коэффициент в ограничении умножаем на -1
+    def _negate_row(self, index_i):
+        label = self.table._column[index_i]
+        self.table.table[index_i] *= -1
+        for row in self.rows:
+            if label in row:
+                row[label] = -row[label]
+
+    # искусственную переменную равенства сразу выводим из базиса, при
+    # необходимости сменив знак, чтобы b <= 0 и был элемент < 0. если строка
+    # нулевая (ограничение - следствие остальных), переменная остается
+    def _remove_artificial(self, index_i):
+        table = self.table
+        eps = getattr(table, "_eps", 0)
+        row = table.table[index_i]
+        if row[-1] > eps or (
+            row[-1] >= -eps and not np.any(row[:-1] < -eps)
+        ):
+            self._negate_row(index_i)
+        index_j = self._entering(index_i)
+        if index_j is None:
+            self._artificial.add(table._column[index_i])
+        else:
+            self._step(index_i, index_j)
+
+    # вводимая переменная для строки index_i: min d_j / |a_ij| по a_ij < 0
+    def _entering(self, index_i):
+        table = self.table
+        eps = getattr(table, "_eps", 0)
+        row = np.asarray(table.get_row(index_i))
+        columns = np.flatnonzero(row < -eps)
+        if len(columns) == 0:
+            return None
+        costs = np.asarray(table.get_costs())[columns]
+        ratios = costs / -row[columns]
+        return int(columns[np.argmin(ratios)])  # при равенстве - первый
+
+    # двойственный симплекс-метод: выводим самую отрицательную базисную
+    def _dual_simplex(self):
+        table = self.table
+        eps = getattr(table, "_eps", 0)
+        while True:
+            # оставшаяся искусственная должна быть 0: положительную делаем
+            # отрицательной, и она выводится как обычная
+            for index_i, label in enumerate(table._column):
+                if label in self._artificial and table.table[index_i, -1] > eps:
+                    self._negate_row(index_i)
+            rhs = np.asarray(table.get_rhs())
+            index_i = int(np.argmin(rhs))
+            if rhs[index_i] >= -eps:
+                self.status = "optimal"
+                return self.status
+            index_j = self._entering(index_i)
+            if index_j is None:
+                self.status = "infeasible"
+                return self.status
+            self._step(index_i, index_j)
@@ -0,0 +1,145 @@
+import numpy as np
+from Table import Table, BasicTable, SimplexTable
+
+
+# общая часть для таблиц в десятичных дробях (float64)
+class FloatTable(Table):
+    _eps = 1e-9  # всё, что по модулю меньше, считаем нулём
+
+    def max_bits(self):
+        return None
+
+    def table_bytes(self):
+        return self.table.nbytes
+
+    # ищем все опорные элементы сразу по всей таблице
+    def serch(self):
+        if self.upper:
+            return self._bounded_serch()
+        body = self.table[:-1, :-1]
+        b = self.table[:-1, -1]
+        cols = np.flatnonzero(self.table[-1, :-1] < -self._eps)  # F < 0
+        sub = body[:, cols]
+        positive = sub > self._eps
+        # отношение своб.члена к элементу только там, где элемент > 0
+        ratios = np.full(sub.shape, np.inf)
+        np.divide(b[:, None], sub, out=ratios, where=positive)
+        rows = ratios.argmin(axis=0)  # при равенстве берется первая строка
+        found = positive.any(axis=0)
+        self.verios = [
+            [int(i), int(j)] for i, j in zip(rows[found], cols[found])
+        ]
+        self.check_step = len(self.verios) == 0
+
+    # замена базиса одним ранг-1 обновлением на месте
+    def pivot(self, index_i, index_j):
+        self._line[index_j], self._column[index_i] = (
+            self._column[index_i],
+            self._line[index_j],
+        )
+        table = self.table
+        pivot = table[index_i, index_j]
+        row = table[index_i] / pivot
+        col = table[:, index_j].copy()
+        table -= np.outer(col, row)
+        # крест от опорного элемента
+        table[index_i] = row
+        table[:, index_j] = -col / pivot
+        table[index_i, index_j] = 1 / pivot
+
+    # удаление колонки сдвигом хвоста влево, без новой таблицы
+    def delete_column(self, index):
+        if index < 0 or index >= self.width:
+            return
+        if self._line[index] <= len(self.basic_func):
+            return
+        removed = (self._line[index], self.table[:, index].copy())
+        self.table[:, index:-1] = self.table[:, index + 1:]
+        self.table = self.table[:, :-1]
+        self._line.pop(index)
+        self.width -= 1
+        return removed
+
+    # опорные элементы с учетом верхних границ сразу по всем столбцам
+    # (правила те же, что в Table._bounded_ratio)
+    def _bounded_candidates(self):
+        table = self.table
+        cols = np.flatnonzero(table[-1, :-1] < -self._eps)
+        sub, b = table[:-1, cols], table[:-1, -1]
+        row_upper = np.array([self.upper.get(x, np.inf) for x in self._column])
+        ratios = np.full(sub.shape, np.inf)
+        np.divide(b[:, None], sub, out=ratios, where=sub > self._eps)
+        rise = (sub < -self._eps) & np.isfinite(row_upper)[:, None]
+        np.divide((row_upper - b)[:, None], -sub, out=ratios, where=rise)
+        rows = ratios.argmin(axis=0)
+        best = ratios[rows, np.arange(len(cols))]
+        limit = np.array([self.upper.get(self._line[j], np.inf) for j in cols])
+        rows[limit <= best] = self.length - 1
+        return rows, cols, np.isfinite(np.minimum(best, limit))
+
+    def _bounded_serch(self):
+        rows, cols, found = self._bounded_candidates()
+        self.verios = [
+            [int(i), int(j)] for i, j in zip(rows[found], cols[found])
+        ]
+        self.check_step = len(self.verios) == 0
+
+    def _bounded_check(self):
+        return not self._bounded_candidates()[2].all()
+
+    def has_next_step(self):
+        return bool(np.any(self.table[-1, :-1] < -self._eps))
+
+    def check_table(self):
+        if self.upper:
+            return self._bounded_check()
+        # столбец с отрицательной оценкой без положительных элементов
+        negative = self.table[-1, :-1] < -self._eps
+        return bool(
+            np.any(negative & np.all(self.table[:-1, :-1] <= self._eps, axis=0))
+        )
+
+
+class FloatBasicTable(FloatTable, BasicTable):
+    def set_full_task(self):
+        if self.minmax == "max":
+            self.basic_func = [-float(x) for x in self.basic_func]
+        else:
+            self.basic_func = [float(x) for x in self.basic_func]
+        matrix = np.array(self.matrix, dtype=float)
+        self._line, self._column, artificial = self._start_basis(matrix[:, -1])
+        # столбцы базисных дополнительных переменных в таблицу не входят
+        keep = np.array(self._line + [matrix.shape[1]], dtype=int) - 1
+        matrix = matrix[:, keep]
+        self.length, self.width = matrix.shape
+        self.length += 1
+        self.table = np.empty(shape=(self.length, self.width))
+        # если своб.член < 0 строку * (-1)
+        signs = np.where(matrix[:, -1] >= 0, 1.0, -1.0)
+        self.table[:-1] = matrix * signs[:, None]
+        self.table[-1] = -self.table[:-1][artificial].sum(axis=0)
+
+    def check_table(self):
+        return bool(abs(self.table[-1, -1]) > self._eps)
+
+    def convert_to_simplex(self):
+        self._drive_out_artificials()
+        basic_func = np.array(self._phase_costs())
+        basic = basic_func[np.array(self._column) - 1]
+        # коэф. базиса на столбцы, со сменой знака кроме своб.чл
+        self.table[-1] = -(basic @ self.table[:-1])
+        self.table[-1, :-1] += basic_func[np.array(self._line, dtype=int) - 1]
+        return self._carry_state(
+            FloatSimplexTable(
+                self.table.copy(),
+                self.get_basic_func(),
+                self._line,
+                self._column,
+                self.width,
+                self.length,
+            )
+        )
+
+
+class FloatSimplexTable(FloatTable, SimplexTable):
+    pass
@@ -1,30 +1,143 @@
 import numpy as np
+from fractions import Fraction
+from math import lcm
 
-# преобразуем верхнетреугольную матрицу в единичную
+
+# метод Гаусса-Жордана сразу для стопки одинаковых матриц (k, m, n):
+# на каждом столбце у каждой матрицы свой ведущий элемент (наибольший по
+# модулю среди еще не использованных строк), исключение - одна операция
+# над всеми матрицами. столбец, где ведущий |x| <= eps, пропускается, так
+# что вырожденные матрицы не ошибка, а меньший ранг. ведущие ищутся в первых
+# columns столбцах (остальные, например b, только пересчитываются).
+# возвращает приведенные матрицы (в ведущих столбцах - единичная), ранги,
+# ведущий столбец каждой строки (-1 - нет) и исходные номера строк.
+# для дробей (dtype=object) все точно и eps по умолчанию 0
+def gauss_jordan_batch(matrices, columns=None, eps=None):
+    matrices = np.array(matrices)
+    if matrices.dtype.kind in "iub":
+        matrices = matrices.astype(float)
+    count, rows_count, width = matrices.shape
+    exact = matrices.dtype == object
+    if eps is None:
+        if exact or matrices.size == 0:
+            eps = 0
+        else:
+            eps = 1e-10 * np.maximum(
+                1, np.abs(matrices).reshape(count, -1).max(axis=1)
+            )
+    eps = np.broadcast_to(np.asarray(eps, dtype=object if exact else float), count)
+
+    batch = np.arange(count)
+    rank = np.zeros(count, dtype=int)
+    rows = np.tile(np.arange(rows_count), (count, 1))
+    pivots = np.full((count, rows_count), -1)
+    for ncol in range(width if columns is None else columns):
+        active = rank < rows_count
+        if not active.any():
+            break
+        values = np.abs(matrices[:, :, ncol])
+        values[np.arange(rows_count) < rank[:, None]] = -1  # уже ведущие
+        pivot = values.argmax(axis=1)
+        active &= (values[batch, pivot] > eps).astype(bool)
+        if not active.any():
+            continue
+        k, r, p = batch[active], rank[active], pivot[active]
+        swap = matrices[k, r].copy()
+        matrices[k, r] = matrices[k, p]
+        matrices[k, p] = swap
+        swap = rows[k, r].copy()
+        rows[k, r] = rows[k, p]
+        rows[k, p] = swap
+        row = matrices[k, r] / matrices[k, r, ncol][:, None]
+        matrices[k] -= matrices[k, :, ncol][:, :, None] * row[:, None, :]
+        matrices[k, r] = row
+        if not exact:  # без остатков округления в ведущем столбце
+            matrices[k, :, ncol] = 0
+            matrices[k, r, ncol] = 1
+        pivots[k, r] = ncol
+        rank[active] += 1
+    return matrices, rank, pivots, rows
+
+
+# Гаусс-Жордан для одной матрицы: приведенная матрица, ранг, ведущие
+# столбцы, исходные номера строк (первые rank - независимые строки).
+# exact - считать в обыкновенных дробях (целые и float переводятся точно)
+def gauss_jordan(matrix, columns=None, eps=None, exact=False):
+    matrix = np.asarray(matrix)
+    if exact:
+        matrix = np.array(
+            [[Fraction(_item(x)) for x in row] for row in matrix], dtype=object
+        ).reshape(matrix.shape)
+    if matrix.dtype == object and not eps and matrix.size and all(
+        isinstance(x, (int, Fraction)) for x in matrix.ravel()
+    ):
+        return _gauss_jordan_exact(matrix, columns)
+    reduced, rank, pivots, rows = gauss_jordan_batch(matrix[None], columns, eps)
+    rank = int(rank[0])
+    return reduced[0], rank, [int(j) for j in pivots[0, :rank]], rows[0]
+
+
+# точный Гаусс-Жордан без дробей (Барейс): строки домножаются до целых,
+# шаг a_ij = (p a_ij - a_ic a_rj) / p_прошлый делится нацело, дроби
+# строятся один раз в конце. ведущие и порядок строк - как в
+# gauss_jordan_batch (наибольший по модулю элемент с учетом множителя строки)
+def _gauss_jordan_exact(matrix, columns=None):
+    rows_count, width = matrix.shape
+    scale = [lcm(*(Fraction(x).denominator for x in row)) for row in matrix]
+    numer = np.array(
+        [[int(x * s) for x in row] for row, s in zip(matrix, scale)], dtype=object
+    ).reshape(matrix.shape)
+    rows = np.arange(rows_count)
+    pivots, rank, prev = [], 0, 1
+    for ncol in range(width if columns is None else columns):
+        if rank == rows_count:
+            break
+        # значение элемента в приведенной матрице - numer / (prev * scale)
+        values = [
+            Fraction(abs(numer[i, ncol]), scale[i]) for i in range(rank, rows_count)
+        ]
+        best = max(range(len(values)), key=values.__getitem__)
+        if values[best] == 0:
+            continue
+        pivot_row = rank + best
+        numer[[rank, pivot_row]] = numer[[pivot_row, rank]]
+        rows[[rank, pivot_row]] = rows[[pivot_row, rank]]
+        scale[rank], scale[pivot_row] = scale[pivot_row], scale[rank]
+        row = numer[rank].copy()
+        pivot = row[ncol]
+        numer = (numer * pivot - np.outer(numer[:, ncol], row)) // prev
+        numer[rank] = row
+        prev = pivot
+        pivots.append(ncol)
+        rank += 1
+    # ведущая строка делится на свой ведущий элемент, остальные - на prev * scale
+    reduced = np.empty(matrix.shape, dtype=object)
+    for i in range(rows_count):
+        divisor = numer[i, pivots[i]] if i < rank else prev * scale[i]
+        reduced[i] = [Fraction(x, divisor) for x in numer[i]]
+    return reduced, rank, pivots, rows
+
+
+# числа numpy -> числа Python (Fraction от np.int64 переполняется)
+def _item(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# преобразуем верхнетреугольную матрицу (единицы на диагонали) в единичную
 def make_identity(matrix):
     # перебор строк в обратном порядке
     for nrow in range(len(matrix) - 1, 0, -1):
-        row = matrix[nrow]
-        for upper_row in matrix[:nrow]:
-            factor = upper_row[nrow]
-            upper_row -= factor * row
+        matrix[:nrow] -= np.outer(matrix[:nrow, nrow], matrix[nrow])
     return matrix
 
-# реализуем с выбором ведущего элемента
+
+# решение системы [A | b] (A квадратная) на месте: слева единичная,
+# справа ответ. вырожденная A - ошибка
 def gauss_pivot_func(matrix):
-    for nrow in range(len(matrix)):
-        pivot = nrow + np.argmax(abs(matrix[nrow:, nrow]))
-        if pivot != nrow:
-            matrix[[nrow, pivot]] = matrix[[pivot, nrow]]
-        row = matrix[nrow]
-        divider = row[nrow]
-        if abs(divider) < 1e-10:
-            raise ValueError(
-                f"Матрица несовместна. Максимальный элемент в столбце {nrow}: {divider:.3g}"
-            )
-        row /= divider
-        for lower_row in matrix[nrow + 1:]:
-            factor = lower_row[nrow]
-            lower_row -= factor * row
-    make_identity(matrix)
+    reduced, rank, _, _ = gauss_jordan(matrix, len(matrix))
+    if rank < len(matrix):
+        raise ValueError(
+            f"Матрица несовместна: ранг {rank} меньше {len(matrix)}"
+        )
+    matrix[...] = reduced
     return matrix
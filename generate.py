@@ -0,0 +1,205 @@
+import argparse
+import json
+import os
+import random
+import sys
+from fractions import Fraction
+from problem import CONSTRAINT_TYPES
+
+# генератор задач ЛП с известным ответом в формате JSON программы
+# ("function", "constraints" с "coeffs"/"type"/"rhs", "minmax"). все числа
+# целые, одинаковый seed дает одинаковую задачу. ответ пишется в "expected"
+
+
+# оптимум задается заранее через условия дополняющей нежесткости:
+# x* >= 0 и двойственные y* (знак по типу строки: для min у ≤ y <= 0, у ≥
+# y >= 0, у = любой), c = A^T y* + d, где d >= 0 и d_j = 0 при x*_j > 0.
+# строка с y_i != 0 выполняется на x* как равенство. тогда x* оптимален
+# и значение ц.ф. c x* = b y*. degeneracy - доля строк, проходящих через
+# x* с y_i = 0 (вырожденные вершины), и нулевых d_j при x*_j = 0
+def _planted(rng, rows, cols, density, degeneracy, types):
+    matrix = []
+    for _ in range(rows):
+        row = [
+            rng.choice([-1, 1]) * rng.randint(1, 9) if rng.random() < density else 0
+            for _ in range(cols)
+        ]
+        if not any(row):
+            row[rng.randrange(cols)] = rng.randint(1, 9)
+        matrix.append(row)
+    x = [0 if rng.random() < 0.5 else rng.randint(1, 9) for _ in range(cols)]
+
+    rhs, duals = [], []
+    for row, constr_type in zip(matrix, types):
+        value = sum(a * v for a, v in zip(row, x))
+        tight = constr_type == "=" or rng.random() < 0.3 + degeneracy
+        if not tight:
+            slack = rng.randint(1, 9)
+            rhs.append(value + slack if constr_type == "≤" else value - slack)
+            duals.append(0)
+            continue
+        rhs.append(value)
+        if constr_type != "=" and rng.random() < degeneracy:
+            duals.append(0)
+        elif constr_type == "≤":
+            duals.append(-rng.randint(1, 9))
+        elif constr_type == "≥":
+            duals.append(rng.randint(1, 9))
+        else:
+            duals.append(rng.choice([-1, 1]) * rng.randint(1, 9))
+
+    costs = []
+    for j in range(cols):
+        reduced = 0
+        if x[j] == 0 and rng.random() >= degeneracy:
+            reduced = rng.randint(1, 9)
+        costs.append(sum(matrix[i][j] * duals[i] for i in range(rows)) + reduced)
+    return matrix, rhs, costs, x
+
+
+# задача rows x cols. density - доля ненулевых коэф., degeneracy (0..1) -
+# доля вырожденных строк и столбцов, status - "optimal", "infeasible"
+# (добавляется строка, противоречащая сумме строк того же типа, так что
+# типы ограничений остаются заданными) или "unbounded" (добавляется
+# переменная, вдоль которой ц.ф. убывает без границы), types - "≤", "≥",
+# "=" или "mixed"
+def generate_task(
+    rows,
+    cols,
+    density=1.0,
+    degeneracy=0.0,
+    status="optimal",
+    types="mixed",
+    minmax="max",
+    seed=0,
+):
+    if status not in ("optimal", "infeasible", "unbounded"):
+        raise ValueError(f"Неизвестный статус: {status}")
+    rng = random.Random(seed)
+    if types == "mixed":
+        row_types = [rng.choice(["≤", "≤", "≥", "="]) for _ in range(rows)]
+    else:
+        row_types = [CONSTRAINT_TYPES[types]] * rows
+    matrix, rhs, costs, x = _planted(rng, rows, cols, density, degeneracy, row_types)
+    objective = sum(c * v for c, v in zip(costs, x))
+
+    if status == "infeasible":
+        # до двух строк одного типа: их сумма s x (≤, ≥, =) s_b, новая
+        # строка того же типа требует s x >= s_b + k, s x <= s_b - k или
+        # s x = s_b + k (для ≤ и ≥ - через смену знака всей строки)
+        constr_type = row_types[rng.randrange(rows)]
+        chosen = [i for i, t in enumerate(row_types) if t == constr_type][:2]
+        total = [sum(matrix[i][j] for i in chosen) for j in range(cols)]
+        total_rhs, gap = sum(rhs[i] for i in chosen), rng.randint(1, 9)
+        if constr_type == "=":
+            matrix.append(total)
+            rhs.append(total_rhs + gap)
+        else:
+            matrix.append([-a for a in total])
+            rhs.append(-total_rhs - gap if constr_type == "≤" else -total_rhs + gap)
+        row_types.append(constr_type)
+    elif status == "unbounded":
+        # столбец: в строках ≤ коэф. <= 0, в ≥ - >= 0, в = - 0; x* + t e_j
+        # допустим при всех t >= 0, а ц.ф. (для min) убывает
+        column = [
+            0 if t == "=" else rng.randint(0, 9) * (-1 if t == "≤" else 1)
+            for t in row_types
+        ]
+        index = rng.randint(0, cols)
+        for row, value in zip(matrix, column):
+            row.insert(index, value)
+        costs.insert(index, -rng.randint(1, 9))
+        x.insert(index, 0)
+
+    # задача строилась как min; для max меняем знак ц.ф.
+    sign = 1 if minmax == "min" else -1
+    data = {
+        "function": [str(sign * c) for c in costs],
+        "constraints": [
+            {"coeffs": [str(a) for a in row], "type": t, "rhs": str(b)}
+            for row, t, b in zip(matrix, row_types, rhs)
+        ],
+        "minmax": minmax,
+        "seed": seed,
+        "expected": {"status": status},
+    }
+    if status == "optimal":
+        data["expected"]["objective"] = str(sign * objective)
+        data["expected"]["x"] = [str(v) for v in x]
+    return data
+
+
+# совпадает ли результат solve с известным ответом (для float - с
+# относительной точностью tol)
+def check_result(data, result, tol=1e-6):
+    expected = data.get("expected")
+    if expected is None:
+        return None
+    if result["status"] != expected["status"]:
+        return False
+    if expected["status"] != "optimal":
+        return True
+    want = Fraction(expected["objective"])
+    got = result["objective"]
+    if isinstance(got, str):
+        return Fraction(got) == want
+    return abs(got - float(want)) <= tol * max(1.0, abs(float(want)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m generate",
+        description="Генерация задач ЛП с известным ответом",
+    )
+    parser.add_argument("-m", "--rows", type=int, default=10, help="число ограничений")
+    parser.add_argument("-n", "--cols", type=int, default=10, help="число переменных")
+    parser.add_argument(
+        "-d", "--density", type=float, default=1.0, help="доля ненулевых коэф."
+    )
+    parser.add_argument(
+        "--degeneracy", type=float, default=0.0, help="доля вырожденных строк (0..1)"
+    )
+    parser.add_argument(
+        "--status", choices=["optimal", "infeasible", "unbounded"], default="optimal"
+    )
+    parser.add_argument(
+        "--types", choices=["mixed", "≤", "≥", "=", "<=", ">="], default="mixed"
+    )
+    parser.add_argument("--minmax", choices=["max", "min"], default="max")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument(
+        "-c", "--count", type=int, default=1, help="число задач (seed, seed + 1, ...)"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="файл (одна задача) или каталог (task_<seed>.json); по умолчанию stdout",
+    )
+    args = parser.parse_args(argv)
+
+    for seed in range(args.seed, args.seed + args.count):
+        data = generate_task(
+            args.rows,
+            args.cols,
+            args.density,
+            args.degeneracy,
+            args.status,
+            args.types,
+            args.minmax,
+            seed,
+        )
+        text = json.dumps(data, ensure_ascii=False, indent=1)
+        if args.output is None:
+            print(text)
+            continue
+        path = args.output
+        if args.count > 1 or os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+            path = os.path.join(path, f"task_{seed}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+from collections import deque
+from fractions import Fraction
+from functools import cmp_to_key
+from problem import CONSTRAINT_TYPES
+
+
+# число value + inf * M, где M сколь угодно велико (полуразмер квадрата,
+# которым ограничивается плоскость). сравнение - сначала по inf
+class _Big:
+    def __init__(self, value, inf=0):
+        self.value, self.inf = value, inf
+
+    def __add__(self, other):
+        return _Big(self.value + other.value, self.inf + other.inf)
+
+    def __sub__(self, other):
+        return _Big(self.value - other.value, self.inf - other.inf)
+
+    def scale(self, k):
+        return _Big(self.value * k, self.inf * k)
+
+    def div(self, k):
+        return _Big(self.value / k, self.inf / k)
+
+    def sign(self, eps=0):
+        for x in (self.inf, self.value):
+            if x > eps:
+                return 1
+            if x < -eps:
+                return -1
+        return 0
+
+
+# полуплоскость a x + b y <= c (c - _Big); граница идет по направлению
+# (-b, a), допустимая сторона слева
+class _Plane:
+    def __init__(self, a, b, c):
+        self.a, self.b, self.c = a, b, c
+        self.direction = (-b, a)
+
+    # точка границы, ближайшая к началу координат
+    def point(self):
+        norm = self.a * self.a + self.b * self.b
+        return self.c.scale(self.a).div(norm), self.c.scale(self.b).div(norm)
+
+    # точка (пара _Big) строго вне полуплоскости
+    def out(self, point, eps):
+        x, y = point
+        return (x.scale(self.a) + y.scale(self.b) - self.c).sign(eps) > 0
+
+
+def _cross(u, v):
+    return u[0] * v[1] - u[1] * v[0]
+
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1]
+
+
+# порядок полуплоскостей по углу направления в [0, 2pi) без
+# тригонометрии - для дробей сравнение точное
+def _angle_cmp(p, q):
+    u, v = p.direction, q.direction
+    half_u = 0 if u[1] > 0 or (u[1] == 0 and u[0] > 0) else 1
+    half_v = 0 if v[1] > 0 or (v[1] == 0 and v[0] > 0) else 1
+    if half_u != half_v:
+        return half_u - half_v
+    cross = _cross(u, v)
+    return -1 if cross > 0 else 1 if cross < 0 else 0
+
+
+# пересечение границ двух непараллельных полуплоскостей (Крамер)
+def _meet(p, q):
+    det = p.a * q.b - q.a * p.b
+    x = (p.c.scale(q.b) - q.c.scale(p.b)).div(det)
+    y = (q.c.scale(p.a) - p.c.scale(q.a)).div(det)
+    return x, y
+
+
+# допустимая область задачи с двумя переменными: выпуклый многоугольник,
+# отрезок, луч, точка или неограниченная область. outline - точки границы
+# по порядку в виде (p, q): точка p + q * M при M -> бесконечности (q = 0 -
+# обычная вершина, иначе q - направление, в котором область уходит
+# в бесконечность)
+class Region:
+    def __init__(self, outline=(), eps=0):
+        self.outline = list(outline)
+        self._eps = eps
+
+    def _zero(self, q):
+        return abs(q[0]) <= self._eps and abs(q[1]) <= self._eps
+
+    @property
+    def status(self):
+        if not self.outline:
+            return "empty"
+        if all(self._zero(q) for _, q in self.outline):
+            return "bounded"
+        return "unbounded"
+
+    # вершины (конечные точки границы) по порядку обхода
+    @property
+    def vertices(self):
+        return [p for p, q in self.outline if self._zero(q)]
+
+    # направления неограниченности: область = conv(вершины) + cone(направления)
+    @property
+    def directions(self):
+        return [q for _, q in self.outline if not self._zero(q)]
+
+    # многоугольник для рисования: бесконечные точки на расстоянии ~size
+    def polygon(self, size):
+        return [(p[0] + q[0] * size, p[1] + q[1] * size) for p, q in self.outline]
+
+    # оптимум линейной функции c по области: статус ("optimal",
+    # "unbounded" или "infeasible"), точка и значение. если оптимальна
+    # целая прямая без вершин, берется середина между ее концами
+    def optimize(self, c, minimize=True):
+        if not self.outline:
+            return "infeasible", None, None
+        eps, sign = self._eps, 1 if minimize else -1
+        rated = [(sign * _dot(c, q), sign * _dot(c, p), p, q) for p, q in self.outline]
+        if any(growth < -eps for growth, _, _, _ in rated):
+            return "unbounded", None, None
+        rated = [item for item in rated if item[0] <= eps]
+        best = min(value for _, value, _, _ in rated)
+        optimal = [(p, q) for _, value, p, q in rated if value <= best + eps]
+        point = next((p for p, q in optimal if self._zero(q)), None)
+        if point is None:
+            for p1, q1 in optimal:
+                for p2, q2 in optimal:
+                    if self._zero((q1[0] + q2[0], q1[1] + q2[1])):
+                        point = ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2)
+                        break
+                if point is not None:
+                    break
+        return "optimal", point, _dot(c, point)
+
+
+# пересечение полуплоскостей за O(n log n): сортировка по углу и дек
+# (лишние с конца и начала выбрасываются, пока их вершина вне новой).
+# плоскость ограничена квадратом |x|, |y| <= M с символьным M, поэтому
+# неограниченная область получается точно, а не обрезкой окна.
+# генератор: перед каждой полуплоскостью отдает (сколько уже добавлено,
+# сколько всего), граница области - возвращаемое значение
+def _intersect(planes, eps):
+    # стороны квадрата - в тех же числах, что и задача (int / int дал бы float)
+    one, zero = (Fraction(1), Fraction(0)) if eps == 0 else (1.0, 0.0)
+    big = _Big(zero, one)
+    planes = [_Plane(a, b, _Big(c)) for a, b, c in planes] + [
+        _Plane(one, zero, big),
+        _Plane(-one, zero, big),
+        _Plane(zero, one, big),
+        _Plane(zero, -one, big),
+    ]
+    planes.sort(key=cmp_to_key(_angle_cmp))
+    dq = deque()
+    for k, plane in enumerate(planes):
+        yield k, len(planes)
+        while len(dq) > 1 and plane.out(_meet(dq[-1], dq[-2]), eps):
+            dq.pop()
+        while len(dq) > 1 and plane.out(_meet(dq[0], dq[1]), eps):
+            dq.popleft()
+        if dq and abs(_cross(plane.direction, dq[-1].direction)) <= eps:
+            # противоположные соседи - пересечение пусто (совпадающие
+            # границы разобраны раньше как равенства)
+            if _dot(plane.direction, dq[-1].direction) < 0:
+                return []
+            if not plane.out(dq[-1].point(), eps):
+                continue  # та же граница или слабее
+            dq.pop()
+        dq.append(plane)
+    while len(dq) > 2 and dq[0].out(_meet(dq[-1], dq[-2]), eps):
+        dq.pop()
+    while len(dq) > 2 and dq[-1].out(_meet(dq[0], dq[1]), eps):
+        dq.popleft()
+    if len(dq) < 3:
+        return []
+    # при пустом пересечении дек может дать ложный многоугольник, но
+    # тогда любая его вершина нарушает какое-то ограничение
+    vertex = _meet(dq[0], dq[1])
+    if any(plane.out(vertex, eps) for plane in planes):
+        return []
+    outline = []
+    for k in range(len(dq)):
+        following = dq[(k + 1) % len(dq)]
+        if abs(_cross(dq[k].direction, following.direction)) <= eps:
+            return []
+        x, y = _meet(dq[k], following)
+        point = ((x.value, y.value), (x.inf, y.inf))
+        if not outline or not _same(outline[-1], point, eps):
+            outline.append(point)
+    if len(outline) > 1 and _same(outline[0], outline[-1], eps):
+        outline.pop()
+    return outline
+
+
+def _same(u, v, eps):
+    return all(
+        abs(a - b) <= eps for a, b in zip(u[0] + u[1], v[0] + v[1])
+    )
+
+
+# область на прямой a x + b y = c: точка p0 + t d, t из отрезка, который
+# вырезают остальные полуплоскости
+def _on_line(line, planes, eps):
+    a, b, c = line
+    norm = a * a + b * b
+    start, d = (a * c / norm, b * c / norm), (-b, a)
+    low, high = None, None
+    for pa, pb, pc in planes:
+        k = pa * d[0] + pb * d[1]
+        rest = pc - pa * start[0] - pb * start[1]
+        if abs(k) <= eps:
+            if rest < -eps:
+                return []
+            continue
+        t = rest / k
+        if k > 0:
+            high = t if high is None else min(high, t)
+        else:
+            low = t if low is None else max(low, t)
+    if low is not None and high is not None and low > high + eps:
+        return []
+
+    def at(t):
+        return (start[0] + t * d[0], start[1] + t * d[1]), (0, 0)
+
+    first = at(low) if low is not None else (start, (-d[0], -d[1]))
+    last = at(high) if high is not None else (start, d)
+    if low is not None and high is not None and high - low <= eps:
+        return [first]
+    return [first, last]
+
+
+# допустимая область по ограничениям графического метода
+# ({"coeff": [a, b], "type": "<=" / ">=" / "=", "value": c}) и границам
+# переменных [(нижняя, верхняя), ...] (None - нижняя 0 / верхней нет; по
+# умолчанию x >= 0). с обыкновенными дробями все вычисления точные
+def feasible_region(constraints, bounds=None):
+    steps = feasible_region_steps(constraints, bounds)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+# то же по шагам, для фонового потока: отдает ход пересечения
+# полуплоскостей (см. _intersect), область - возвращаемое значение
+def feasible_region_steps(constraints, bounds=None):
+    values = [x for constr in constraints for x in constr["coeff"]]
+    values += [constr["value"] for constr in constraints]
+    values += [x for pair in bounds or [] for x in pair if x is not None]
+    exact = all(isinstance(x, (int, Fraction)) for x in values)
+    number = Fraction if exact else float
+    eps = 0 if exact else 1e-9
+
+    raw = []  # a x + b y <= c
+    for constr in constraints:
+        constr_type = CONSTRAINT_TYPES[constr["type"]]
+        a, b = (number(x) for x in constr["coeff"])
+        c = number(constr["value"])
+        if constr_type != "≥":
+            raw.append((a, b, c))
+        if constr_type != "≤":
+            raw.append((-a, -b, -c))
+    for k, (low, high) in enumerate(bounds or [(None, None)] * 2):
+        unit = (number(1), number(0)) if k == 0 else (number(0), number(1))
+        raw.append((-unit[0], -unit[1], -number(low or 0)))
+        if high is not None:
+            raw.append((unit[0], unit[1], number(high)))
+
+    # нормировка: max(|a|, |b|) = 1, из параллельных сонаправленных остается
+    # самая сильная; 0 <= c проверяется сразу
+    strongest = {}
+    for a, b, c in raw:
+        scale = max(abs(a), abs(b))
+        if scale <= eps:
+            if c < -eps:
+                return Region(eps=eps)
+            continue
+        key = (a / scale, b / scale)
+        if not exact:
+            key = (round(key[0], 12), round(key[1], 12))
+        if key not in strongest or c / scale < strongest[key]:
+            strongest[key] = c / scale
+    planes = [(a, b, c) for (a, b), c in strongest.items()]
+
+    # противоположные полуплоскости: полоса, пустое множество или прямая
+    # (равенство - тогда область лежит на этой прямой)
+    lines = []
+    for (a, b), c in strongest.items():
+        opposite = strongest.get((-a, -b))
+        if opposite is None:
+            continue
+        if c + opposite < -eps:
+            return Region(eps=eps)
+        if c + opposite <= eps:
+            lines.append((a, b, c))
+    if lines:
+        return Region(_on_line(lines[0], planes, eps), eps)
+    return Region((yield from _intersect(planes, eps)), eps)
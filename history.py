@@ -0,0 +1,32 @@
+# история шагов для отмены: вместо копии всей таблицы на каждом шаге
+# хранится только опорный элемент и то, что вернул step (удаленная
+# колонка и т.п.). жорданово исключение обратимо - повторный шаг на том
+# же месте возвращает прежнюю таблицу
+class TableHistory:
+    def __init__(self):
+        self._steps = []  # [i, j, изменения шага, базисная таблица]
+
+    def record_step(self, index_i, index_j, change):
+        self._steps.append([index_i, index_j, change, None])
+
+    # переход к симплекс-таблице меняет строку F, поэтому на границе фаз
+    # запоминаем копию базисной таблицы после последнего шага
+    def record_phase(self, basic_table):
+        self._steps[-1][3] = basic_table
+
+    def undo(self, table):
+        index_i, index_j, change, basic_table = self._steps.pop()
+        if basic_table is not None:
+            table = basic_table
+        table.unstep(index_i, index_j, change)
+        return table
+
+    # после пересчета двойственным методом прежние шаги к таблице не относятся
+    def clear(self):
+        self._steps = []
+
+    def __len__(self):
+        return len(self._steps)
+
+    def is_empty(self):
+        return len(self._steps) == 0
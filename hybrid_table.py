@@ -0,0 +1,101 @@
+from fractions import Fraction
+from bareiss_table import BareissBasicTable
+from float_table import FloatBasicTable
+from pricing import get_rule
+from problem import to_float
+
+FLOAT_LIMIT = 20
+
+
+# гибрид: сначала задача решается в float, затем найденный базис строится
+# точно (одно приведение Гаусса-Жордана в дробях через basis=) и дальше
+# все как у BareissBasicTable: run_simplex проверяет допустимость и оценки
+# и, если базис не оптимален, продолжает точные шаги с него. базисные,
+# которые точно оказались вне границ (float накопил ошибку), из базиса
+# убираются, и вспомогательная задача решается только для их строк.
+# решение с нуля - только если точно базис вырожден
+class HybridBasicTable(BareissBasicTable):
+    _warm_flipped = frozenset()  # переменные, замененные в float на u - x
+    _repair_basis = True
+
+    def __init__(
+        self,
+        minmax,
+        matrix=None,
+        basic_func=None,
+        bounds=None,
+        types=None,
+        basis=None,
+    ):
+        status, pivots, float_time, warm, flipped = self._float_basis(
+            minmax, matrix, basic_func, bounds, types, basis
+        )
+        # float_status, float_pivots, float_time, warm_start, repaired
+        # (сколько базисных убрано как недопустимые) - для solve
+        self.hybrid = {
+            "float_status": status,
+            "float_pivots": pivots,
+            "float_time": float_time,
+            "warm_start": False,
+            "repaired": 0,
+        }
+        if warm:
+            self._warm_flipped = flipped
+            try:
+                super().__init__(minmax, matrix, basic_func, bounds, types, warm)
+                self.hybrid["warm_start"] = True
+                self.hybrid["repaired"] = len(warm) - len(self._basis)
+                return
+            except ValueError:  # точно столбцы базиса линейно зависимы
+                self._warm_flipped = frozenset()
+                self._flipped, self._basis = frozenset(), {}
+        super().__init__(minmax, matrix, basic_func, bounds, types, basis)
+
+    # переменные, которые float-решение держит на верхней границе, заранее
+    # заменяются на u - x прямо в матрице (столбец меняет знак, из b
+    # вычитается a * u), иначе базис с ними за границами не примется
+    def _set_basis(self, basis):
+        if self._warm_flipped:
+            self.matrix = [[Fraction(x) for x in row] for row in self.matrix]
+            for label in self._warm_flipped:
+                bound = self.upper[label]
+                for row in self.matrix:
+                    row[-1] -= row[label - 1] * bound
+                    row[label - 1] = -row[label - 1]
+            self._flipped = self._warm_flipped
+        super()._set_basis(basis)
+
+    # статус, число шагов, время шагов, базис (без искусственных) и
+    # замененные на u - x после решения в float. по правилу Данцига
+    # вырожденная задача может зациклиться, поэтому шагов не больше
+    # FLOAT_LIMIT * (строк + столбцов), дальше - решение точно с нуля
+    @staticmethod
+    def _float_basis(minmax, matrix, basic_func, bounds, types, basis):
+        from solver import run_simplex
+
+        if bounds is not None:
+            bounds = [
+                tuple(None if x is None else to_float(x) for x in pair)
+                for pair in bounds
+            ]
+        try:
+            table = FloatBasicTable(
+                minmax,
+                [[to_float(x) for x in row] for row in matrix],
+                [to_float(x) for x in basic_func],
+                bounds,
+                types,
+                basis,
+            )
+            status, table, pivots, times = run_simplex(
+                table,
+                get_rule("dantzig"),
+                limit=FLOAT_LIMIT * (len(matrix) + len(basic_func)),
+            )
+        except (ValueError, ArithmeticError):
+            return None, 0, 0.0, None, frozenset()
+        if status == "limit":
+            return None, pivots, sum(times), None, frozenset()
+        size = len(table.get_basic_func())
+        basic = [label for label in table._column if label <= size]
+        return status, pivots, sum(times), basic, frozenset(table._flipped)
@@ -0,0 +1,260 @@
+import numpy as np
+from fractions import Fraction
+from gauss_method import gauss_jordan
+from problem import CONSTRAINT_TYPES, add_slacks
+
+
+# задача после упрощения и все, что нужно, чтобы вернуть ответ к исходным
+# переменным. status: "reduced" - решать basic_func/matrix/bounds,
+# "infeasible"/"unbounded" - ясно без симплекс-метода, "optimal" - все
+# переменные уже найдены (ответ postsolve([]))
+class ReducedTask:
+    def __init__(self, size, rows):
+        self.size = size  # исходные число переменных и ограничений
+        self.rows = rows
+        self.status = "reduced"
+        self.basic_func, self.matrix, self.bounds = [], [], None
+        self.types = None  # типы оставшихся ограничений, если есть ≤ и ≥
+        self.fixed = {}  # номер исходной переменной -> значение
+        self.columns = []  # исходные номера оставшихся переменных
+        self.constraints = []  # исходные номера оставшихся ограничений
+        self.slacks = {}  # дополнительные переменные исходной задачи
+        self.scale = None  # множители переменных после масштабирования
+
+    @property
+    def removed_rows(self):
+        return self.rows - len(self.constraints)
+
+    @property
+    def removed_cols(self):
+        return self.size - len(self.columns)
+
+    # начальный базис исходной задачи -> базис упрощенной: убранные
+    # переменные пропускаются, дополнительные перенумеровываются
+    def map_basis(self, basis):
+        if isinstance(basis, str):
+            return basis
+        labels = {j + 1: k + 1 for k, j in enumerate(self.columns)}
+        rows = [
+            i for i, t in zip(self.constraints, self.types or []) if t != "="
+        ]
+        for k, i in enumerate(rows):
+            labels[self.slacks[i][0]] = len(self.columns) + k + 1
+        return [labels[label] for label in basis if label in labels]
+
+    # ответ упрощенной задачи -> значения всех исходных переменных
+    def postsolve(self, answer):
+        x = [0] * self.size
+        for j, value in self.fixed.items():
+            if j < self.size:  # не дополнительная переменная
+                x[j] = value
+        for k, j in enumerate(self.columns):
+            x[j] = answer[k] if self.scale is None else answer[k] * self.scale[k]
+        return x
+
+
+# числа numpy -> числа Python (Fraction от np.int64 переполняется)
+def _item(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# множители 2^k (умножение на них в float без ошибок округления), чтобы
+# ненулевые в строках и столбцах были порядка 1: среднее геометрическое
+# наибольшего и наименьшего по модулю, несколько проходов.
+# CSR масштабируется на месте по хранимым элементам
+def _equilibrate(matrix, passes=4):
+    sparse = hasattr(matrix, "tocsr")
+    rows, cols = np.ones(matrix.shape[0]), np.ones(matrix.shape[1])
+    for _ in range(passes):
+        for axis, scale in ((1, rows), (0, cols)):
+            if sparse:
+                high, low = _sparse_extremes(matrix, axis)
+            else:
+                values = np.abs(matrix)
+                high = values.max(axis=axis)
+                low = np.where(values > 0, values, np.inf).min(axis=axis)
+            factor = np.ones_like(high)
+            mask = high > 0
+            factor[mask] = 2.0 ** -np.round(np.log2(np.sqrt(high[mask] * low[mask])))
+            scale *= factor
+            if sparse and axis == 1:
+                matrix.data *= np.repeat(factor, np.diff(matrix.indptr))
+            elif sparse:
+                matrix.data *= factor[matrix.indices]
+            else:
+                matrix *= factor[:, None] if axis == 1 else factor
+    return rows, cols
+
+
+# наибольший и наименьший по модулю ненулевой в строках (axis=1) или
+# столбцах (axis=0) CSR-матрицы; где ненулевых нет - 0 и inf
+def _sparse_extremes(matrix, axis):
+    values = abs(matrix)
+    high = values.max(axis=axis).toarray().ravel()
+    values.data = 1 / values.data
+    inverse = values.max(axis=axis).toarray().ravel()
+    low = np.full(len(inverse), np.inf)
+    np.divide(1, inverse, out=low, where=inverse > 0)
+    return high, low
+
+
+# какие элементы a[rows, cols] ненулевые: число в строках, столбец
+# единственного в строке и есть ли ненулевые в столбцах
+def _support(a, rows, cols, eps):
+    if not cols:
+        empty = np.zeros(len(rows), dtype=int)
+        return empty, empty, np.zeros(0, dtype=bool)
+    if hasattr(a, "tocsr"):
+        support = abs(a[rows][:, cols]) > eps
+        counts = np.asarray(support.sum(axis=1)).ravel()
+        single = np.asarray(support.argmax(axis=1)).ravel()
+        used = np.asarray(support.sum(axis=0)).ravel() > 0
+        return counts, single, used
+    support = (np.abs(a[np.ix_(rows, cols)]) > eps).astype(bool)
+    return support.sum(axis=1), support.argmax(axis=1), support.any(axis=0)
+
+
+# упрощение задачи в равенствах перед методом искусственного базиса:
+# закрепленные переменные (l = u) и одиночные строки (a x_j = b) подставляются,
+# пустые строки и линейно зависимые равенства удаляются, пустые столбцы
+# закрепляются на выгодной границе. scale - уравновесить масштабы строк и
+# столбцов (для float). неравенства (types) упрощаются как равенства с
+# дополнительными переменными, оставшиеся снова становятся неравенствами.
+# разреженная матрица (CSR, float) остается разреженной до конца, кроме
+# поиска линейно зависимых равенств (Гаусс-Жордан плотный) - их для CSR
+# оставляем методу искусственного базиса
+def reduce_task(
+    basic_func, matrix, minmax, bounds=None, scale=False, types=None
+):
+    sparse = hasattr(matrix, "tocsr")
+    size = len(basic_func)
+    slacks = {}
+    if types and any(CONSTRAINT_TYPES[t] != "=" for t in types):
+        if sparse:
+            from sparse_table import add_sparse_slacks
+
+            matrix, slacks = add_sparse_slacks(matrix, types)
+        else:
+            matrix, slacks = add_slacks(matrix, types)
+        basic_func = list(basic_func) + [0] * len(slacks)
+    if sparse:
+        exact, number, dtype, eps = False, float, float, 1e-9
+        matrix = matrix.tocsc().astype(float)
+        a, b = matrix[:, :-1], matrix[:, -1].toarray().ravel()
+    else:
+        values = np.array(matrix)
+        exact = values.dtype.kind in "Oi"
+        number = Fraction if exact else float
+        dtype = object if exact else float
+        eps = 0 if exact else 1e-9
+        values = np.array(
+            [[number(_item(x)) for x in row] for row in values], dtype=dtype
+        )
+        a, b = values[:, :-1], values[:, -1].copy()
+    rows_count, width = a.shape
+    costs = [number(c) if minmax == "min" else -number(c) for c in basic_func]
+    lower = [number(0)] * width
+    upper = [None] * width
+    for j, (low, high) in enumerate(bounds or []):
+        lower[j] = number(0) if low is None else number(low)
+        upper[j] = None if high is None else number(high)
+
+    task = ReducedTask(size, rows_count)
+    task.slacks = slacks
+    rows, cols = list(range(rows_count)), list(range(width))
+
+    # у CSC - только по ненулевым столбца (b убранных строк уже не нужен)
+    def fix(j, value):
+        if sparse:
+            part = slice(a.indptr[j], a.indptr[j + 1])
+            b[a.indices[part]] -= a.data[part] * value
+        else:
+            for i in rows:
+                b[i] -= a[i, j] * value
+        cols.remove(j)
+        task.fixed[j] = value
+
+    changed = True
+    while changed:
+        changed = False
+        for j in list(cols):
+            if upper[j] is None or upper[j] - lower[j] > eps:
+                continue
+            if upper[j] < lower[j] - eps:
+                task.status = "infeasible"
+                return task
+            fix(j, lower[j])
+        counts, single, _ = _support(a, rows, cols, eps)
+        singles = [
+            (rows[k], cols[single[k]] if counts[k] else None)
+            for k in np.flatnonzero(counts <= 1)
+        ]
+        for i, j in singles:
+            if j is None:  # 0 = b
+                if abs(b[i]) > eps:
+                    task.status = "infeasible"
+                    return task
+                rows.remove(i)
+                continue
+            if j not in cols:  # закреплена другой строкой этого прохода
+                changed = True
+                continue
+            value = b[i] / a[i, j]
+            if value < lower[j] - eps or (
+                upper[j] is not None and value > upper[j] + eps
+            ):
+                task.status = "infeasible"
+                return task
+            rows.remove(i)
+            fix(j, value)
+            changed = True
+        # пустой столбец: на нижней границе, если ц.ф. от нее не убывает,
+        # иначе на верхней; без верхней - оставляем симплекс-методу
+        _, _, used = _support(a, rows, cols, eps)
+        for j in [cols[k] for k in np.flatnonzero(~used)]:
+            if costs[j] >= 0:
+                fix(j, lower[j])
+            elif upper[j] is not None:
+                fix(j, upper[j])
+
+    # линейно зависимые равенства: совместные удаляем, иначе задача несовместна
+    if rows and cols and not sparse:
+        system = np.hstack([a[np.ix_(rows, cols)], b[rows][:, None]])
+        system, rank, _, order = gauss_jordan(system, len(cols), eps or None)
+        if np.any(np.abs(system[rank:, -1]) > eps * 1000):
+            task.status = "infeasible"
+            return task
+        rows = [rows[k] for k in sorted(order[:rank])]
+
+    # дополнительная переменная остается только вместе со своей строкой
+    if slacks:
+        task.types = [
+            CONSTRAINT_TYPES[types[i]] if i in slacks else "=" for i in rows
+        ]
+        cols = [j for j in cols if j < size]
+    task.columns, task.constraints = cols, rows
+    if not rows:
+        task.status = "unbounded" if cols else "optimal"
+        return task
+
+    a = a[rows][:, cols].tocsr() if sparse else a[np.ix_(rows, cols)]
+    b = b[rows]
+    c = np.array([basic_func[j] for j in cols], dtype=dtype)
+    low = np.array([lower[j] for j in cols], dtype=dtype)
+    high = [upper[j] for j in cols]
+    if scale and not exact:
+        row_scale, task.scale = _equilibrate(a)
+        b = b * row_scale
+        c = c * task.scale
+        low = low / task.scale
+        high = [None if u is None else u / s for u, s in zip(high, task.scale)]
+    task.basic_func = c.tolist()
+    if sparse:
+        import scipy.sparse as sp
+
+        task.matrix = sp.hstack([a, sp.csr_matrix(b[:, None])], format="csr")
+    else:
+        task.matrix = np.hstack([a, b[:, None]]).tolist()
+    if any(x != 0 for x in low) or any(u is not None for u in high):
+        task.bounds = list(zip(low.tolist(), high))
+    return task
@@ -0,0 +1,189 @@
+import math
+
+
+# правила выбора опорного элемента при автоматическом шаге.
+# choose() выбирает среди найденных serch (table.verios), update()
+# вызывается таблицей перед каждым шагом, columns() - какие столбцы
+# вообще проверять (нужно модифицированному методу, который считает
+# столбцы таблицы по одному), costs - строка оценок в float.
+# numpy импортируется в методах: без него solver.py запускается быстрее
+class PricingRule:
+    name = ""
+    title = ""
+
+    def columns(self, table, costs):
+        import numpy as np
+
+        return np.flatnonzero(costs < -table._eps)
+
+    def choose(self, table):
+        return table.verios[0]
+
+    def update(self, table, index_i, index_j):
+        pass
+
+
+# наибольшая по модулю отрицательная оценка
+class DantzigRule(PricingRule):
+    name = "dantzig"
+    title = "Наименьшая оценка (Данциг)"
+
+    def columns(self, table, costs):
+        import numpy as np
+
+        return np.array([costs.argmin()])
+
+    def choose(self, table):
+        return min(table.verios, key=lambda v: table.get_cost(v[1]))
+
+
+# наименьший номер вводимой и выводимой переменной, не зацикливается.
+# с верхними границами выводимая - тоже наименьший номер среди строк с
+# минимальным отношением (и сама вводимая, если первой упирается она)
+class BlandRule(PricingRule):
+    name = "bland"
+    title = "Правило Бленда"
+
+    def columns(self, table, costs):
+        import numpy as np
+
+        columns = super().columns(table, costs)
+        labels = np.array(table._line)[columns]
+        return columns[[labels.argmin()]]
+
+    def choose(self, table):
+        index_i, index_j = min(table.verios, key=lambda v: table._line[v[1]])
+        eps = getattr(table, "_eps", 0)
+        if table.upper:
+            ratios, limit = table._bounded_ratios(index_j, table._row_upper())
+            best = min(min(ratios, default=math.inf), limit)
+            rows = [
+                (table._column[i], i)
+                for i in range(len(ratios))
+                if ratios[i] <= best + eps
+            ]
+            if limit <= best + eps:
+                rows.append((table._line[index_j], table.length - 1))
+            return [min(rows)[1], index_j]
+        # из строк с тем же минимальным отношением - меньший номер
+        column, rhs = table.get_column(index_j), table.get_rhs()
+        best = rhs[index_i] / column[index_i]
+        rows = [
+            i
+            for i in range(len(column))
+            if column[i] > eps and rhs[i] / column[i] <= best + eps
+        ]
+        return [min(rows, key=lambda i: table._column[i]), index_j]
+
+
+# оценка, деленная на длину ребра: |c_j|^2 / (1 + |a_j|^2)
+class SteepestEdgeRule(PricingRule):
+    name = "steepest"
+    title = "Наискорейшее ребро"
+
+    def choose(self, table):
+        return max(table.verios, key=lambda v: self._score(table, v[1]))
+
+    @staticmethod
+    def _score(table, index_j):
+        import numpy as np
+
+        column = np.asarray(table.get_column(index_j), dtype=float)
+        return float(table.get_cost(index_j)) ** 2 / (1 + column @ column)
+
+
+# приближение наискорейшего ребра: веса столбцов пересчитываются
+# по опорной строке, без вычисления длин столбцов
+class DevexRule(PricingRule):
+    name = "devex"
+    title = "Devex"
+
+    def __init__(self):
+        self._weights = {}  # вес по номеру небазисной переменной
+
+    def _weight(self, label):
+        return self._weights.get(label, 1.0)
+
+    def columns(self, table, costs):
+        import numpy as np
+
+        columns = super().columns(table, costs)
+        weights = np.array([self._weight(table._line[j]) for j in columns])
+        return columns[[np.argmax(costs[columns] ** 2 / weights)]]
+
+    def choose(self, table):
+        return max(
+            table.verios,
+            key=lambda v: float(table.get_cost(v[1])) ** 2
+            / self._weight(table._line[v[1]]),
+        )
+
+    def update(self, table, index_i, index_j):
+        import numpy as np
+
+        row = np.asarray(table.get_row(index_i), dtype=float)
+        pivot = row[index_j]
+        entering = table._line[index_j]
+        weight = self._weight(entering)
+        for j in np.flatnonzero(row):
+            if j != index_j:
+                label = table._line[j]
+                self._weights[label] = max(
+                    self._weight(label), (row[j] / pivot) ** 2 * weight
+                )
+        self._weights.pop(entering, None)
+        self._weights[table._column[index_i]] = max(weight / pivot**2, 1.0)
+
+
+# частичный просмотр: столбцы делятся на участки, смотрим участок, с
+# которого продолжаем после прошлого шага, и идём дальше, только если
+# в нём нет кандидатов. для очень широких задач
+class PartialPricingRule(PricingRule):
+    name = "partial"
+    title = "Частичный просмотр"
+
+    def __init__(self, segment=None):
+        self.segment = segment  # по умолчанию ~ корень из числа столбцов
+        self._start = 0
+
+    # номера (в indices) тех столбцов, что попали в первый непустой участок
+    def _window(self, table, indices):
+        width = max(table.width - 1, 1)
+        size = self.segment or max(1, math.isqrt(width))
+        shifted = [(j - self._start) % width for j in indices]
+        first = min(shifted) // size
+        return [k for k, s in enumerate(shifted) if s // size == first]
+
+    def columns(self, table, costs):
+        columns = super().columns(table, costs)
+        columns = columns[self._window(table, columns)]
+        return columns[[costs[columns].argmin()]]
+
+    def choose(self, table):
+        window = self._window(table, [j for _, j in table.verios])
+        return min(
+            (table.verios[k] for k in window),
+            key=lambda v: table.get_cost(v[1]),
+        )
+
+    def update(self, table, index_i, index_j):
+        self._start = index_j + 1
+
+
+RULES = {
+    rule.name: rule
+    for rule in (
+        DantzigRule,
+        SteepestEdgeRule,
+        DevexRule,
+        BlandRule,
+        PartialPricingRule,
+    )
+}
+
+
+# у правил есть состояние (веса, участок), поэтому на задачу - новое
+def get_rule(name):
+    if name not in RULES:
+        raise ValueError(f"Неизвестное правило выбора: {name}")
+    return RULES[name]()
@@ -0,0 +1,176 @@
+import json
+from fractions import Fraction
+
+# обозначения типов ограничений, которые встречаются в файлах
+CONSTRAINT_TYPES = {
+    "=": "=",
+    "≤": "≤",
+    "<=": "≤",
+    "≥": "≥",
+    ">=": "≥",
+}
+
+
+# задача из JSON: {"function", "constraints": [{"coeffs", "type", "rhs"}], "minmax"}
+# и необязательно "bounds": [[нижняя, верхняя], ...], null - нет границы,
+# "basis": [номера начальных базисных переменных] или "crash"
+def read_json(file_path):
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# задача из текстового формата:
+# n m / коэф. ц.ф. / m строк "коэф. тип b" / min или max (необязательно).
+# после ограничений могут быть строки "lower l1 .. ln" и "upper u1 .. un"
+# (inf - нет верхней границы) и "basis j1 j2 .." (или "basis crash")
+def parse_text(lines):
+    lines = [line.strip() for line in lines if line.strip()]
+    first_line = lines[0].split()
+    if len(first_line) < 2:
+        raise ValueError(
+            "Первая строка должна содержать количество переменных и ограничений"
+        )
+
+    num_vars = int(first_line[0])
+    num_constraints = int(first_line[1])
+
+    if len(lines) < 2:
+        raise ValueError("Отсутствует строка с целевой функцией")
+
+    function = lines[1].split()
+    if len(function) != num_vars:
+        raise ValueError(
+            f"Ожидалось {num_vars} коэффициентов в целевой функции, получено {len(function)}"
+        )
+
+    constraints = []
+    for i, line in enumerate(lines[2:2 + num_constraints]):
+        parts = line.split()
+        if len(parts) != num_vars + 2:
+            raise ValueError(
+                f"Некорректный формат ограничения {i+1}: ожидалось {num_vars+2} элементов"
+            )
+        constraints.append(
+            {
+                "coeffs": parts[:num_vars],
+                "type": parts[num_vars],
+                "rhs": parts[num_vars + 1],
+            }
+        )
+
+    minmax = "max"  # по умолчанию максимизация
+    bounds = {}
+    basis = None
+    for line in lines[2 + num_constraints:]:
+        parts = line.lower().split()
+        if parts[0] in ["min", "max"]:
+            minmax = parts[0]
+        elif parts[0] == "basis":
+            basis = parse_basis(" ".join(parts[1:]))
+        elif parts[0] in ["lower", "upper"]:
+            if len(parts) != num_vars + 1:
+                raise ValueError(
+                    f"Ожидалось {num_vars} границ в строке {parts[0]}"
+                )
+            bounds[parts[0]] = [None if x == "inf" else x for x in parts[1:]]
+
+    data = {"function": function, "constraints": constraints, "minmax": minmax}
+    if bounds:
+        lower = bounds.get("lower", [None] * num_vars)
+        upper = bounds.get("upper", [None] * num_vars)
+        data["bounds"] = [list(pair) for pair in zip(lower, upper)]
+    if basis is not None:
+        data["basis"] = basis
+    return data
+
+
+def read_task(file_path):
+    if file_path.endswith(".json"):
+        return read_json(file_path)
+    with open(file_path, "r", encoding="utf-8") as f:
+        return parse_text(f.readlines())
+
+
+# десятичное число из строки любого вида ("3", "1.5", "9/2")
+def to_float(value):
+    return float(Fraction(value))
+
+
+# приводим задачу к виду для таблиц: коэф. ц.ф., строки [коэф. | b], типы
+def task_to_matrix(data, number=Fraction):
+    function = data.get("function", [])
+    constraints = data.get("constraints", [])
+    if len(function) == 0 or len(constraints) == 0:
+        raise ValueError("Некорректная задача: пустая функция или ограничения")
+
+    basic_func = [number(x) for x in function]
+    matrix, types = [], []
+    for row, constr in enumerate(constraints):
+        coeffs = constr.get("coeffs", [])
+        if len(coeffs) != len(function):
+            raise ValueError(
+                f"Несоответствие числа переменных в ограничении {row + 1}"
+            )
+        constr_type = constr.get("type", "=")
+        if constr_type not in CONSTRAINT_TYPES:
+            raise ValueError(
+                f"Неизвестный тип ограничения {row + 1}: {constr_type}"
+            )
+        matrix.append([number(x) for x in coeffs] + [number(constr.get("rhs", "0"))])
+        types.append(CONSTRAINT_TYPES[constr_type])
+    return basic_func, matrix, data.get("minmax", "max"), types
+
+
+# неравенства -> равенства: к строке добавляется +s (≤) или -s (≥), s >= 0 -
+# новая переменная после исходных (номера по порядку строк). возвращает
+# строки [коэф. | b] с новыми столбцами и {строка: (номер переменной, коэф.)}
+def add_slacks(matrix, types):
+    size = len(matrix[0]) - 1
+    rows = [i for i, t in enumerate(types) if CONSTRAINT_TYPES[t] != "="]
+    slacks = {
+        i: (size + k + 1, 1 if CONSTRAINT_TYPES[types[i]] == "≤" else -1)
+        for k, i in enumerate(rows)
+    }
+    extended = []
+    for i, row in enumerate(matrix):
+        extra = [0] * len(rows)
+        if i in slacks:
+            label, coef = slacks[i]
+            extra[label - size - 1] = coef
+        extended.append(list(row[:-1]) + extra + [row[-1]])
+    return extended, slacks
+
+
+# границы переменных [(нижняя, верхняя), ...] или None, если их нет
+def task_bounds(data, number=Fraction):
+    bounds = data.get("bounds")
+    if not bounds:
+        return None
+    if len(bounds) != len(data.get("function", [])):
+        raise ValueError("Число границ не совпадает с числом переменных")
+    return [
+        tuple(None if x is None else number(x) for x in pair)
+        for pair in bounds
+    ]
+
+
+# начальный базис из строки: "crash" или номера переменных через пробел
+# или запятую ("1, 4, 5"); пустая строка - None (искусственный базис)
+def parse_basis(text):
+    text = text.strip()
+    if not text:
+        return None
+    if text.lower() == "crash":
+        return "crash"
+    try:
+        return [int(x) for x in text.replace(",", " ").split()]
+    except ValueError:
+        raise ValueError(f"Некорректный начальный базис: {text}")
+
+
+# начальный базис задачи или None
+def task_basis(data):
+    basis = data.get("basis")
+    if basis is None or isinstance(basis, str):
+        return parse_basis(basis or "")
+    return [int(x) for x in basis]
@@ -0,0 +1,273 @@
+import numpy as np
+from Table import Table, BasicTable, SimplexTable
+
+
+# LU-разложение с выбором ведущего элемента: B[perm] = L @ U
+def lu_factor(matrix):
+    size = len(matrix)
+    upper = np.array(matrix, dtype=float)
+    lower = np.eye(size)
+    perm = np.arange(size)
+    for k in range(size):
+        pivot = k + np.argmax(np.abs(upper[k:, k]))
+        if abs(upper[pivot, k]) < 1e-12:
+            raise ValueError("Базисная матрица вырождена")
+        if pivot != k:
+            upper[[k, pivot]] = upper[[pivot, k]]
+            lower[[k, pivot], :k] = lower[[pivot, k], :k]
+            perm[[k, pivot]] = perm[[pivot, k]]
+        lower[k + 1:, k] = upper[k + 1:, k] / upper[k, k]
+        upper[k + 1:, k:] -= np.outer(lower[k + 1:, k], upper[k, k:])
+    return lower, upper, perm
+
+
+# модифицированный симплекс-метод: матрица ограничений не меняется,
+# хранится LU базиса и мультипликативные поправки (eta) между пересчётами
+class RevisedTable(Table):
+    _eps = 1e-9
+    _refactor_every = 50  # через сколько шагов заново раскладывать базис
+
+    # полная симплекс-таблица только для вывода, считается по запросу
+    @property
+    def table(self):
+        if getattr(self, "_A", None) is None:
+            return None
+        line = np.array(self._line, dtype=int) - 1
+        table = np.empty(shape=(self.length, self.width))
+        table[:-1, :-1] = self._ftran(self._A[:, line])
+        table[:-1, -1] = self._x
+        table[-1, :-1] = self._reduced_costs()
+        table[-1, -1] = -(self._basic_costs() @ self._x)
+        return table
+
+    @table.setter
+    def table(self, value):
+        if value is not None:
+            raise AttributeError("таблица не хранится в модифицированном методе")
+
+    # прямой ход: B^-1 @ rhs (rhs - вектор или матрица столбцов)
+    def _ftran(self, rhs):
+        lower, upper, perm = self._lu
+        z = np.array(rhs, dtype=float)[perm]
+        for k in range(1, len(z)):
+            z[k] -= lower[k, :k] @ z[:k]
+        for k in range(len(z) - 1, -1, -1):
+            z[k] = (z[k] - upper[k, k + 1:] @ z[k + 1:]) / upper[k, k]
+        for r, d in self._etas:
+            zr = z[r] / d[r]
+            z -= np.multiply.outer(d, zr)
+            z[r] = zr
+        return z
+
+    # обратный ход: row @ B^-1
+    def _btran(self, row):
+        lower, upper, perm = self._lu
+        w = np.array(row, dtype=float)
+        for r, d in reversed(self._etas):
+            w[r] = (w[r] - (w @ d - w[r] * d[r])) / d[r]
+        for k in range(len(w)):
+            w[k] = (w[k] - upper[:k, k] @ w[:k]) / upper[k, k]
+        for k in range(len(w) - 1, -1, -1):
+            w[k] -= lower[k + 1:, k] @ w[k + 1:]
+        y = np.empty_like(w)
+        y[perm] = w
+        return y
+
+    def _refactor(self):
+        basis = self._A[:, np.array(self._column) - 1]
+        self._lu = lu_factor(basis)
+        self._etas = []
+        self._x = self._ftran(self._b)
+
+    def _basic_costs(self):
+        return self._costs[np.array(self._column) - 1]
+
+    # строка оценок (F) для небазисных переменных
+    def _reduced_costs(self):
+        if self._pricing is None:
+            line = np.array(self._line, dtype=int) - 1
+            y = self._btran(self._basic_costs())
+            self._pricing = self._costs[line] - y @ self._A[:, line]
+        return self._pricing
+
+    # столбец вводимой переменной B^-1 a_j
+    def _entering(self, index_j):
+        if index_j not in self._entering_cache:
+            label = self._line[index_j]
+            self._entering_cache[index_j] = self._ftran(self._A[:, label - 1])
+        return self._entering_cache[index_j]
+
+    # наиболее отрицательная оценка
+    def _choose_column(self):
+        costs = self._reduced_costs()
+        if len(costs) == 0 or costs.min() >= -self._eps:
+            return None
+        return int(costs.argmin())
+
+    # считаем только строку оценок и столбцы, которые отобрало правило
+    # выбора (без правила - один, с наименьшей оценкой)
+    def serch(self):
+        if self.upper:
+            return self._bounded_serch()
+        self.verios = []
+        index_j = self._choose_column()
+        if index_j is None:
+            columns = []
+        elif self.pricing is None:
+            columns = [index_j]
+        else:
+            columns = self.pricing.columns(self, self._reduced_costs())
+        for index_j in columns:
+            d = self._entering(int(index_j))
+            positive = d > self._eps
+            if positive.any():
+                ratios = np.full(len(d), np.inf)
+                np.divide(self._x, d, out=ratios, where=positive)
+                self.verios.append([int(ratios.argmin()), int(index_j)])
+        self.check_step = len(self.verios) == 0
+
+    def get_cost(self, index_j):
+        return self._reduced_costs()[index_j]
+
+    def get_costs(self):
+        return self._reduced_costs()
+
+    def get_column(self, index_j):
+        return self._entering(index_j)
+
+    # строка таблицы: e_i @ B^-1 @ A
+    def get_row(self, index_i):
+        unit = np.zeros(self.length - 1)
+        unit[index_i] = 1
+        line = np.array(self._line, dtype=int) - 1
+        return self._btran(unit) @ self._A[:, line]
+
+    def get_rhs(self):
+        return self._x
+
+    def get_objective(self):
+        return -(self._basic_costs() @ self._x)
+
+    def max_bits(self):
+        return None
+
+    # матрица задачи, LU базиса и поправки eta - вместо таблицы
+    def table_bytes(self):
+        lower, upper, perm = self._lu
+        return (
+            self._A.nbytes
+            + lower.nbytes
+            + upper.nbytes
+            + perm.nbytes
+            + sum(d.nbytes for _, d in self._etas)
+        )
+
+    def pivot(self, index_i, index_j):
+        d = self._entering(index_j)
+        theta = self._x[index_i] / d[index_i]
+        self._x -= theta * d
+        self._x[index_i] = theta
+        self._line[index_j], self._column[index_i] = (
+            self._column[index_i],
+            self._line[index_j],
+        )
+        self._etas.append((index_i, d))
+        if len(self._etas) >= self._refactor_every:
+            self._refactor()
+        self._pricing, self._entering_cache = None, {}
+
+    # из небазисных просто убираем искусственную переменную
+    def delete_column(self, index):
+        if index < 0 or index >= self.width:
+            return
+        if self._line[index] <= len(self.basic_func):
+            return
+        label = self._line.pop(index)
+        self.width -= 1
+        self._pricing, self._entering_cache = None, {}
+        return label, None
+
+    def insert_column(self, index, removed):
+        self._line.insert(index, removed[0])
+        self.width += 1
+        self._pricing, self._entering_cache = None, {}
+
+    # замена x = u - x' прямо в исходной задаче: столбец A и коэф. ц.ф.
+    # меняют знак, из b вычитается a * u
+    def _complement(self, label):
+        bound = self.upper[label]
+        self._b -= self._A[:, label - 1] * bound
+        self._A[:, label - 1] *= -1
+        self._costs[label - 1] *= -1
+        self._flipped = self._flipped ^ {label}
+
+    def _complement_column(self, index_j):
+        self._x -= self._entering(index_j) * self.upper[self._line[index_j]]
+        self._complement(self._line[index_j])
+        self._pricing, self._entering_cache = None, {}
+
+    # у базисной меняется знак столбца базиса: поправка eta с -1 на месте i
+    def _complement_row(self, index_i):
+        self._x[index_i] = self.upper[self._column[index_i]] - self._x[index_i]
+        self._complement(self._column[index_i])
+        unit = np.zeros(self.length - 1)
+        unit[index_i] = -1
+        self._etas.append((index_i, unit))
+        self._pricing, self._entering_cache = None, {}
+
+    def has_next_step(self):
+        return self._choose_column() is not None
+
+    # неограниченность проверяем по столбцу, который вводился бы в базис
+    def check_table(self):
+        if self.upper:
+            return self._bounded_check()
+        index_j = self._choose_column()
+        if index_j is None:
+            return False
+        return bool(np.all(self._entering(index_j) <= self._eps))
+
+
+class RevisedBasicTable(RevisedTable, BasicTable):
+    def set_full_task(self):
+        if self.minmax == "max":
+            self.basic_func = [-float(x) for x in self.basic_func]
+        else:
+            self.basic_func = [float(x) for x in self.basic_func]
+        matrix = np.array(self.matrix, dtype=float)
+        rows, width = matrix.shape
+        self._line, self._column, _ = self._start_basis(matrix[:, -1])
+        self.width = len(self._line) + 1
+        self.length = rows + 1
+        # если своб.член < 0 строку * (-1)
+        matrix[matrix[:, -1] < 0] *= -1
+        # исходная матрица с единичными столбцами искусственных переменных
+        self._A = np.hstack([matrix[:, :-1], np.eye(rows)])
+        self._b = matrix[:, -1].copy()
+        # вспомогательная задача: минимум суммы искусственных
+        self._costs = np.concatenate([np.zeros(width - 1), np.ones(rows)])
+        self._pricing, self._entering_cache = None, {}
+        self._refactor()
+
+    # сумма искусственных в базисе
+    def check_table(self):
+        return bool(self._basic_costs() @ self._x > self._eps)
+
+    def convert_to_simplex(self):
+        self._drive_out_artificials()
+        return self._carry_state(RevisedSimplexTable(self))
+
+
+class RevisedSimplexTable(RevisedTable, SimplexTable):
+    def __init__(self, basic_table):
+        self.basic_func = basic_table.get_basic_func()
+        self._line = basic_table._line
+        self._column = basic_table._column
+        self.width = basic_table.width
+        self.length = basic_table.length
+        self._class_type = "simplex"
+        self._A, self._b = basic_table._A, basic_table._b
+        self._lu, self._etas = basic_table._lu, list(basic_table._etas)
+        self._x = basic_table._x.copy()
+        self._costs = np.array(basic_table._phase_costs(), dtype=float)
+        self._pricing, self._entering_cache = None, {}
@@ -0,0 +1,152 @@
+import numpy as np
+from fractions import Fraction
+from gauss_method import gauss_pivot_func
+from problem import CONSTRAINT_TYPES, add_slacks
+
+
+# результат анализа чувствительности в исходных обозначениях задачи
+# (знаки для max уже пересчитаны). интервалы - пары (нижняя, верхняя),
+# None - нет границы
+class Sensitivity:
+    def __init__(
+        self,
+        answer,
+        objective,
+        reduced_costs,
+        cost_ranges,
+        shadow_prices,
+        rhs_ranges,
+    ):
+        self.answer = answer
+        self.objective = objective
+        self.reduced_costs = reduced_costs  # по переменным, у базисных 0
+        self.cost_ranges = cost_ranges  # коэф. ц.ф., при которых x* оптимален
+        self.shadow_prices = shadow_prices  # dF/db по ограничениям
+        self.rhs_ranges = rhs_ranges  # b, при которых базис не меняется
+
+
+def _lowest(values):
+    return max(values) if values else None
+
+
+def _highest(values):
+    return min(values) if values else None
+
+
+def _negate(value):
+    return None if value is None else -value
+
+
+# допустимый сдвиг всегда содержит 0: в float у вырожденного интервала
+# нулевой ширины отношения ~1e-14 могут дать low > 0 > high
+def _around_zero(low, high):
+    return (
+        None if low is None else min(low, 0),
+        None if high is None else max(high, 0),
+    )
+
+
+def _shift(value, delta):
+    return None if delta is None else value + delta
+
+
+# анализ по оптимальной симплекс-таблице без дополнительных шагов:
+# оценки и строки таблицы дают интервалы для коэффициентов ц.ф., а
+# обратная матрица базиса (по исходным ограничениям matrix) - двойственные
+# оценки и интервалы для правых частей. types - типы ограничений, как
+# при решении (у ≤ и ≥ дополнительные переменные в ответ не входят)
+def sensitivity(table, matrix, types=None):
+    if table.get_class_type() != "simplex" or table.has_next_step():
+        raise ValueError("Нужна оптимальная симплекс-таблица")
+    if table.upper:
+        raise ValueError(
+            "Анализ чувствительности с верхними границами переменных не поддерживается"
+        )
+    values = np.array(table.table)
+    exact = values.dtype == object
+    number = Fraction if exact else float
+    dtype = object if exact else float
+    eps = getattr(table, "_eps", 0)
+    sign = -1 if table.minmax == "max" else 1  # в таблице всегда min
+    basic_func = table.get_basic_func()
+    if types and any(CONSTRAINT_TYPES[t] != "=" for t in types):
+        matrix, _ = add_slacks(matrix, types)
+    size, rows = len(basic_func), len(matrix)
+    costs, rhs, body = values[-1, :-1], values[:-1, -1], values[:-1, :-1]
+
+    # базисная матрица по исходным ограничениям; у оставшейся искусственной
+    # столбец единичный (строки с b < 0 таблица умножала на -1)
+    lower = table.lower or {}
+    shifted = [
+        number(row[-1])
+        - sum(number(row[label - 1]) * low for label, low in lower.items())
+        for row in matrix
+    ]
+
+    def basis_column(label):
+        if label <= size:
+            return [number(row[label - 1]) for row in matrix]
+        column = [number(0)] * rows
+        i = label - size - 1
+        column[i] = number(1 if shifted[i] >= 0 else -1)
+        return column
+
+    identity = [[number(i == k) for k in range(rows)] for i in range(rows)]
+    basis = np.hstack(
+        [
+            np.array([basis_column(label) for label in table._column], dtype=dtype).T,
+            np.array(identity, dtype=dtype),
+        ]
+    )
+    inverse = gauss_pivot_func(basis)[:, rows:]
+    basic_costs = np.array(
+        [basic_func[label - 1] if label <= size else 0 for label in table._column],
+        dtype=dtype,
+    )
+    shadow_prices = [sign * y for y in inverse.T @ basic_costs]
+
+    # правая часть b_i + d: базисные x_B + d * B^-1 e_i должны остаться >= 0,
+    # а оставшиеся искусственные (зависимые строки) - равны 0
+    artificial = [k for k, label in enumerate(table._column) if label > size]
+    rhs_ranges = []
+    for i, row in enumerate(matrix):
+        column = inverse[:, i]
+        low = _lowest([-x / z for x, z in zip(rhs, column) if z > eps])
+        high = _highest([-x / z for x, z in zip(rhs, column) if z < -eps])
+        if any(abs(column[k]) > eps for k in artificial):
+            low = high = 0
+        low, high = _around_zero(low, high)
+        b = number(row[-1])
+        rhs_ranges.append((_shift(b, low), _shift(b, high)))
+
+    # коэффициенты ц.ф. в виде для min: небазисная остается вне базиса,
+    # пока оценка >= 0, у базисной сдвиг на d меняет оценки на -d * строку
+    reduced_costs = [number(0)] * size
+    ranges = [None] * size
+    for j, label in enumerate(table._line):
+        if label <= size:
+            reduced_costs[label - 1] = sign * costs[j]
+            ranges[label - 1] = _around_zero(-costs[j], None)
+    for i, label in enumerate(table._column):
+        if label <= size:
+            row = body[i]
+            low = _lowest([d / a for d, a in zip(costs, row) if a < -eps])
+            high = _highest([d / a for d, a in zip(costs, row) if a > eps])
+            ranges[label - 1] = _around_zero(low, high)
+    cost_ranges = []
+    for c, (low, high) in zip(basic_func, ranges):
+        low, high = _shift(c, low), _shift(c, high)
+        if sign < 0:
+            low, high = _negate(high), _negate(low)
+        cost_ranges.append((low, high))
+
+    answer, objective = table.get_answer()
+    count = table.size or size
+    return Sensitivity(
+        answer,
+        objective,
+        reduced_costs[:count],
+        cost_ranges[:count],
+        shadow_prices,
+        rhs_ranges,
+    )
@@ -0,0 +1,359 @@
+import argparse
+import importlib
+import json
+import sys
+import time
+from fractions import Fraction
+from pricing import RULES, get_rule
+from problem import (
+    parse_basis,
+    read_task,
+    task_basis,
+    task_bounds,
+    task_to_matrix,
+    to_float,
+)
+
+# движки: имя -> (модуль, класс базисной таблицы); модули грузятся по запросу
+ENGINES = {
+    "fraction": ("Table", "BasicTable"),
+    "bareiss": ("bareiss_table", "BareissBasicTable"),
+    "float": ("float_table", "FloatBasicTable"),
+    "revised": ("revised_table", "RevisedBasicTable"),
+    "sparse": ("sparse_table", "SparseBasicTable"),
+    "hybrid": ("hybrid_table", "HybridBasicTable"),
+}
+EXACT_ENGINES = ("fraction", "bareiss", "hybrid")
+
+
+def get_engine(name):
+    if name not in ENGINES:
+        raise ValueError(f"Неизвестный движок: {name}")
+    module, cls = ENGINES[name]
+    return getattr(importlib.import_module(module), cls)
+
+
+# шаг с замерами для наблюдателя: поиск, выбор и замена по отдельности,
+# значение в строке F до и после, размер таблицы. False - опорных нет
+def _traced_step(table, observer, phase, iteration, origin):
+    start = time.perf_counter()
+    table.serch()
+    serch_end = time.perf_counter()
+    if table.check_step:
+        return False
+    i, j = table.choose_pivot()
+    choose_end = time.perf_counter()
+    entering = table._line[j]
+    leaving = table._column[i] if i < table.length - 1 else None
+    before = table.get_objective()
+    table.step(i, j)
+    step_end = time.perf_counter()
+    after = table.get_objective()
+    observer(
+        {
+            "phase": phase,
+            "iteration": iteration,
+            "entering": entering,
+            "leaving": leaving,
+            "objective": after,
+            "degenerate": bool(after == before),
+            "start": start - origin,
+            "serch_time": serch_end - start,
+            "choose_time": choose_end - serch_end,
+            "step_time": step_end - choose_end,
+            "max_bits": table.max_bits(),
+            "table_bytes": table.table_bytes(),
+        }
+    )
+    return True
+
+
+# метод искусственного базиса, затем симплекс-метод до конца.
+# опорный элемент выбирается правилом pricing (без него - первый найденный).
+# observer(event) вызывается после каждого шага (solver_trace.Trace);
+# без него лишних замеров нет. limit - наибольшее число шагов, после
+# него статус "limit". возвращает статус, последнюю таблицу, число шагов
+# и время по фазам
+def run_simplex(table, pricing=None, observer=None, limit=None):
+    pivots = 0
+    table.pricing = pricing
+    start = origin = time.perf_counter()
+    while table.has_next_step():
+        if pivots == limit:
+            return "limit", table, pivots, (time.perf_counter() - start, 0.0)
+        if observer is not None:
+            if not _traced_step(table, observer, "basic", pivots + 1, origin):
+                break
+            pivots += 1
+            continue
+        table.serch()
+        if table.check_step:
+            break
+        i, j = table.choose_pivot()
+        table.step(i, j)
+        pivots += 1
+    basic_time = time.perf_counter() - start
+    if table.check_table():
+        return "infeasible", table, pivots, (basic_time, 0.0)
+
+    start = time.perf_counter()
+    table = table.convert_to_simplex()
+    table.pricing = pricing
+    status = "optimal"
+    while table.has_next_step():
+        if pivots == limit:
+            status = "limit"
+            break
+        if table.check_table():
+            status = "unbounded"
+            break
+        if observer is not None:
+            if not _traced_step(table, observer, "simplex", pivots + 1, origin):
+                status = "unbounded"
+                break
+            pivots += 1
+            continue
+        table.serch()
+        if table.check_step:
+            status = "unbounded"
+            break
+        i, j = table.choose_pivot()
+        table.step(i, j)
+        pivots += 1
+    return status, table, pivots, (basic_time, time.perf_counter() - start)
+
+
+# число для JSON: у точных движков дроби строкой, чтобы не терять
+# точность, у остальных - float (и нули небазисных, которые в ответе int)
+def _number(value, exact=True):
+    if exact and isinstance(value, (Fraction, int)):
+        return str(value)
+    return float(value)
+
+
+# bounds - границы переменных [(нижняя, верхняя), ...], None - нет границы.
+# presolve - сначала упростить задачу (для float еще и масштабировать).
+# types - типы ограничений (=, ≤, ≥), по умолчанию все равенства.
+# basis - начальные базисные переменные (номера с 1) или "crash".
+# observer - наблюдатель за шагами (см. run_simplex)
+def solve(
+    basic_func,
+    matrix,
+    minmax,
+    engine="fraction",
+    pricing="dantzig",
+    bounds=None,
+    presolve=False,
+    types=None,
+    basis=None,
+    observer=None,
+):
+    engine_class = get_engine(engine)
+    rule = get_rule(pricing)
+    start = time.perf_counter()
+    reduced = None
+    if presolve:
+        from presolve import reduce_task
+
+        reduced = reduce_task(
+            basic_func,
+            matrix,
+            minmax,
+            bounds,
+            scale=engine not in EXACT_ENGINES,
+            types=types,
+        )
+    if reduced is None or reduced.status == "reduced":
+        task = (
+            (reduced.basic_func, reduced.matrix, reduced.bounds, reduced.types)
+            if reduced
+            else (basic_func, matrix, bounds, types)
+        )
+        if reduced and basis is not None:
+            basis = reduced.map_basis(basis)
+        table = engine_class(minmax, task[1], task[0], task[2], task[3], basis)
+        hybrid = getattr(table, "hybrid", None)
+        setup_time = time.perf_counter() - start
+        status, table, pivots, (basic_time, simplex_time) = run_simplex(
+            table, rule, observer
+        )
+        answer = table.get_answer()[0] if status == "optimal" else None
+    else:  # упрощение решило задачу само
+        setup_time = time.perf_counter() - start
+        status, pivots, basic_time, simplex_time = reduced.status, 0, 0.0, 0.0
+        answer, hybrid = [], None
+    result = {
+        "status": status,
+        "engine": engine,
+        "pricing": pricing,
+        "pivots": pivots,
+    }
+    if hybrid is not None:
+        # шаги - и в float, и точные; verified - float-базис подтвержден
+        # точно, без единого точного шага
+        result["pivots"] = hybrid["float_pivots"] + pivots
+        result["hybrid"] = dict(
+            hybrid,
+            exact_pivots=pivots,
+            verified=hybrid["warm_start"]
+            and not hybrid["repaired"]
+            and pivots == 0
+            and status == hybrid["float_status"],
+        )
+    if reduced:
+        result["presolve"] = {
+            "rows": reduced.removed_rows,
+            "cols": reduced.removed_cols,
+        }
+    if status == "optimal":
+        if reduced:
+            answer = reduced.postsolve(answer)
+        objective = sum(c * x for c, x in zip(basic_func, answer))
+        exact = engine in EXACT_ENGINES
+        result["objective"] = _number(objective, exact)
+        result["x"] = [_number(x, exact) for x in answer]
+    result["time"] = {
+        "setup": setup_time,
+        "basic": basic_time,
+        "simplex": simplex_time,
+        "total": setup_time + basic_time + simplex_time,
+    }
+    return result
+
+
+# basis - начальный базис вместо заданного в файле
+def solve_file(
+    file_path,
+    engine="fraction",
+    pricing="dantzig",
+    presolve=False,
+    basis=None,
+    observer=None,
+):
+    start = time.perf_counter()
+    if engine == "sparse" and file_path.endswith(".json"):
+        from sparse_table import read_sparse_task
+
+        basic_func, matrix, minmax, bounds, types, file_basis = read_sparse_task(
+            file_path
+        )
+    else:
+        number = Fraction if engine in EXACT_ENGINES else to_float
+        data = read_task(file_path)
+        basic_func, matrix, minmax, types = task_to_matrix(data, number)
+        bounds = task_bounds(data, number)
+        file_basis = task_basis(data)
+    read_time = time.perf_counter() - start
+    result = solve(
+        basic_func,
+        matrix,
+        minmax,
+        engine,
+        pricing,
+        bounds,
+        presolve,
+        types,
+        file_basis if basis is None else basis,
+        observer,
+    )
+    result["file"] = file_path
+    result["time"]["read"] = read_time
+    result["time"]["total"] += read_time
+    return result
+
+
+STATUS_TEXT = {
+    "optimal": "Оптимальное решение найдено",
+    "infeasible": "Задача не имеет решения",
+    "unbounded": "Целевая функция не ограничена",
+}
+
+
+def format_result(result):
+    text = f"{result['file']}: {STATUS_TEXT[result['status']]}\n"
+    if result["status"] == "optimal":
+        text += "x* = (" + ", ".join(str(x) for x in result["x"]) + ")\n"
+        text += f"F = {result['objective']}\n"
+    pivots = str(result["pivots"])
+    if "hybrid" in result:
+        hybrid = result["hybrid"]
+        pivots += f" (float {hybrid['float_pivots']}, точных {hybrid['exact_pivots']})"
+    text += f"Шагов: {pivots}, время: {result['time']['total'] * 1000:.2f} мс"
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m solver",
+        description="Решение задачи ЛП симплекс-методом без графического интерфейса",
+    )
+    parser.add_argument("files", nargs="+", help="файлы задач (.json или текст)")
+    parser.add_argument(
+        "-e", "--engine", choices=sorted(ENGINES), default="fraction"
+    )
+    parser.add_argument(
+        "-p",
+        "--pricing",
+        choices=sorted(RULES),
+        default="dantzig",
+        help="правило выбора опорного элемента",
+    )
+    parser.add_argument(
+        "--presolve",
+        action="store_true",
+        help="упростить задачу перед решением (для float и масштабировать)",
+    )
+    parser.add_argument(
+        "-b",
+        "--basis",
+        type=parse_basis,
+        default=None,
+        help='начальный базис: номера переменных ("1,4,5") или crash',
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="вывод в JSON (одна строка на задачу)"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="записать шаги решения: .jsonl - по событию на строку, "
+        "иначе Chrome trace",
+    )
+    args = parser.parse_args(argv)
+
+    trace = None
+    if args.trace:
+        from solver_trace import Trace
+
+        trace = Trace()
+    code = 0
+    for file_path in args.files:
+        try:
+            if trace is not None:
+                trace.begin(file_path)
+            result = solve_file(
+                file_path,
+                args.engine,
+                args.pricing,
+                args.presolve,
+                args.basis,
+                trace,
+            )
+            if trace is not None:
+                result["trace"] = trace.summary(file_path)
+        except Exception as e:
+            result = {"file": file_path, "status": "error", "error": str(e)}
+            code = 1
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False))
+        elif result["status"] == "error":
+            print(f"{file_path}: ошибка: {result['error']}", file=sys.stderr)
+        else:
+            print(format_result(result))
+    if trace is not None:
+        trace.save(args.trace)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
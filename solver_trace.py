@@ -0,0 +1,119 @@
+import json
+from fractions import Fraction
+
+# запись шагов решения: Trace передается в solve / run_simplex как
+# observer и получает по событию на шаг (фаза, вводимая и выводимая
+# переменные, значение в строке F, вырожденный ли шаг, время поиска,
+# выбора и замены, наибольшая длина дробей в битах, память под таблицу).
+# сохраняется в JSONL (событие на строку) или в формате Chrome trace
+# (открывается в chrome://tracing и Perfetto)
+
+
+# дроби строкой, как в выводе solver.py
+def _plain(value):
+    if isinstance(value, Fraction):
+        return str(value)
+    if hasattr(value, "item"):  # числа numpy
+        return value.item()
+    return value
+
+
+class Trace:
+    def __init__(self):
+        self.events = []
+        self._run = None
+
+    # новое решение (например, следующий файл): события помечаются его именем
+    def begin(self, name):
+        self._run = name
+
+    def __call__(self, event):
+        if self._run is not None:
+            event["run"] = self._run
+        self.events.append(event)
+
+    # итог по всем событиям или по одному решению
+    def summary(self, run=None):
+        events = [e for e in self.events if run is None or e.get("run") == run]
+        bits = [e["max_bits"] for e in events if e["max_bits"] is not None]
+        return {
+            "pivots": len(events),
+            "degenerate": sum(e["degenerate"] for e in events),
+            "serch_time": sum(e["serch_time"] for e in events),
+            "choose_time": sum(e["choose_time"] for e in events),
+            "step_time": sum(e["step_time"] for e in events),
+            "max_bits": max(bits) if bits else None,
+            "max_table_bytes": _plain(
+                max((e["table_bytes"] for e in events), default=None)
+            ),
+        }
+
+    def write_jsonl(self, file):
+        for event in self.events:
+            event = {key: _plain(value) for key, value in event.items()}
+            file.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    # поиск, выбор и замена - отрезки на шкале времени (мкс), значение
+    # в строке F, длина в битах и память - графики-счетчики. каждое
+    # решение - отдельная дорожка
+    def write_chrome(self, file):
+        runs, trace = {}, []
+        for event in self.events:
+            tid = runs.setdefault(event.get("run"), len(runs) + 1)
+            start = event["start"] * 1e6
+            args = {
+                "iteration": event["iteration"],
+                "phase": event["phase"],
+                "entering": event["entering"],
+                "leaving": event["leaving"],
+                "degenerate": event["degenerate"],
+            }
+            for name in ("serch", "choose", "step"):
+                duration = event[f"{name}_time"] * 1e6
+                trace.append(
+                    {
+                        "name": name,
+                        "cat": event["phase"],
+                        "ph": "X",
+                        "ts": start,
+                        "dur": duration,
+                        "pid": 1,
+                        "tid": tid,
+                        "args": args,
+                    }
+                )
+                start += duration
+            counters = {"objective": float(event["objective"])}
+            if event["max_bits"] is not None:
+                counters["max_bits"] = event["max_bits"]
+            counters["table_bytes"] = event["table_bytes"]
+            for name, value in counters.items():
+                trace.append(
+                    {
+                        "name": name,
+                        "ph": "C",
+                        "ts": start,
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {name: _plain(value)},
+                    }
+                )
+        for name, tid in runs.items():
+            trace.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": name or "solve"},
+                }
+            )
+        json.dump({"traceEvents": trace}, file, ensure_ascii=False)
+
+    # формат по расширению: .jsonl - JSONL, иначе Chrome trace
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith(".jsonl"):
+                self.write_jsonl(f)
+            else:
+                self.write_chrome(f)
@@ -0,0 +1,352 @@
+import json
+import numpy as np
+import scipy.sparse as sp
+from problem import CONSTRAINT_TYPES, task_basis, task_bounds, to_float
+from Table import Table, BasicTable, SimplexTable
+from float_table import FloatTable
+
+
+# чтение задачи сразу в разреженном виде (CSR), нули не хранятся.
+# коэффициенты ограничения - список или словарь {"номер": "значение"}.
+# возвращает коэф. ц.ф., матрицу, min/max, границы, типы ограничений и
+# начальный базис
+def read_sparse_task(file_path):
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    basic_func = [to_float(x) for x in data.get("function", [])]
+    width = len(basic_func)
+    rows, cols, values, types = [], [], [], []
+    constraints = data.get("constraints", [])
+    for i, constr in enumerate(constraints):
+        constr_type = constr.get("type", "=")
+        if constr_type not in CONSTRAINT_TYPES:
+            raise ValueError(
+                f"Неизвестный тип ограничения {i + 1}: {constr_type}"
+            )
+        types.append(CONSTRAINT_TYPES[constr_type])
+        coeffs = constr.get("coeffs", [])
+        items = coeffs.items() if isinstance(coeffs, dict) else enumerate(coeffs)
+        for j, value in items:
+            value = to_float(value)
+            if value != 0:
+                rows.append(i)
+                cols.append(int(j))
+                values.append(value)
+        rhs = to_float(constr.get("rhs", 0))
+        if rhs != 0:
+            rows.append(i)
+            cols.append(width)
+            values.append(rhs)
+    matrix = sp.csr_matrix(
+        (values, (rows, cols)), shape=(len(constraints), width + 1)
+    )
+    bounds = task_bounds(data, to_float)
+    minmax = data.get("minmax", "max")
+    return basic_func, matrix, minmax, bounds, types, task_basis(data)
+
+
+# add_slacks для разреженной матрицы: столбцы дополнительных переменных
+# добавляются перед b, матрица остается CSR
+def add_sparse_slacks(matrix, types):
+    matrix = sp.csr_matrix(matrix, dtype=float)
+    rows = [i for i, t in enumerate(types) if CONSTRAINT_TYPES[t] != "="]
+    size = matrix.shape[1] - 1
+    slacks = {
+        i: (size + k + 1, 1.0 if CONSTRAINT_TYPES[types[i]] == "≤" else -1.0)
+        for k, i in enumerate(rows)
+    }
+    columns = sp.csr_matrix(
+        ([coef for _, coef in slacks.values()], (rows, range(len(rows)))),
+        shape=(matrix.shape[0], len(rows)),
+    )
+    matrix = sp.hstack([matrix[:, :-1], columns, matrix[:, -1:]], format="csr")
+    return matrix, slacks
+
+
+# таблица в разреженном виде (вся, вместе со столбцом b и строкой F).
+# шаг и поиск опорных элементов проходят только по ненулевым, а когда
+# заполненность растёт, таблица переводится в плотную (FloatTable)
+class SparseTable(FloatTable):
+    _fill_limit = 0.3  # доля ненулевых, после которой плотная таблица выгоднее
+    _drop_tol = 1e-12  # меньшие по модулю значения после шага выбрасываем
+
+    @property
+    def table(self):
+        if self._sparse is not None:
+            return self._sparse.toarray()
+        return self._dense
+
+    @table.setter
+    def table(self, value):
+        self._dense = value
+
+    @property
+    def is_sparse(self):
+        return self._sparse is not None
+
+    def _set_sparse(self, matrix):
+        matrix = sp.csr_matrix(matrix)
+        if matrix.nnz > self._fill_limit * matrix.shape[0] * matrix.shape[1]:
+            self._sparse, self._dense = None, matrix.toarray()
+        else:
+            self._sparse, self._dense = matrix, None
+
+    def _f_row(self):
+        return self._sparse[-1].toarray().ravel()
+
+    # значения для правил выбора без перевода всей таблицы в плотную
+    def get_cost(self, index_j):
+        if not self.is_sparse:
+            return super().get_cost(index_j)
+        return self._sparse[-1, index_j]
+
+    def get_costs(self):
+        if not self.is_sparse:
+            return super().get_costs()
+        return self._f_row()[:-1]
+
+    def get_column(self, index_j):
+        if not self.is_sparse:
+            return super().get_column(index_j)
+        return self._sparse[:-1, index_j].toarray().ravel()
+
+    def get_row(self, index_i):
+        if not self.is_sparse:
+            return super().get_row(index_i)
+        return self._sparse[index_i, :-1].toarray().ravel()
+
+    def get_rhs(self):
+        if not self.is_sparse:
+            return super().get_rhs()
+        return self._sparse[:-1, -1].toarray().ravel()
+
+    def get_objective(self):
+        if not self.is_sparse:
+            return super().get_objective()
+        return self._sparse[-1, -1]
+
+    def table_bytes(self):
+        if not self.is_sparse:
+            return super().table_bytes()
+        table = self._sparse
+        return table.data.nbytes + table.indices.nbytes + table.indptr.nbytes
+
+    def serch(self):
+        if self.upper or not self.is_sparse:
+            return super().serch()
+        table = self._sparse
+        f_row = self._f_row()
+        b = table[:, -1].toarray().ravel()
+        rows = np.repeat(np.arange(self.length), np.diff(table.indptr))
+        cols, data = table.indices, table.data
+        mask = (
+            (rows < self.length - 1)
+            & (cols < self.width - 1)
+            & (data > self._eps)
+        )
+        mask[mask] = f_row[cols[mask]] < -self._eps
+        rows, cols, data = rows[mask], cols[mask], data[mask]
+        ratios = b[rows] / data
+        # по столбцу минимальное отношение, при равенстве - первая строка
+        order = np.lexsort((rows, ratios, cols))
+        cols, rows = cols[order], rows[order]
+        first = np.ones(len(cols), dtype=bool)
+        first[1:] = cols[1:] != cols[:-1]
+        self.verios = [
+            [int(i), int(j)] for i, j in zip(rows[first], cols[first])
+        ]
+        self.check_step = len(self.verios) == 0
+
+    # шаг как одно разреженное ранг-1 обновление T - u v^T, где
+    # u - столбец опорного элемента, v - его строка / опорный элемент
+    def pivot(self, index_i, index_j):
+        if not self.is_sparse:
+            return super().pivot(index_i, index_j)
+        self._line[index_j], self._column[index_i] = (
+            self._column[index_i],
+            self._line[index_j],
+        )
+        table = self._sparse
+        pivot = table[index_i, index_j]
+        col = table[:, index_j].tocoo()
+        row = table[index_i].tocoo()
+        u_rows, u = col.row, col.data.copy()
+        v_cols, v = row.col, row.data / pivot
+        u[u_rows == index_i] = pivot - 1
+        v[v_cols == index_j] = 1 + 1 / pivot
+        update = sp.csr_matrix(
+            (
+                np.outer(u, v).ravel(),
+                (np.repeat(u_rows, len(v_cols)), np.tile(v_cols, len(u_rows))),
+            ),
+            shape=table.shape,
+        )
+        table = table - update
+        table.data[np.abs(table.data) < self._drop_tol] = 0
+        table.eliminate_zeros()
+        self._set_sparse(table)
+
+    def delete_column(self, index):
+        if not self.is_sparse:
+            return super().delete_column(index)
+        if index < 0 or index >= self.width:
+            return
+        if self._line[index] <= len(self.basic_func):
+            return
+        removed = (self._line[index], self._sparse[:, index].toarray().ravel())
+        keep = np.delete(np.arange(self.width), index)
+        self._sparse = self._sparse[:, keep]
+        self._line.pop(index)
+        self.width -= 1
+        return removed
+
+    def insert_column(self, index, removed):
+        if not self.is_sparse:
+            return super().insert_column(index, removed)
+        label, column = removed
+        self._sparse = sp.hstack(
+            [
+                self._sparse[:, :index],
+                sp.csr_matrix(column).T,
+                self._sparse[:, index:],
+            ],
+            format="csr",
+        )
+        self._line.insert(index, label)
+        self.width += 1
+
+    # с границами в разреженном виде - по одному столбцу, без плотной таблицы
+    def _bounded_serch(self):
+        if not self.is_sparse:
+            return super()._bounded_serch()
+        return Table._bounded_serch(self)
+
+    def _bounded_check(self):
+        if not self.is_sparse:
+            return super()._bounded_check()
+        return Table._bounded_check(self)
+
+    # замена на u - x без перевода в плотную: знак колонки (строки)
+    # меняется умножением на диагональную матрицу, своб.члены пересобираются
+    @staticmethod
+    def _with_rhs(table, rhs):
+        return sp.hstack(
+            [table[:, :-1], sp.csr_matrix(rhs[:, None])], format="csr"
+        )
+
+    def _complement_column(self, index_j):
+        if not self.is_sparse:
+            return super()._complement_column(index_j)
+        label = self._line[index_j]
+        column = self._sparse[:, index_j].toarray().ravel()
+        rhs = self._sparse[:, -1].toarray().ravel() - column * self.upper[label]
+        signs = np.ones(self.width)
+        signs[index_j] = -1
+        self._sparse = self._with_rhs(self._sparse @ sp.diags(signs), rhs)
+        self._flipped = self._flipped ^ {label}
+
+    def _complement_row(self, index_i):
+        if not self.is_sparse:
+            return super()._complement_row(index_i)
+        label = self._column[index_i]
+        rhs = self._sparse[:, -1].toarray().ravel()
+        rhs[index_i] = self.upper[label] - rhs[index_i]
+        signs = np.ones(self.length)
+        signs[index_i] = -1
+        self._sparse = self._with_rhs(sp.diags(signs) @ self._sparse, rhs)
+        self._flipped = self._flipped ^ {label}
+
+    def has_next_step(self):
+        if not self.is_sparse:
+            return super().has_next_step()
+        return bool(np.any(self._f_row()[:-1] < -self._eps))
+
+    def check_table(self):
+        if self.upper or not self.is_sparse:
+            return super().check_table()
+        # максимум по столбцу учитывает и неявные нули
+        col_max = self._sparse[:-1, :-1].max(axis=0).toarray().ravel()
+        negative = self._f_row()[:-1] < -self._eps
+        return bool(np.any(negative & (col_max <= self._eps)))
+
+
+class SparseBasicTable(SparseTable, BasicTable):
+    def __init__(
+        self,
+        minmax,
+        matrix=None,
+        basic_func=None,
+        bounds=None,
+        types=None,
+        basis=None,
+    ):
+        self._sparse, self._dense = None, None
+        super().__init__(minmax, matrix, basic_func, bounds, types, basis)
+
+    def _add_slacks(self, types):
+        self.matrix, self._slacks = add_sparse_slacks(self.matrix, types)
+        self.basic_func = list(self.basic_func) + [0.0] * len(self._slacks)
+
+    def _shift_rhs(self, lower):
+        matrix = sp.csr_matrix(self.matrix, dtype=float)
+        shift = np.zeros(matrix.shape[1] - 1)
+        for label, low in lower.items():
+            shift[label - 1] = low
+        rhs = matrix[:, -1].toarray().ravel() - matrix[:, :-1] @ shift
+        return self._with_rhs(matrix, rhs)
+
+    # matrix - разреженная или обычная матрица со столбцом правых частей
+    def set_full_task(self):
+        if self.minmax == "max":
+            self.basic_func = [-float(x) for x in self.basic_func]
+        else:
+            self.basic_func = [float(x) for x in self.basic_func]
+        matrix = sp.csr_matrix(self.matrix, dtype=float)
+        rhs = matrix[:, -1].toarray().ravel()
+        self._line, self._column, artificial = self._start_basis(rhs)
+        # столбцы базисных дополнительных переменных в таблицу не входят
+        matrix = matrix[:, np.array(self._line + [matrix.shape[1]]) - 1]
+        rows, self.width = matrix.shape
+        self.length = rows + 1
+        # если своб.член < 0 строку * (-1)
+        matrix = sp.diags(np.where(rhs >= 0, 1.0, -1.0)) @ matrix
+        f_row = -np.asarray(
+            (sp.diags(np.array(artificial, dtype=float)) @ matrix).sum(axis=0)
+        ).ravel()
+        self._set_sparse(sp.vstack([matrix, sp.csr_matrix(f_row)]))
+
+    def check_table(self):
+        if not self.is_sparse:
+            return bool(abs(self._dense[-1, -1]) > self._eps)
+        return bool(abs(self._sparse[-1, -1]) > self._eps)
+
+    def convert_to_simplex(self):
+        self._drive_out_artificials()
+        basic_func = np.array(self._phase_costs())
+        basic = basic_func[np.array(self._column) - 1]
+        line = np.array(self._line, dtype=int) - 1
+        if self.is_sparse:
+            body = self._sparse[:-1]
+            f_row = -(body.T @ basic)
+        else:
+            body = self._dense[:-1]
+            f_row = -(basic @ body)
+        f_row[:-1] += basic_func[line]
+        return self._carry_state(
+            SparseSimplexTable(
+                sp.vstack([sp.csr_matrix(body), sp.csr_matrix(f_row)]),
+                self.get_basic_func(),
+                self._line,
+                self._column,
+                self.width,
+                self.length,
+            )
+        )
+
+
+class SparseSimplexTable(SparseTable, SimplexTable):
+    def __init__(self, table, basic_func, line, column, width, length):
+        SimplexTable.__init__(
+            self, None, basic_func, line, column, width, length
+        )
+        self._set_sparse(table)
@@ -0,0 +1,47 @@
+import pytest
+from generate import generate_task
+from problem import task_to_matrix
+from solver import get_engine
+
+CASES = [
+    (4, 5, 1.0, 0.0, "optimal", "≤", "max", 1),
+    (6, 6, 0.6, 0.5, "optimal", "mixed", "min", 2),
+    (5, 6, 0.8, 0.3, "optimal", "=", "max", 3),
+    (5, 6, 0.7, 0.2, "unbounded", "mixed", "max", 7),
+]
+
+
+def _pairs(table, other):
+    assert list(table._line) == list(other._line)
+    assert list(table._column) == list(other._column)
+    assert table.table.tolist() == other.table.tolist()
+
+
+# те же опорные элементы, что и у fraction: таблицы совпадают на каждом
+# шаге, числитель остается целым (деление на прошлый опорный - нацело),
+# знаменатель положителен
+@pytest.mark.parametrize("case", CASES)
+def test_lockstep_with_fraction(case):
+    basic_func, matrix, minmax, types = task_to_matrix(generate_task(*case))
+    exact = get_engine("fraction")(minmax, matrix, basic_func, None, types, None)
+    table = get_engine("bareiss")(minmax, matrix, basic_func, None, types, None)
+    _pairs(table, exact)
+    for phase in ("basic", "simplex"):
+        while table.has_next_step():
+            table.serch()
+            exact.serch()
+            assert table.verios == exact.verios
+            if table.check_step:
+                break
+            i, j = table.choose_pivot()
+            table.step(i, j)
+            exact.step(i, j)
+            _pairs(table, exact)
+            assert all(type(x) is int for x in table.numer.ravel())
+            assert table.denom > 0
+        if phase == "basic":
+            if table.check_table():
+                break
+            table, exact = table.convert_to_simplex(), exact.convert_to_simplex()
+            _pairs(table, exact)
+    assert table.get_answer() == exact.get_answer()
@@ -0,0 +1,67 @@
+from fractions import Fraction
+import numpy as np
+import pytest
+from basis import crash_basis, to_basis
+from generate import check_result, generate_task
+from problem import add_slacks, task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, get_engine, run_simplex, solve
+
+SEEDS = range(8)
+
+
+def _task(engine, seed):
+    data = generate_task(5, 6, 0.7, 0.3, "optimal", "mixed", "max", seed)
+    number = Fraction if engine in EXACT_ENGINES else to_float
+    return data, task_to_matrix(data, number)
+
+
+# оптимальный базис: начав с него, шагов нет, ответ тот же
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_optimal_basis_needs_no_pivots(engine, seed):
+    _, exact = _task("fraction", seed)
+    table = get_engine("fraction")(exact[2], exact[1], exact[0], None, exact[3], None)
+    status, table, _, _ = run_simplex(table)
+    assert status == "optimal"
+    width = len(add_slacks(exact[1], exact[3])[0][0]) - 1
+    labels = [label for label in table._column if label <= width]
+    data, (basic_func, matrix, minmax, types) = _task(engine, seed)
+    result = solve(basic_func, matrix, minmax, engine, types=types, basis=labels)
+    assert check_result(data, result)
+    assert result["pivots"] == 0
+
+
+# с crash-базисом ответ тот же, что задан генератором
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_crash_basis_answer(engine, seed):
+    data, (basic_func, matrix, minmax, types) = _task(engine, seed)
+    result = solve(basic_func, matrix, minmax, engine, types=types, basis="crash")
+    assert check_result(data, result)
+
+
+# crash-базис треугольный, значит невырожденный (недопустимые базисные
+# таблица потом убирает сама)
+@pytest.mark.parametrize("seed", range(30))
+def test_crash_basis_is_triangular(seed):
+    data = generate_task(8, 10, 0.3, 0.3, "optimal", "=", "min", seed)
+    basic_func, matrix, _, _ = task_to_matrix(data)
+    labels = crash_basis(np.array(matrix, dtype=object), basic_func)
+    assert len(set(labels)) == len(labels) <= len(matrix)
+    if labels:
+        _, rows = to_basis(matrix, labels, exact=True)
+        assert sorted(rows.values()) == sorted(labels)
+
+
+# строки из free_rows уже покрыты дополнительными переменными; сначала
+# берутся выгодные по ц.ф. столбцы
+def test_crash_skips_free_rows():
+    matrix = [[1, 1, 1, 0, 4], [1, 2, 0, 1, 6]]
+    assert crash_basis(np.array(matrix), [-1, -1, 0, 0], free_rows=(0, 1)) == []
+    assert crash_basis(np.array(matrix), [-1, -1, 0, 0], free_rows=(0,)) == [1]
+
+
+def test_dependent_basis():
+    matrix = [[1, 2, 4], [2, 4, 8]]
+    with pytest.raises(ValueError):
+        solve([1, 1], matrix, "max", types=["≤", "≤"], basis=[1, 2])
@@ -0,0 +1,87 @@
+import io
+import json
+import multiprocessing as mp
+import os
+import time
+import pytest
+import batch
+from generate import check_result, generate_task
+
+# подмена solve_file видна дочернему процессу только при fork
+needs_fork = pytest.mark.skipif(
+    "fork" not in mp.get_all_start_methods(), reason="нужен fork"
+)
+
+
+def _write_tasks(directory, count):
+    tasks = {}
+    for seed in range(count):
+        status = ["optimal", "infeasible", "unbounded"][seed % 3]
+        data = generate_task(4, 5, 0.8, 0.2, status, "mixed", "max", seed)
+        path = str(directory / f"task{seed}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        tasks[path] = data
+    return tasks
+
+
+def _run(files, **kwargs):
+    output = io.StringIO()
+    counts = batch.run_batch(files, output, **kwargs)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    return counts, {record["file"]: record for record in records}
+
+
+# все задачи решены, ответы совпадают с заданными генератором
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_batch_results(tmp_path, jobs):
+    tasks = _write_tasks(tmp_path, 7)
+    files = batch.collect_files([str(tmp_path)])
+    assert files == sorted(tasks)
+    counts, records = _run(files, jobs=jobs)
+    assert sorted(records) == files
+    assert sum(counts.values()) == len(files)
+    for path, data in tasks.items():
+        assert check_result(data, records[path])
+
+
+# ошибка чтения - статус error, остальные задачи решаются
+def test_batch_error(tmp_path):
+    tasks = _write_tasks(tmp_path, 2)
+    broken = tmp_path / "broken.json"
+    broken.write_text("{", encoding="utf-8")
+    counts, records = _run(sorted(tasks) + [str(broken)], jobs=2)
+    assert records[str(broken)]["status"] == "error"
+    assert counts["error"] == 1 and sum(counts.values()) == 3
+
+
+def _fake_solve(file_path, *args):
+    name = os.path.basename(file_path)
+    if name.startswith("hang"):
+        time.sleep(60)
+    if name.startswith("crash"):
+        os._exit(3)
+    return {
+        "file": file_path,
+        "status": "optimal",
+        "objective": "1",
+        "x": ["1"],
+        "pivots": 0,
+    }
+
+
+# зависшая задача снимается по таймауту, упавший процесс - crashed,
+# остальные не страдают
+@needs_fork
+def test_batch_timeout_and_crash(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, "solve_file", _fake_solve)
+    files = [str(tmp_path / name) for name in ("crash", "hang", "ok1", "ok2")]
+    start = time.perf_counter()
+    counts, records = _run(files, jobs=2, timeout=0.5)
+    assert time.perf_counter() - start < 10
+    assert records[files[0]]["status"] == "crashed"
+    assert "3" in records[files[0]]["error"]
+    assert records[files[1]]["status"] == "timeout"
+    assert records[files[1]]["wall"] >= 0.5
+    assert records[files[2]]["status"] == records[files[3]]["status"] == "optimal"
+    assert counts == {"crashed": 1, "timeout": 1, "optimal": 2}
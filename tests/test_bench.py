@@ -0,0 +1,62 @@
+import json
+import numpy as np
+import pytest
+import bench
+from solver import ENGINES
+
+
+# маленький прогон всех движков: все задачи набора решены, у каждого
+# решения есть шаги и память, ядра замерены, отчет сериализуется
+def test_run_bench_small():
+    report = bench.run_bench(sorted(ENGINES), scale=0.1, repeat=1)
+    names = set(bench.corpus(0.1))
+    assert {record["instance"] for record in report["solves"]} == names
+    for record in report["solves"]:
+        assert record["status"] == "optimal"
+        assert record["peak_bytes"] > 0
+    kernels = {record["kernel"] for record in report["kernels"]}
+    assert {"serch", "step", "gauss_pivot_func"} <= kernels
+    assert json.loads(json.dumps(report))["meta"]["scale"] == 0.1
+
+
+# Кли-Минти: правило Данцига проходит все 2^d - 1 вершин
+@pytest.mark.parametrize("dim", [3, 5])
+def test_klee_minty_pivots(dim):
+    record = bench.bench_solve("km", bench.klee_minty_task(dim), "fraction", repeat=1)
+    assert record["pivots"] == 2**dim - 1
+
+
+# замер step отменяет шаг: таблица после замеров та же (в float - с
+# точностью до округления)
+@pytest.mark.parametrize("engine", ["fraction", "float", "bareiss"])
+def test_kernels_restore_table(engine):
+    task = bench.dense_task(5, 5)
+    table = bench._basic_table(task, engine)
+    before = np.array(table.table).copy(), list(table._column), list(table._line)
+    table.serch()
+    i, j = table.choose_pivot()
+    change = table.step(i, j)
+    table.unstep(i, j, change)
+    if engine == "float":
+        assert np.allclose(np.array(table.table, dtype=float), before[0])
+    else:
+        assert (np.array(table.table) == before[0]).all()
+    assert (list(table._column), list(table._line)) == before[1:]
+
+
+def test_compare():
+    old = {
+        "solves": [{"instance": "a", "engine": "float", "time": {"total": 1.0}}],
+        "kernels": [
+            {"kernel": "step", "instance": "a", "engine": "float", "seconds": 1.0},
+            {"kernel": "serch", "instance": "a", "engine": "float", "seconds": 1.0},
+        ],
+    }
+    new = json.loads(json.dumps(old))
+    new["solves"][0]["time"]["total"] = 2.0
+    new["kernels"][0]["seconds"] = 0.5
+    lines, regressions = bench.compare(old, new)
+    assert regressions == 1
+    assert sum("медленнее" in line for line in lines) == 1
+    assert sum("быстрее" in line for line in lines) == 1
+    assert len(lines) == 3
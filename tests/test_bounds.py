@@ -0,0 +1,78 @@
+from fractions import Fraction
+import pytest
+from generate import check_result, generate_task
+from problem import task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, get_engine, solve
+
+F = Fraction
+
+
+def _number(engine):
+    return F if engine in EXACT_ENGINES else to_float
+
+
+def _values(result, engine):
+    return [F(x) if engine in EXACT_ENGINES else x for x in result["x"]]
+
+
+# верхние границы - без лишних строк в таблице
+@pytest.mark.parametrize("engine", ["fraction", "bareiss", "float"])
+def test_upper_bounds_add_no_rows(engine):
+    data = generate_task(4, 5, 0.8, 0.0, "optimal", "≤", "max", 0)
+    basic_func, matrix, minmax, types = task_to_matrix(data, _number(engine))
+    bounds = [(None, _number(engine)(3))] * len(basic_func)
+    table = get_engine(engine)(minmax, matrix, basic_func, bounds, types, None)
+    assert len(table._column) == len(matrix)
+
+
+# max x1 + x2 при x1 + x2 <= 10, 1 <= x1 <= 3, 2 <= x2 <= 4 - обе на
+# верхних границах; ограничение неактивно
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_box(engine):
+    number = _number(engine)
+    matrix = [[number(1), number(1), number(10)]]
+    bounds = [(number(1), number(3)), (number(2), number(4))]
+    result = solve(
+        [number(1), number(1)], matrix, "max", engine, bounds=bounds, types=["≤"]
+    )
+    assert result["status"] == "optimal"
+    assert _values(result, engine) == pytest.approx([3, 4])
+
+
+# нижние границы сдвигают оптимум: min x1 + 2 x2 при x1 + x2 >= 5,
+# x2 >= 2 дает x = (3, 2)
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_lower_bounds(engine):
+    number = _number(engine)
+    matrix = [[number(1), number(1), number(5)]]
+    bounds = [(None, None), (number(2), None)]
+    result = solve(
+        [number(1), number(2)], matrix, "min", engine, bounds=bounds, types=["≥"]
+    )
+    assert _values(result, engine) == pytest.approx([3, 2])
+
+
+# границы, которые нельзя выполнить: l > u или ограничение сильнее u
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_infeasible_bounds(engine):
+    number = _number(engine)
+    matrix = [[number(1), number(1), number(10)]]
+    tight = [(None, number(3)), (None, number(4))]
+    result = solve(
+        [number(1), number(1)], matrix, "max", engine, bounds=tight, types=["≥"]
+    )
+    assert result["status"] == "infeasible"
+
+
+# на оптимуме генератора часть переменных ровно на верхней границе
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_planted_at_upper_bound(engine, seed):
+    data = generate_task(5, 6, 0.7, 0.2, "optimal", "mixed", "min", seed)
+    number = _number(engine)
+    basic_func, matrix, minmax, types = task_to_matrix(data, number)
+    bounds = [(None, number(int(x))) for x in data["expected"]["x"]]
+    result = solve(basic_func, matrix, minmax, engine, bounds=bounds, types=types)
+    assert check_result(data, result)
+    for x, (_, high) in zip(_values(result, engine), bounds):
+        assert x <= high + 1e-9
@@ -0,0 +1,60 @@
+from fractions import Fraction
+import pytest
+from generate import check_result, generate_task
+from problem import task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, solve
+
+# (строк, столбцов, доля ненулевых, вырожденность, статус, типы, min/max, seed)
+CASES = [
+    (4, 5, 1.0, 0.0, "optimal", "≤", "max", 1),
+    (6, 6, 0.6, 0.5, "optimal", "mixed", "min", 2),
+    (8, 10, 0.3, 0.3, "optimal", "mixed", "max", 3),
+    (6, 5, 0.8, 0.7, "optimal", "=", "min", 4),
+    (5, 6, 0.7, 0.2, "infeasible", "≥", "max", 5),
+    (5, 6, 0.7, 0.2, "infeasible", "mixed", "min", 6),
+    (5, 6, 0.7, 0.2, "unbounded", "mixed", "max", 7),
+    (5, 6, 0.7, 0.2, "unbounded", "≤", "min", 8),
+]
+
+
+def _number(engine):
+    return Fraction if engine in EXACT_ENGINES else to_float
+
+
+# каждый движок находит заранее известный ответ генератора
+@pytest.mark.parametrize("presolve", [False, True])
+@pytest.mark.parametrize("case", CASES)
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_planted_answer(engine, case, presolve):
+    data = generate_task(*case)
+    basic_func, matrix, minmax, types = task_to_matrix(data, _number(engine))
+    result = solve(basic_func, matrix, minmax, engine, types=types, presolve=presolve)
+    assert check_result(data, result)
+
+
+# верхние границы u_j >= x*_j (часть из них - ровно x*_j) оставляют
+# известный оптимум допустимым, так что ответ генератора не меняется
+@pytest.mark.parametrize("pricing", ["dantzig", "bland", "devex"])
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_planted_answer_with_bounds(engine, seed, pricing):
+    data = generate_task(6, 7, 0.7, 0.3, "optimal", "mixed", "max", seed)
+    number = _number(engine)
+    basic_func, matrix, minmax, types = task_to_matrix(data, number)
+    bounds = [
+        (None, number(int(x) + k % 3)) for k, x in enumerate(data["expected"]["x"])
+    ]
+    result = solve(basic_func, matrix, minmax, engine, pricing, bounds, types=types)
+    assert check_result(data, result)
+
+
+# в ответе точных движков - дроби строкой, у остальных все числа float,
+# в том числе нули небазисных переменных
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_answer_number_types(engine):
+    data = generate_task(*CASES[1])
+    basic_func, matrix, minmax, types = task_to_matrix(data, _number(engine))
+    result = solve(basic_func, matrix, minmax, engine, types=types)
+    kind = str if engine in EXACT_ENGINES else float
+    assert 0 in [Fraction(x) for x in result["x"]]
+    assert all(type(x) is kind for x in result["x"] + [result["objective"]])
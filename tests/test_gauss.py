@@ -0,0 +1,66 @@
+import random
+from fractions import Fraction
+import numpy as np
+import pytest
+from basis import to_basis
+from gauss_method import gauss_jordan, gauss_jordan_batch
+
+
+# прежний точный путь: Гаусс-Жордан в обыкновенных дробях
+def _fraction_jordan(matrix, columns):
+    matrix = np.array(
+        [[Fraction(x) for x in row] for row in matrix], dtype=object
+    ).reshape(len(matrix), len(matrix[0]))
+    reduced, rank, pivots, rows = gauss_jordan_batch(matrix[None], columns)
+    rank = int(rank[0])
+    return reduced[0], rank, [int(j) for j in pivots[0, :rank]], list(rows[0])
+
+
+def _random_matrix(rng):
+    rows, cols = rng.randint(1, 6), rng.randint(1, 8)
+    matrix = [
+        [
+            Fraction(rng.randint(-6, 6), rng.choice([1, 2, 3, 7]))
+            if rng.random() < 0.6
+            else 0
+            for _ in range(cols)
+        ]
+        for _ in range(rows)
+    ]
+    if rows > 1 and rng.random() < 0.5:  # линейно зависимая строка
+        matrix[-1] = [2 * a - b for a, b in zip(matrix[0], matrix[rows // 2])]
+    if rng.random() < 0.2:  # нулевой столбец
+        for row in matrix:
+            row[0] = 0
+    return matrix
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_exact_matches_fraction_jordan(seed):
+    rng = random.Random(seed)
+    matrix = _random_matrix(rng)
+    columns = rng.choice([None, rng.randint(0, len(matrix[0]))])
+    reduced, rank, pivots, rows = gauss_jordan(matrix, columns, exact=True)
+    expected = _fraction_jordan(matrix, columns)
+    assert np.array_equal(reduced, expected[0])
+    assert (rank, pivots, list(rows)) == expected[1:]
+
+
+def test_singular_and_zero():
+    singular = [[1, 2, 3], [2, 4, 6], [Fraction(1, 2), 1, Fraction(3, 2)]]
+    reduced, rank, _, _ = gauss_jordan(singular, exact=True)
+    assert rank == 1
+    assert np.array_equal(reduced, _fraction_jordan(singular, None)[0])
+    reduced, rank, pivots, _ = gauss_jordan([[0, 0], [0, 0]], exact=True)
+    assert (rank, pivots) == (0, [])
+    assert not reduced.any()
+
+
+def test_dependent_basis_rejected():
+    matrix = [[1, 2, 0, 4], [2, 4, 1, 9]]
+    with pytest.raises(ValueError):
+        to_basis(matrix, [1, 2], exact=True)
+    # x1 = 4 - 2 x2, x3 = 9 - 2 * 4
+    reduced, rows = to_basis(matrix, [1, 3], exact=True)
+    assert sorted(rows.values()) == [1, 3]
+    assert {label: reduced[i, -1] for i, label in rows.items()} == {1: 4, 3: 1}
@@ -0,0 +1,92 @@
+from fractions import Fraction
+import pytest
+import generate
+from generate import check_result, generate_task
+from problem import CONSTRAINT_TYPES, read_task, task_to_matrix
+from solver import solve
+
+SEEDS = range(30)
+
+
+def _rows(data):
+    for constr in data["constraints"]:
+        coeffs = [Fraction(a) for a in constr["coeffs"]]
+        yield coeffs, CONSTRAINT_TYPES[constr["type"]], Fraction(constr["rhs"])
+
+
+# заданный x* допустим и дает записанное значение ц.ф., а точное решение
+# находит то же значение
+@pytest.mark.parametrize("degeneracy", [0.0, 0.6])
+@pytest.mark.parametrize("types", ["mixed", "≤", "≥", "="])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_planted_optimum(seed, types, degeneracy):
+    data = generate_task(5, 6, 0.7, degeneracy, "optimal", types, "max", seed)
+    x = [Fraction(v) for v in data["expected"]["x"]]
+    assert all(v >= 0 for v in x)
+    for coeffs, t, b in _rows(data):
+        if types != "mixed":
+            assert t == CONSTRAINT_TYPES[types]
+        lhs = sum(a * v for a, v in zip(coeffs, x))
+        assert lhs == b if t == "=" else lhs <= b if t == "≤" else lhs >= b
+    costs = [Fraction(c) for c in data["function"]]
+    assert sum(c * v for c, v in zip(costs, x)) == Fraction(
+        data["expected"]["objective"]
+    )
+    basic_func, matrix, minmax, row_types = task_to_matrix(data)
+    assert check_result(data, solve(basic_func, matrix, minmax, types=row_types))
+
+
+# несовместные и неограниченные задачи действительно такие
+@pytest.mark.parametrize("status", ["infeasible", "unbounded"])
+@pytest.mark.parametrize("types", ["mixed", "≤", "≥", "="])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_planted_status(seed, types, status):
+    data = generate_task(4, 5, 0.8, 0.3, status, types, "min", seed)
+    if types != "mixed":
+        assert {t for _, t, _ in _rows(data)} == {CONSTRAINT_TYPES[types]}
+    basic_func, matrix, minmax, row_types = task_to_matrix(data)
+    result = solve(basic_func, matrix, minmax, types=row_types)
+    assert result["status"] == status
+    assert check_result(data, result)
+
+
+def test_same_seed_same_task():
+    assert generate_task(6, 6, 0.5, 0.3, seed=7) == generate_task(
+        6, 6, 0.5, 0.3, seed=7
+    )
+    assert generate_task(6, 6, 0.5, 0.3, seed=7) != generate_task(
+        6, 6, 0.5, 0.3, seed=8
+    )
+
+
+# в каждой строке есть ненулевой коэф. даже при малой плотности
+def test_sparse_rows_not_empty():
+    data = generate_task(20, 10, 0.05, 0.0, seed=3)
+    assert all(any(a for a in coeffs) for coeffs, _, _ in _rows(data))
+
+
+def test_check_result():
+    data = generate_task(3, 3, seed=1)
+    objective = data["expected"]["objective"]
+    assert check_result(data, {"status": "optimal", "objective": objective})
+    assert check_result(data, {"status": "optimal", "objective": float(objective)})
+    assert not check_result(
+        data, {"status": "optimal", "objective": str(Fraction(objective) + 1)}
+    )
+    assert not check_result(data, {"status": "infeasible"})
+    assert check_result({}, {"status": "optimal"}) is None
+
+
+def test_unknown_status():
+    with pytest.raises(ValueError):
+        generate_task(3, 3, status="feasible")
+
+
+# каталог: по файлу на seed, задачи читаются программой
+def test_cli_directory(tmp_path):
+    argv = ["-m", "3", "-n", "4", "-s", "5", "-c", "3", "-o", str(tmp_path)]
+    assert generate.main(argv) == 0
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert names == ["task_5.json", "task_6.json", "task_7.json"]
+    data = read_task(str(tmp_path / "task_6.json"))
+    assert data["seed"] == 6 and len(data["constraints"]) == 3
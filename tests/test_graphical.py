@@ -0,0 +1,99 @@
+import random
+from fractions import Fraction
+import pytest
+from graphical import feasible_region, feasible_region_steps
+from solver import solve
+
+SEEDS = range(40)
+
+
+def _constraints(seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "coeff": [rng.randint(-5, 5), rng.randint(-5, 5)],
+            "type": rng.choice(["<=", ">="]),
+            "value": rng.randint(-10, 20),
+        }
+        for _ in range(rng.randint(1, 8))
+    ]
+
+
+# по шагам получается та же область, ход - от 0 до числа полуплоскостей
+@pytest.mark.parametrize("seed", SEEDS)
+def test_steps_same_region(seed):
+    constraints = _constraints(seed)
+    steps = feasible_region_steps(constraints)
+    progress = []
+    while True:
+        try:
+            progress.append(next(steps))
+        except StopIteration as stop:
+            region = stop.value
+            break
+    assert region.outline == feasible_region(constraints).outline
+    assert [done for done, _ in progress] == list(range(len(progress)))
+    assert all(total == progress[0][1] for _, total in progress)
+
+
+# шаги отдаются до конца пересечения - между ними поток может прерваться
+def test_steps_yield_between_planes():
+    constraints = [
+        {"coeff": [1, k], "type": "<=", "value": 10 + k} for k in range(1, 30)
+    ]
+    steps = feasible_region_steps(constraints)
+    assert next(steps) == (0, 35)  # 29 ограничений, 2 границы, 4 стороны квадрата
+    steps.close()
+
+
+# треугольник x + y <= 2, x, y >= 0 - точные вершины
+def test_triangle():
+    region = feasible_region([{"coeff": [1, 1], "type": "<=", "value": 2}])
+    assert region.status == "bounded"
+    assert sorted(region.vertices) == [(0, 0), (0, 2), (2, 0)]
+    status, point, value = region.optimize((Fraction(1), Fraction(2)), minimize=False)
+    assert (status, point, value) == ("optimal", (0, 2), 4)
+
+
+# оптимум по области совпадает с точным симплекс-методом, включая
+# несовместные и неограниченные задачи
+@pytest.mark.parametrize("minimize", [True, False])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_optimum_matches_simplex(seed, minimize):
+    constraints = _constraints(seed)
+    rng = random.Random(-seed)
+    c = (Fraction(rng.randint(-5, 5)), Fraction(rng.randint(-5, 5)))
+    status, _, value = feasible_region(constraints).optimize(c, minimize)
+    matrix = [
+        [Fraction(x) for x in constr["coeff"]] + [Fraction(constr["value"])]
+        for constr in constraints
+    ]
+    types = [constr["type"] for constr in constraints]
+    minmax = "min" if minimize else "max"
+    result = solve(list(c), matrix, minmax, types=types)
+    assert status == result["status"]
+    if status == "optimal":
+        assert value == Fraction(result["objective"])
+
+
+# равенство: область - отрезок на прямой
+def test_equality_segment():
+    constraints = [
+        {"coeff": [1, 1], "type": "=", "value": 4},
+        {"coeff": [1, 0], "type": "<=", "value": 3},
+    ]
+    region = feasible_region(constraints)
+    assert region.status == "bounded"
+    assert sorted(region.vertices) == [(0, 4), (3, 1)]
+
+
+# неограниченная область: вершины, направления ухода в бесконечность;
+# с дробями и точки на бесконечности остаются дробями
+def test_unbounded_directions():
+    region = feasible_region([{"coeff": [1, -1], "type": "<=", "value": 1}])
+    assert region.status == "unbounded"
+    assert sorted(region.vertices) == [(0, 0), (1, 0)]
+    assert set(region.directions) == {(0, 1), (1, 1)}
+    for p, q in region.outline:
+        assert all(isinstance(x, Fraction) for x in p + q)
+    assert region.optimize((1, 1), minimize=False)[0] == "unbounded"
@@ -0,0 +1,139 @@
+from fractions import Fraction
+import numpy as np
+import pytest
+from generate import check_result, generate_task
+from history import TableHistory
+from pricing import get_rule
+from problem import task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, get_engine
+
+CASES = [
+    (4, 5, 1.0, 0.0, "optimal", "≤", "max", 1),
+    (5, 6, 0.7, 0.4, "optimal", "mixed", "min", 2),
+    (6, 6, 0.8, 0.3, "optimal", "mixed", "max", 3),
+    (5, 5, 0.8, 0.5, "optimal", "=", "min", 4),
+]
+
+
+# что видно в окне: значения таблицы, метки столбцов и строк, фаза
+def _state(table):
+    return (
+        np.array(table.table, copy=True),
+        list(table._line),
+        list(table._column),
+        table.get_class_type(),
+    )
+
+
+def _same(a, b, exact):
+    assert a[1:] == b[1:]
+    if exact:
+        assert a[0].tolist() == b[0].tolist()
+    else:
+        np.testing.assert_allclose(
+            a[0].astype(float), b[0].astype(float), atol=1e-9
+        )
+
+
+# шаги как в окне (Main.SimplexWindow): после каждого шага переход к
+# симплекс-таблице, если вспомогательная задача решена; перед переходом
+# история запоминает базисную таблицу
+def _advance(table, history, pricing):
+    if table.get_class_type() == "basic" and not table.has_next_step():
+        assert not table.check_table()
+        if not history.is_empty():
+            history.record_phase(table.copy())
+        table = table.convert_to_simplex()
+        table.pricing = pricing
+    return table
+
+
+def _solve_with_history(table, history, pricing, states):
+    table = _advance(table, history, pricing)
+    while table.has_next_step():
+        states.append(_state(table))
+        table.serch()
+        i, j = table.choose_pivot()
+        history.record_step(i, j, table.step(i, j))
+        table = _advance(table, history, pricing)
+    return table
+
+
+# отмена всех шагов через границу фаз возвращает каждую прежнюю таблицу,
+# а повторное решение после отмены дает тот же ответ
+@pytest.mark.parametrize("case", CASES)
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_undo_round_trip(engine, case):
+    data = generate_task(*case)
+    exact = engine in EXACT_ENGINES
+    basic_func, matrix, minmax, types = task_to_matrix(
+        data, Fraction if exact else to_float
+    )
+    pricing = get_rule("dantzig")
+    table = get_engine(engine)(minmax, matrix, basic_func, types=types)
+    table.pricing = pricing
+    history, states = TableHistory(), []
+
+    table = _solve_with_history(table, history, pricing, states)
+    assert table.get_class_type() == "simplex"
+    answer = table.get_answer()
+    assert len(history) == len(states)
+
+    while not history.is_empty():
+        table = history.undo(table)
+        table.pricing = pricing
+        _same(_state(table), states.pop(), exact)
+
+    table = _solve_with_history(table, history, pricing, states)
+    x, objective = table.get_answer()
+    if exact:
+        assert (x, objective) == answer
+        objective = str(objective)
+    else:
+        np.testing.assert_allclose(np.array(x, dtype=float), answer[0], atol=1e-9)
+    assert check_result(data, {"status": "optimal", "objective": objective})
+
+
+# история у каждого окна своя (раньше снимки были общими для класса),
+# и копия таблицы хранится не больше одного раза - на границе фаз
+def test_histories_are_independent():
+    data = generate_task(*CASES[2])
+    basic_func, matrix, minmax, types = task_to_matrix(data)
+    pricing = get_rule("dantzig")
+    first, second = TableHistory(), TableHistory()
+    table = get_engine("fraction")(minmax, matrix, basic_func, types=types)
+    table.pricing = pricing
+    _solve_with_history(table, first, pricing, [])
+    assert len(first) > 0 and second.is_empty()
+    copies = [step for step in first._steps if step[3] is not None]
+    assert len(copies) <= 1
+
+
+# с верхними границами шаг может быть переносом переменной на границу;
+# отмена возвращает и такие шаги
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("engine", ["fraction", "bareiss", "float"])
+def test_undo_with_bounds(engine, seed):
+    data = generate_task(5, 6, 0.7, 0.3, "optimal", "mixed", "max", seed)
+    exact = engine in EXACT_ENGINES
+    number = Fraction if exact else to_float
+    basic_func, matrix, minmax, types = task_to_matrix(data, number)
+    expected = data["expected"]["x"]
+    bounds = [(None, number(int(x) + k % 2)) for k, x in enumerate(expected)]
+    pricing = get_rule("dantzig")
+    table = get_engine(engine)(minmax, matrix, basic_func, bounds, types)
+    table.pricing = pricing
+    history, states = TableHistory(), []
+    table = _solve_with_history(table, history, pricing, states)
+    answer = table.get_answer()
+    while not history.is_empty():
+        table = history.undo(table)
+        table.pricing = pricing
+        _same(_state(table), states.pop(), exact)
+    table = _solve_with_history(table, history, pricing, states)
+    if exact:
+        assert table.get_answer() == answer
+    else:
+        np.testing.assert_allclose(
+            np.array(table.get_answer()[0], dtype=float), answer[0], atol=1e-9
+        )
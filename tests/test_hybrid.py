@@ -0,0 +1,65 @@
+import itertools
+import random
+from fractions import Fraction
+import pytest
+from generate import generate_task
+from basis import to_basis
+from hybrid_table import HybridBasicTable
+from problem import add_slacks, task_to_matrix
+from solver import solve
+
+
+def _singular(matrix, labels):
+    try:
+        to_basis(matrix, labels, exact=True)
+    except ValueError:
+        return True
+    return False
+
+
+# float-базис подменяется произвольным: точно недопустимые базисные
+# убираются, шаги продолжаются с остальных, ответ - как у fraction.
+# с нуля - только вырожденный базис
+@pytest.mark.parametrize("seed", range(20))
+def test_infeasible_warm_basis_is_repaired(seed, monkeypatch):
+    data = generate_task(4, 5, 0.8, 0.3, "optimal", "mixed", "max", seed)
+    basic_func, matrix, minmax, types = task_to_matrix(data)
+    expected = solve(basic_func, matrix, minmax, types=types)
+    extended, _ = add_slacks(matrix, types)
+    width = len(extended[0]) - 1
+    rng = random.Random(seed)
+    combos = list(itertools.combinations(range(1, width + 1), len(matrix)))
+    rng.shuffle(combos)
+    repaired = 0
+    for warm in combos[:10]:
+        monkeypatch.setattr(
+            HybridBasicTable,
+            "_float_basis",
+            staticmethod(lambda *args: ("optimal", 0, 0.0, list(warm), frozenset())),
+        )
+        result = solve(basic_func, matrix, minmax, "hybrid", types=types)
+        assert result["status"] == expected["status"]
+        assert Fraction(result["objective"]) == Fraction(expected["objective"])
+        hybrid = result["hybrid"]
+        repaired += hybrid["repaired"]
+        assert hybrid["warm_start"] != _singular(extended, warm)
+    assert repaired > 0
+
+
+# пример Била: float по правилу Данцига зацикливается, после предела шагов
+# задача решается точно с нуля выбранным правилом
+def test_cycling_float_pass_is_cut_off():
+    basic_func = [Fraction(-3, 4), Fraction(20), Fraction(-1, 2), Fraction(6)]
+    matrix = [
+        [Fraction(x) for x in row]
+        for row in (
+            [Fraction(1, 4), -8, -1, 9, 0],
+            [Fraction(1, 2), -12, Fraction(-1, 2), 3, 0],
+            [0, 0, 1, 0, 1],
+        )
+    ]
+    result = solve(basic_func, matrix, "min", "hybrid", "bland", types=["≤"] * 3)
+    assert result["status"] == "optimal"
+    assert Fraction(result["objective"]) == Fraction(-5, 4)
+    assert result["hybrid"]["float_status"] is None
+    assert not result["hybrid"]["warm_start"]
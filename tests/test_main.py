@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+from fractions import Fraction
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from Main import _region_key  # noqa: E402
+
+
+def _constraints(number):
+    return [
+        {"coeff": [number(1), number(2)], "type": "<=", "value": number(6)},
+        {"coeff": [number(3), number(-1)], "type": ">=", "value": number(1)},
+    ]
+
+
+BOUNDS = {"x1": (None, None), "x2": (None, 4)}
+
+
+# ключ кэша области зависит только от ограничений и границ: та же задача
+# с другой ц.ф. берет область из кэша, любое изменение ограничений - нет
+def test_region_key():
+    key = _region_key(_constraints(Fraction), BOUNDS)
+    assert key == _region_key(_constraints(Fraction), dict(BOUNDS))
+    changed = _constraints(Fraction)
+    changed[1]["type"] = "<="
+    assert _region_key(changed, BOUNDS) != key
+    changed = _constraints(Fraction)
+    changed[0]["value"] = Fraction(7)
+    assert _region_key(changed, BOUNDS) != key
+    bounds = dict(BOUNDS, x2=(None, 5))
+    assert _region_key(_constraints(Fraction), bounds) != key
+    # 1 == 1.0, но точная и десятичная области считаются по-разному
+    assert _region_key(_constraints(float), BOUNDS) != key
+
+
+# окно создается и показывается без matplotlib: он грузится при первом
+# графике или открытии вкладки "Результаты"
+def test_start_without_matplotlib():
+    code = (
+        "import sys\n"
+        "from PyQt6.QtWidgets import QApplication\n"
+        "app = QApplication([])\n"
+        "import Main\n"
+        "window = Main.LinearProgrammingApp()\n"
+        "window.show()\n"
+        "app.processEvents()\n"
+        "print('matplotlib' in sys.modules)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    done = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert done.stdout.split()[-1] == "False"
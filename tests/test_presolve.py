@@ -0,0 +1,121 @@
+import math
+from fractions import Fraction
+import numpy as np
+import pytest
+from generate import generate_task
+from presolve import reduce_task
+from problem import CONSTRAINT_TYPES, task_to_matrix, to_float
+from solver import EXACT_ENGINES, solve
+
+F = Fraction
+
+
+# x - допустимая точка исходной задачи (с границами и типами)
+def _feasible(x, matrix, types=None, bounds=None, eps=0):
+    for row, t in zip(matrix, types or ["="] * len(matrix)):
+        lhs = sum(a * v for a, v in zip(row, x))
+        t = CONSTRAINT_TYPES[t]
+        if t == "=" and abs(lhs - row[-1]) > eps:
+            return False
+        if t == "≤" and lhs > row[-1] + eps or t == "≥" and lhs < row[-1] - eps:
+            return False
+    for v, (low, high) in zip(x, bounds or [(None, None)] * len(x)):
+        if v < (low or 0) - eps or high is not None and v > high + eps:
+            return False
+    return True
+
+
+# упрощенная задача, решенная и возвращенная к исходным переменным,
+# дает допустимую точку с тем же значением ц.ф., что и решение без упрощения
+@pytest.mark.parametrize("seed", range(12))
+@pytest.mark.parametrize("engine", ["fraction", "float", "sparse"])
+def test_round_trip(engine, seed):
+    data = generate_task(6, 7, 0.6, 0.5, "optimal", "mixed", "min", seed)
+    number = F if engine in EXACT_ENGINES else to_float
+    basic_func, matrix, minmax, types = task_to_matrix(data, number)
+    bounds = [(None, number(int(x) + seed % 2)) for x in data["expected"]["x"]]
+    direct = solve(basic_func, matrix, minmax, engine, bounds=bounds, types=types)
+    reduced = solve(
+        basic_func, matrix, minmax, engine, bounds=bounds, types=types, presolve=True
+    )
+    assert reduced["status"] == direct["status"] == "optimal"
+    x = [F(v) if engine in EXACT_ENGINES else v for v in reduced["x"]]
+    assert _feasible(x, matrix, types, bounds, 0 if engine in EXACT_ENGINES else 1e-7)
+    if engine in EXACT_ENGINES:
+        assert reduced["objective"] == direct["objective"]
+    else:
+        assert reduced["objective"] == pytest.approx(direct["objective"], abs=1e-7)
+
+
+# закрепленная переменная и одиночная строка подставляются, пустая
+# строка удаляется: задача решается без симплекс-метода
+def test_fixed_singleton_and_empty_row():
+    matrix = [
+        [F(2), F(0), F(0), F(6)],  # 2 x1 = 6
+        [F(1), F(1), F(1), F(7)],
+        [F(0), F(0), F(0), F(0)],  # 0 = 0
+    ]
+    bounds = [(None, None), (F(2), F(2)), (None, None)]
+    task = reduce_task([F(1), F(1), F(1)], matrix, "min", bounds)
+    assert task.status == "optimal"
+    assert task.removed_rows == 3 and task.removed_cols == 3
+    assert task.postsolve([]) == [3, 2, 2]
+
+
+# линейно зависимое равенство удаляется, противоречивое - несовместно
+def test_dependent_rows():
+    matrix = [
+        [F(1), F(1), F(1), F(4)],
+        [F(1), F(-1), F(2), F(1)],
+        [F(2), F(0), F(3), F(5)],  # сумма первых двух
+    ]
+    task = reduce_task([F(1), F(2), F(3)], matrix, "min")
+    assert task.status == "reduced"
+    assert task.removed_rows == 1 and len(task.matrix) == 2
+    matrix[2][-1] = F(6)
+    assert reduce_task([F(1), F(2), F(3)], matrix, "min").status == "infeasible"
+
+
+# пустой столбец закрепляется на выгодной границе, без нее - остается
+def test_empty_column():
+    matrix = [[F(1), F(0), F(0), F(1)]]
+    bounds = [(None, None), (None, F(5)), (None, None)]
+    task = reduce_task([F(1), F(-1), F(2)], matrix, "min", bounds)
+    assert task.status == "optimal"
+    assert task.postsolve([]) == [1, 5, 0]
+    task = reduce_task([F(1), F(-1), F(2)], matrix, "min")
+    assert task.status == "unbounded"
+
+
+# одиночная строка вне границ переменной - несовместно сразу
+def test_singleton_out_of_bounds():
+    matrix = [[F(1), F(0), F(4)], [F(1), F(1), F(5)]]
+    task = reduce_task([F(1), F(1)], matrix, "min", [(None, F(3)), (None, None)])
+    assert task.status == "infeasible"
+
+
+# масштабы - степени двойки, после них ответ возвращается к исходному
+def test_scaling_powers_of_two():
+    matrix = [[1000.0, 0.001, 1.0, 5.0], [3.0, 2000.0, 0.0, 7.0]]
+    task = reduce_task([1.0, 1.0, 1.0], matrix, "min", scale=True)
+    assert task.status == "reduced"
+    for s in task.scale:
+        assert math.log2(s) == int(math.log2(s))
+    values = np.abs(np.array(task.matrix)[:, :-1])
+    assert values.max() / values[values > 0].min() < 1e6 / 2
+
+
+# начальный базис исходной задачи переводится в номера упрощенной
+def test_map_basis():
+    matrix = [
+        [F(1), F(0), F(0), F(2)],  # x1 = 2 (одиночная строка)
+        [F(1), F(1), F(1), F(6)],
+        [F(0), F(1), F(-1), F(1)],
+    ]
+    types = ["=", "≤", "≤"]
+    task = reduce_task([F(1), F(1), F(1)], matrix, "max", types=types)
+    assert task.status == "reduced"
+    assert task.columns == [1, 2]
+    # слабые 4 и 5 исходной задачи -> 3 и 4, x1 убрана
+    assert task.map_basis([1, 4, 5]) == [3, 4]
+    assert task.map_basis("crash") == "crash"
@@ -0,0 +1,77 @@
+from fractions import Fraction
+import numpy as np
+import pytest
+from Table import BasicTable
+from generate import check_result, generate_task
+from pricing import RULES, get_rule
+from problem import task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, solve
+
+
+def _fractions(rows):
+    return [[Fraction(x) for x in row] for row in rows]
+
+
+# пример Била: с правилом Данцига и первой строкой при равенстве
+# зацикливается. третье ограничение x3 <= 1 - либо строкой, либо границей
+BEALE_FUNC = [Fraction(-3, 4), Fraction(20), Fraction(-1, 2), Fraction(6)]
+BEALE_ROWS = _fractions(
+    [
+        [Fraction(1, 4), -8, -1, 9, 0],
+        [Fraction(1, 2), -12, Fraction(-1, 2), 3, 0],
+    ]
+)
+
+
+# каждое правило на каждом движке находит известный оптимум, в том числе
+# на вырожденных задачах
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("rule", sorted(RULES))
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_rule_finds_planted_optimum(engine, rule, seed):
+    data = generate_task(6, 7, 0.7, 0.6, "optimal", "mixed", "min", seed)
+    number = Fraction if engine in EXACT_ENGINES else to_float
+    basic_func, matrix, minmax, types = task_to_matrix(data, number)
+    result = solve(basic_func, matrix, minmax, engine, rule, types=types)
+    assert check_result(data, result)
+
+
+@pytest.mark.parametrize("bounded", [False, True])
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_bland_does_not_cycle_on_beale(engine, bounded):
+    number = Fraction if engine in EXACT_ENGINES else to_float
+    matrix = [row[:] for row in BEALE_ROWS]
+    bounds = None
+    if bounded:
+        bounds = [(None, None), (None, None), (None, number(1)), (None, None)]
+    else:
+        matrix.append(_fractions([[0, 0, 1, 0, 1]])[0])
+    matrix = [[number(x) for x in row] for row in matrix]
+    basic_func = [number(x) for x in BEALE_FUNC]
+    result = solve(
+        basic_func, matrix, "min", engine, "bland", bounds, types=["≤"] * len(matrix)
+    )
+    assert check_result(
+        {"expected": {"status": "optimal", "objective": "-5/4"}}, result
+    )
+
+
+# с границами выводимая по Бленду - наименьший номер среди строк с
+# одинаковым отношением, а не первая такая строка
+def test_bland_bounded_tie_takes_smallest_label():
+    matrix = _fractions([[1, 1, 1], [1, 0, 1]])
+    table = BasicTable(
+        "max",
+        matrix,
+        _fractions([[1, 0]])[0],
+        bounds=[(None, Fraction(5)), (None, None)],
+        types=["≤", "≤"],
+    ).convert_to_simplex()
+    # строки в обратном порядке: x4 первой, x3 второй
+    table.table = table.table[[1, 0, 2]]
+    table._column = table._column[::-1]
+    table.serch()
+    index_j = table._line.index(1)
+    assert table._column == [4, 3]
+    assert get_rule("bland").choose(table) == [1, index_j]
+    assert np.argmin(table._bounded_ratios(index_j, table._row_upper())[0]) == 0
@@ -0,0 +1,111 @@
+import random
+from fractions import Fraction
+import pytest
+from dual_simplex import ResolveSession
+from generate import generate_task
+from problem import task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, solve
+
+SEEDS = range(6)
+
+
+def _task(seed, engine):
+    data = generate_task(5, 6, 0.8, 0.3, "optimal", "mixed", "max", seed)
+    number = Fraction if engine in EXACT_ENGINES else to_float
+    return number, task_to_matrix(data, number)
+
+
+# пересчет двойственным методом совпадает с решением измененной задачи с нуля
+def _same_as_cold(engine, session, status, basic_func, matrix, minmax, types):
+    cold = solve(basic_func, matrix, minmax, engine, types=types)
+    if cold["status"] == "unbounded":  # при допустимой строке F не бывает
+        pytest.fail("измененная задача неограничена")
+    assert status == cold["status"]
+    if status != "optimal":
+        return
+    _, objective = session.get_answer()
+    if engine in EXACT_ENGINES:
+        assert str(objective) == cold["objective"]
+    else:
+        assert objective == pytest.approx(cold["objective"], rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_set_rhs(engine, seed):
+    number, (basic_func, matrix, minmax, types) = _task(seed, engine)
+    session = ResolveSession.from_problem(basic_func, matrix, minmax, engine, types=types)
+    rng = random.Random(seed)
+    for _ in range(3):
+        row = rng.randrange(len(matrix))
+        matrix[row][-1] = number(rng.randint(-5, 5) + int(matrix[row][-1]))
+        status = session.set_rhs(row, matrix[row][-1])
+        _same_as_cold(engine, session, status, basic_func, matrix, minmax, types)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_add_constraint(engine, seed):
+    number, (basic_func, matrix, minmax, types) = _task(seed, engine)
+    session = ResolveSession.from_problem(basic_func, matrix, minmax, engine, types=types)
+    rng = random.Random(seed)
+    for constr_type in ("≤", "≥", "="):
+        x, _ = session.get_answer()
+        coeffs = [number(rng.randint(-3, 3)) for _ in basic_func]
+        # правая часть рядом со значением на текущем оптимуме: ограничение
+        # то отсекает его, то нет
+        value = sum(a * v for a, v in zip(coeffs, x))
+        rhs = number(round(value) + rng.randint(-3, 3))
+        status = session.add_constraint(coeffs, constr_type, rhs)
+        matrix.append(coeffs + [rhs])
+        types.append(constr_type)
+        _same_as_cold(engine, session, status, basic_func, matrix, minmax, types)
+        if status != "optimal":
+            break
+
+
+# правая часть строки, добавленной как ≥ (хранится умноженной на -1)
+def test_set_rhs_on_added_ge_row():
+    one, matrix = Fraction(1), [[Fraction(x) for x in (1, 0, 5)]]
+    session = ResolveSession.from_problem([one, one], matrix, "min", types=["≤"])
+    session.add_constraint([one, one], "≥", Fraction(2))
+    status = session.set_rhs(1, Fraction(3))
+    matrix.append([one, one, Fraction(3)])
+    _same_as_cold("fraction", session, status, [one, one], matrix, "min", ["≤", "≥"])
+    assert session.get_answer()[1] == 3
+
+
+# искусственная равенства, вышедшая из базиса при "infeasible", не мешает
+# следующим ограничениям
+def test_equality_cuts_after_infeasible():
+    session = ResolveSession.from_problem([0, -4], [[1, 1, 8]], "max", types=["≤"])
+    assert session.add_constraint([-1, -2], "=", 7) == "infeasible"
+    assert session.add_constraint([1, 3], "=", 5) == "infeasible"
+
+
+# цепочки изменений: несколько равенств подряд, ≥, новые b (в том числе
+# после "infeasible" и у добавленных строк); после каждого - сравнение с нуля
+@pytest.mark.parametrize("seed", range(30))
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_change_sequence(engine, seed):
+    rng = random.Random(seed)
+    data = generate_task(
+        rng.randint(2, 5), rng.randint(2, 5), 0.8, 0.3, "optimal", "mixed",
+        rng.choice(["min", "max"]), seed,
+    )
+    number = Fraction if engine in EXACT_ENGINES else to_float
+    basic_func, matrix, minmax, types = task_to_matrix(data, number)
+    session = ResolveSession.from_problem(basic_func, matrix, minmax, engine, types=types)
+    kinds = ["=", "=", "≥"] + [rng.choice(["≤", "≥", "=", "rhs"]) for _ in range(6)]
+    for kind in kinds:
+        if kind == "rhs":
+            row = rng.randrange(len(matrix))
+            matrix[row][-1] = number(rng.randint(-4, 12))
+            status = session.set_rhs(row, matrix[row][-1])
+        else:
+            coeffs = [number(rng.randint(-3, 3)) for _ in basic_func]
+            rhs = number(rng.randint(-4, 10))
+            status = session.add_constraint(coeffs, kind, rhs)
+            matrix.append(coeffs + [rhs])
+            types.append(kind)
+        _same_as_cold(engine, session, status, basic_func, matrix, minmax, types)
@@ -0,0 +1,106 @@
+from fractions import Fraction
+import pytest
+from generate import generate_task
+from problem import task_to_matrix, to_float
+from sensitivity import sensitivity
+from solver import EXACT_ENGINES, get_engine, run_simplex, solve
+
+ENGINES = ["fraction", "bareiss", "float"]
+SEEDS = range(8)
+
+
+def _task(engine, seed, minmax):
+    data = generate_task(4, 5, 0.8, 0.0, "optimal", "mixed", minmax, seed)
+    number = Fraction if engine in EXACT_ENGINES else to_float
+    return number, task_to_matrix(data, number)
+
+
+def _analysis(engine, basic_func, matrix, minmax, types):
+    table = get_engine(engine)(minmax, matrix, basic_func, None, types, None)
+    status, table, _, _ = run_simplex(table)
+    assert status == "optimal"
+    return sensitivity(table, matrix, types)
+
+
+# значение внутри интервала: половина пути до границы, без границы -
+# сдвиг на 1; None - интервал из одной точки
+def _inside(value, low, high):
+    if high is None:
+        return value + 1
+    if high > value:
+        return value + (high - value) / 2
+    if low is None:
+        return value - 1
+    if low < value:
+        return value - (value - low) / 2
+    return None
+
+
+def _close(got, want, engine):
+    if engine in EXACT_ENGINES:
+        assert Fraction(got) == want
+    else:
+        assert got == pytest.approx(float(want), rel=1e-7, abs=1e-7)
+
+
+# b_i внутри интервала: базис тот же, ц.ф. меняется на y_i * сдвиг
+@pytest.mark.parametrize("minmax", ["min", "max"])
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("engine", ENGINES)
+def test_rhs_ranges(engine, seed, minmax):
+    _, (basic_func, matrix, _, types) = _task(engine, seed, minmax)
+    result = _analysis(engine, basic_func, matrix, minmax, types)
+    for i, (y, (low, high)) in enumerate(
+        zip(result.shadow_prices, result.rhs_ranges)
+    ):
+        b = matrix[i][-1]
+        assert low is None or low <= b + 1e-9
+        assert high is None or high >= b - 1e-9
+        value = _inside(b, low, high)
+        if value is None:
+            continue
+        changed = [list(row) for row in matrix]
+        changed[i][-1] = value
+        cold = solve(basic_func, changed, minmax, engine, types=types)
+        assert cold["status"] == "optimal"
+        _close(cold["objective"], result.objective + y * (value - b), engine)
+
+
+# c_j внутри интервала: x* остается оптимальным
+@pytest.mark.parametrize("minmax", ["min", "max"])
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("engine", ENGINES)
+def test_cost_ranges(engine, seed, minmax):
+    _, (basic_func, matrix, _, types) = _task(engine, seed, minmax)
+    result = _analysis(engine, basic_func, matrix, minmax, types)
+    for j, (low, high) in enumerate(result.cost_ranges):
+        c = basic_func[j]
+        assert low is None or low <= c + 1e-9
+        assert high is None or high >= c - 1e-9
+        value = _inside(c, low, high)
+        if value is None:
+            continue
+        changed = list(basic_func)
+        changed[j] = value
+        cold = solve(changed, matrix, minmax, engine, types=types)
+        want = sum(a * x for a, x in zip(changed, result.answer))
+        _close(cold["objective"], want, engine)
+
+
+# у базисных переменных оценка 0, у остальных - знак по направлению ц.ф.
+@pytest.mark.parametrize("seed", SEEDS)
+def test_reduced_costs(seed):
+    _, (basic_func, matrix, _, types) = _task("fraction", seed, "max")
+    result = _analysis("fraction", basic_func, matrix, "max", types)
+    for x, d in zip(result.answer, result.reduced_costs):
+        if x != 0:
+            assert d == 0
+        else:
+            assert d <= 0
+
+
+def test_requires_optimal_table():
+    basic_func, matrix = [1, 1], [[1, 1, 2]]
+    table = get_engine("fraction")("max", matrix, basic_func, None, ["≤"], None)
+    with pytest.raises(ValueError):
+        sensitivity(table, matrix, ["≤"])
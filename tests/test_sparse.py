@@ -0,0 +1,98 @@
+import random
+import re
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from basis import to_basis
+from generate import generate_task
+from presolve import reduce_task
+from problem import task_to_matrix, to_float
+from solver import solve
+from sparse_table import SparseBasicTable
+
+
+def _task(seed, status="optimal"):
+    rng = random.Random(seed)
+    data = generate_task(
+        rng.randint(2, 7), rng.randint(2, 8), 0.5, 0.3, status, "mixed",
+        rng.choice(["min", "max"]), seed,
+    )
+    basic_func, matrix, minmax, types = task_to_matrix(data, to_float)
+    # одиночная строка и закрепленная переменная - чтобы упрощению было что делать
+    row = [0.0] * (len(basic_func) + 1)
+    row[rng.randrange(len(basic_func))], row[-1] = 1.0, float(rng.randint(0, 5))
+    matrix.append(row)
+    types = list(types) + ["≤"]
+    bounds = [(None, None)] * len(basic_func)
+    bounds[rng.randrange(len(basic_func))] = (1.0, 1.0)
+    return basic_func, matrix, minmax, types, bounds
+
+
+def _same(a, b):
+    assert a["status"] == b["status"]
+    if a["status"] == "optimal":
+        assert a["objective"] == pytest.approx(b["objective"], rel=1e-9, abs=1e-9)
+
+
+# упрощение CSR не переводит в плотную и дает тот же ответ, что и для
+# обычной матрицы
+@pytest.mark.parametrize("scale", [False, True])
+@pytest.mark.parametrize("seed", range(30))
+def test_presolve_keeps_csr(seed, scale):
+    basic_func, matrix, minmax, types, bounds = _task(
+        seed, ["optimal", "infeasible", "unbounded"][seed % 3]
+    )
+    csr = sp.csr_matrix(np.array(matrix))
+    reduced = reduce_task(basic_func, csr, minmax, bounds, scale, types)
+    if reduced.status == "reduced":
+        assert sp.issparse(reduced.matrix)
+    dense = solve(basic_func, matrix, minmax, "float", bounds=bounds, types=types)
+    result = solve(
+        basic_func, csr, minmax, "sparse", bounds=bounds, presolve=True, types=types
+    )
+    _same(result, dense)
+
+
+# заданный и crash-базис строятся по CSR; таблица остается разреженной
+@pytest.mark.parametrize("seed", range(30))
+def test_basis_keeps_csr(seed):
+    basic_func, matrix, minmax, types, _ = _task(seed)
+    csr = sp.csr_matrix(np.array(matrix))
+    width = len(basic_func) + sum(t != "=" for t in types)
+    rng = random.Random(seed)
+    for basis in ("crash", rng.sample(range(1, width + 1), len(matrix) // 2)):
+        try:
+            dense = solve(basic_func, matrix, minmax, "float", types=types, basis=basis)
+        except ValueError as error:
+            with pytest.raises(ValueError, match=re.escape(str(error))):
+                SparseBasicTable(minmax, csr, basic_func, None, types, basis)
+            continue
+        table = SparseBasicTable(minmax, csr, basic_func, None, types, basis)
+        assert sp.issparse(table.matrix)
+        _same(solve(basic_func, csr, minmax, "sparse", types=types, basis=basis), dense)
+
+
+# приведение к полному базису по CSR совпадает с плотным
+@pytest.mark.parametrize("seed", range(50))
+def test_sparse_to_basis_matches_dense(seed):
+    rng = np.random.default_rng(seed)
+    rows, cols = rng.integers(2, 7), rng.integers(7, 10)
+    matrix = rng.integers(-4, 5, (rows, cols + 1)) * (rng.random((rows, cols + 1)) < 0.6)
+    matrix = matrix.astype(float)
+    labels = [int(x) for x in rng.choice(np.arange(1, cols + 1), rows, replace=False)]
+    try:
+        dense, dense_rows = to_basis(matrix, labels)
+    except ValueError:
+        with pytest.raises(ValueError):
+            to_basis(sp.csr_matrix(matrix), labels)
+        return
+    reduced, sparse_rows = to_basis(sp.csr_matrix(matrix), labels)
+    assert sp.issparse(reduced)
+    reduced = reduced.toarray()
+    for rows_map, values in ((dense_rows, dense), (sparse_rows, reduced)):
+        for row, label in rows_map.items():
+            assert values[row, label - 1] == 1
+            assert np.count_nonzero(values[:, label - 1]) == 1
+    got = {label: reduced[row, -1] for row, label in sparse_rows.items()}
+    want = {label: dense[row, -1] for row, label in dense_rows.items()}
+    assert got == pytest.approx(want)
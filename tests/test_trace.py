@@ -0,0 +1,78 @@
+import json
+from fractions import Fraction
+import pytest
+import solver
+from generate import generate_task
+from problem import task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, solve
+from solver_trace import Trace
+
+
+def _task(engine, seed=1):
+    data = generate_task(5, 6, 0.8, 0.3, "optimal", "mixed", "max", seed)
+    number = Fraction if engine in EXACT_ENGINES else to_float
+    return task_to_matrix(data, number)
+
+
+# событие на каждый шаг, значение ц.ф. последнего - ответ; без
+# наблюдателя - те же шаги и тот же ответ
+@pytest.mark.parametrize("engine", sorted(set(ENGINES) - {"hybrid"}))
+def test_event_per_pivot(engine):
+    basic_func, matrix, minmax, types = _task(engine)
+    trace = Trace()
+    traced = solve(basic_func, matrix, minmax, engine, types=types, observer=trace)
+    plain = solve(basic_func, matrix, minmax, engine, types=types)
+    assert traced["pivots"] == plain["pivots"] == len(trace.events)
+    assert traced["x"] == plain["x"]
+    assert [e["iteration"] for e in trace.events] == list(
+        range(1, len(trace.events) + 1)
+    )
+    phases = [e["phase"] for e in trace.events]
+    assert phases == sorted(phases)  # "basic", затем "simplex"
+    last = trace.events[-1]
+    objective = traced["objective"]
+    if engine in EXACT_ENGINES:
+        assert last["objective"] == Fraction(objective)
+    else:
+        assert last["objective"] == pytest.approx(objective)
+    summary = trace.summary()
+    assert summary["pivots"] == len(trace.events)
+    assert summary["degenerate"] == sum(e["degenerate"] for e in trace.events)
+    if engine == "fraction":
+        assert summary["max_bits"] > 0
+
+
+# несколько решений - отдельные дорожки; JSONL и Chrome trace читаются
+def test_export(tmp_path):
+    trace = Trace()
+    for run in ("a", "b"):
+        basic_func, matrix, minmax, types = _task("fraction", ord(run))
+        trace.begin(run)
+        solve(basic_func, matrix, minmax, types=types, observer=trace)
+    assert trace.summary("a")["pivots"] + trace.summary("b")["pivots"] == len(
+        trace.events
+    )
+
+    trace.save(str(tmp_path / "steps.jsonl"))
+    lines = (tmp_path / "steps.jsonl").read_text(encoding="utf-8").splitlines()
+    events = [json.loads(line) for line in lines]
+    assert [e["run"] for e in events] == [e["run"] for e in trace.events]
+
+    trace.save(str(tmp_path / "steps.json"))
+    chrome = json.loads((tmp_path / "steps.json").read_text(encoding="utf-8"))
+    spans = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+    assert len(spans) == 3 * len(trace.events)
+    names = {e["args"]["name"] for e in chrome["traceEvents"] if e["ph"] == "M"}
+    assert names == {"a", "b"}
+
+
+# --trace в командной строке пишет файл и итог в вывод --json
+def test_cli_trace(tmp_path, capsys):
+    data = generate_task(4, 4, seed=2)
+    path = tmp_path / "task.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    out = tmp_path / "trace.jsonl"
+    assert solver.main([str(path), "--json", "--trace", str(out)]) == 0
+    result = json.loads(capsys.readouterr().out)
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert result["trace"]["pivots"] == result["pivots"] == len(lines)
@@ -0,0 +1,55 @@
+import random
+from fractions import Fraction
+import pytest
+from generate import check_result, generate_task
+from problem import add_slacks, task_to_matrix, to_float
+from solver import ENGINES, EXACT_ENGINES, get_engine, solve
+from solver_trace import Trace
+
+
+def _number(engine):
+    return Fraction if engine in EXACT_ENGINES else to_float
+
+
+# все ≤ с b >= 0: начальный базис из дополнительных переменных, метод
+# искусственного базиса не делает ни шага
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("engine", sorted(set(ENGINES) - {"hybrid"}))
+def test_slack_basis_skips_phase_one(engine, seed):
+    rng, number = random.Random(seed), _number(engine)
+    matrix = [[number(rng.randint(0, 9)) for _ in range(7)] for _ in range(5)]
+    basic_func = [number(rng.randint(1, 9)) for _ in range(6)]
+    types = ["≤"] * len(matrix)
+    trace = Trace()
+    result = solve(basic_func, matrix, "max", engine, types=types, observer=trace)
+    assert result["status"] == "optimal"
+    assert trace.events
+    assert all(event["phase"] == "simplex" for event in trace.events)
+
+
+# дополнительная переменная базисная, если подходит по знаку (≤ при
+# b >= 0, ≥ при b <= 0); остальным строкам - искусственные
+def test_initial_basis_labels():
+    matrix = [[1, 1, 4], [1, -1, -2], [2, 1, 3], [1, 3, -1]]
+    types = ["≤", "≤", "≥", "≥"]
+    table = get_engine("fraction")("max", matrix, [1, 1], None, types, None)
+    extended, slacks = add_slacks(matrix, types)
+    width = len(extended[0]) - 1
+    assert sorted(slacks) == [0, 1, 2, 3]
+    assert table._column[0] == slacks[0][0]
+    assert table._column[3] == slacks[3][0]
+    assert table._column[1] > width and table._column[2] > width
+
+
+# ≤, ≥ и = вместе дают тот же ответ, что и равенства с вручную
+# добавленными дополнительными переменными
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_same_as_manual_slacks(engine, seed):
+    data = generate_task(5, 5, 0.8, 0.3, "optimal", "mixed", "min", seed)
+    basic_func, matrix, minmax, types = task_to_matrix(data, _number(engine))
+    native = solve(basic_func, matrix, minmax, engine, types=types)
+    extended, slacks = add_slacks(matrix, types)
+    costs = list(basic_func) + [_number(engine)(0)] * len(slacks)
+    manual = solve(costs, extended, minmax, engine)
+    assert check_result(data, native) and check_result(data, manual)